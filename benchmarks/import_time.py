@@ -0,0 +1,72 @@
+"""
+Measures the import time of jstreams using `python -X importtime`.
+
+Each statement is executed in a fresh interpreter, several times. The import time
+reported is the sum of the self times of all the modules imported by the statement,
+excluding the modules that a bare interpreter imports at startup.
+
+Usage:
+    python benchmarks/import_time.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import jstreams",
+    "from jstreams import Stream",
+    "from jstreams import Opt, Try",
+    "from jstreams import injector",
+    "from jstreams import json_serializable",
+    "from jstreams import *",
+]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(statement: str) -> dict[str, int]:
+    """
+    Runs the statement in a new interpreter and parses the -X importtime output.
+
+    Returns:
+        dict[str, int]: The self import time in microseconds of each imported module
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        times[parts[2].strip()] = int(parts[0])
+    return times
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    startup_modules = set(import_times("pass"))
+    print(f"{'statement':40} {'best (ms)':>10} {'modules':>8} {'jstreams':>9}")
+    for statement in STATEMENTS:
+        best: int | None = None
+        modules: list[str] = []
+        for _ in range(runs):
+            times = import_times(statement)
+            modules = [name for name in times if name not in startup_modules]
+            total = sum(times[name] for name in modules)
+            best = total if best is None else min(best, total)
+        own = [name for name in modules if name.split(".")[0] == "jstreams"]
+        print(
+            f"{statement:40} {(best or 0) / 1000:10.2f} {len(modules):8} {len(own):9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Measures the throughput of Stream.filter with the built-in predicates.
+
+Each predicate filters the same values twice: from a list, so that it is tested
+in chunks through its batch form, and from an iterator over that list, which
+Stream.filter tests one value at a time. Each variant is timed over several runs
+and reported as values filtered per second, along with the speedup of the batched
+variant.
+
+Usage:
+    python benchmarks/predicates.py [values] [runs]
+"""
+
+import os
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from jstreams.predicate import (
+    contains,
+    equals,
+    is_between,
+    is_higher_than,
+    is_in,
+    is_none,
+    str_matches,
+)
+from jstreams.stream import Stream
+
+
+def predicates() -> dict[str, tuple[Callable[[Any], bool], Callable[[int], Any]]]:
+    # The predicate, and how to build the filtered value from an index
+    return {
+        "is_higher_than": (is_higher_than(500), lambda i: i % 1000),
+        "is_between": (is_between(100, 900), lambda i: i % 1000),
+        "equals": (equals(7), lambda i: i % 10),
+        "is_none": (is_none, lambda i: None if i % 3 else i),
+        "is_in": (is_in([1, 5, 9, 13, 17]), lambda i: i % 20),
+        "contains": (contains("7"), lambda i: str(i)),
+        "str_matches": (str_matches(r"^1\d+5$"), lambda i: str(i)),
+    }
+
+
+def best_time(operation: Callable[[], Any], runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    values = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print(f"{'predicate':16} {'batched/s':>14} {'per value/s':>14} {'speedup':>8}")
+    for name, (predicate, build) in predicates().items():
+        data = [build(i) for i in range(values)]
+        batched = best_time(lambda: Stream(data).filter(predicate).to_list(), runs)
+        single = best_time(
+            lambda: Stream(iter(data)).filter(predicate).to_list(), runs
+        )
+        print(
+            f"{name:16} {values / batched:14,.0f} {values / single:14,.0f} "
+            f"{single / batched:8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Measures the throughput and allocations of json_serializable classes.
+
+Builds wide graphs (many small records with nested lists and dicts) and deep graphs
+(long chains of nested objects) covering slots, aliases, custom serializers, Optional,
+Union, list and dict fields, enums, UUIDs and datetimes. Each operation is timed over
+several runs, and reported as serializable objects processed per second, along with
+the peak memory traced while running it once. Serialization is compared against
+`dataclasses.asdict` on an equivalent dataclass graph.
+
+Usage:
+    python benchmarks/serialization.py [records] [runs]
+"""
+
+import dataclasses
+import os
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Optional, Union
+from uuid import UUID, uuid4
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from jstreams.serialize import (
+    binary_deserialize_list,
+    binary_serialize_list,
+    json_deserialize_list,
+    json_serializable,
+    json_serialize_list,
+)
+
+DEEP_LEVELS = 50
+
+
+class Status(Enum):
+    ACTIVE = "active"
+    SUSPENDED = "suspended"
+
+
+@json_serializable()
+class Point:
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: float, y: float) -> None:
+        self.x = x
+        self.y = y
+
+
+@json_serializable(aliases={"street_name": "street"})
+class Address:
+    def __init__(self, street_name: str, city: str, location: Optional[Point]) -> None:
+        self.street_name = street_name
+        self.city = city
+        self.location = location
+
+
+@json_serializable(
+    translate_snake_to_camel=True,
+    custom_serializers={"score": lambda v: round(v, 2)},
+)
+class Account:
+    def __init__(
+        self,
+        account_id: UUID,
+        display_name: str,
+        status: Status,
+        created_at: datetime,
+        score: float,
+        tags: list[str],
+        addresses: list[Address],
+        limits: dict[str, int],
+        reference: Union[int, str],
+        manager: Optional["Account"] = None,
+    ) -> None:
+        self.account_id = account_id
+        self.display_name = display_name
+        self.status = status
+        self.created_at = created_at
+        self.score = score
+        self.tags = tags
+        self.addresses = addresses
+        self.limits = limits
+        self.reference = reference
+        self.manager = manager
+
+
+@dataclasses.dataclass
+class PointData:
+    x: float
+    y: float
+
+
+@dataclasses.dataclass
+class AddressData:
+    street_name: str
+    city: str
+    location: Optional[PointData]
+
+
+@dataclasses.dataclass
+class AccountData:
+    account_id: UUID
+    display_name: str
+    status: Status
+    created_at: datetime
+    score: float
+    tags: list[str]
+    addresses: list[AddressData]
+    limits: dict[str, int]
+    reference: Union[int, str]
+    manager: Optional["AccountData"] = None
+
+
+def build_account(index: int, manager: Optional[Account] = None) -> Account:
+    return Account(
+        uuid4(),
+        f"account {index}",
+        Status.ACTIVE if index % 3 else Status.SUSPENDED,
+        datetime(2024, 1, 1) + timedelta(minutes=index),
+        index / 7,
+        ["retail", f"region-{index % 5}"],
+        [
+            Address(f"{index} Main St", "Springfield", Point(index, -index)),
+            Address(f"{index} Side St", "Shelbyville", None),
+        ],
+        {"daily": 1000 + index, "monthly": 30000},
+        index if index % 2 else f"ref-{index}",
+        manager,
+    )
+
+
+def to_dataclass(account: Account) -> AccountData:
+    return AccountData(
+        account.account_id,
+        account.display_name,
+        account.status,
+        account.created_at,
+        account.score,
+        account.tags,
+        [
+            AddressData(
+                a.street_name,
+                a.city,
+                PointData(a.location.x, a.location.y) if a.location else None,
+            )
+            for a in account.addresses
+        ],
+        account.limits,
+        account.reference,
+        to_dataclass(account.manager) if account.manager else None,
+    )
+
+
+def wide_graph(records: int) -> list[Account]:
+    return [build_account(i) for i in range(records)]
+
+
+def deep_graph(records: int) -> list[Account]:
+    graph = []
+    for i in range(max(1, records // DEEP_LEVELS)):
+        account = None
+        for level in range(DEEP_LEVELS):
+            account = build_account(i * DEEP_LEVELS + level, account)
+        graph.append(account)
+    return graph  # type: ignore[return-value]
+
+
+def count_objects(account: Optional[Account]) -> int:
+    # The account, its addresses and their points
+    total = 0
+    while account is not None:
+        total += 1 + sum(2 if a.location else 1 for a in account.addresses)
+        account = account.manager
+    return total
+
+
+def measure(operation: Callable[[], Any], runs: int) -> tuple[float, int]:
+    """
+    Returns the best run time in seconds, and the peak traced memory in bytes.
+    """
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    operation()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak
+
+
+def operations(graph: list[Account]) -> dict[str, Callable[[], Any]]:
+    dicts = json_serialize_list(graph)
+    payload = binary_serialize_list(graph)
+    dataclass_graph = [to_dataclass(account) for account in graph]
+    return {
+        "to_dict": lambda: [account.to_dict() for account in graph],
+        "from_dict": lambda: [Account.from_dict(data) for data in dicts],
+        "json_serialize_list": lambda: json_serialize_list(graph),
+        "json_deserialize_list": lambda: json_deserialize_list(Account, dicts),
+        "binary_serialize_list": lambda: binary_serialize_list(graph),
+        "binary_deserialize_list": lambda: binary_deserialize_list(Account, payload),
+        "dataclasses.asdict": lambda: [
+            dataclasses.asdict(account) for account in dataclass_graph
+        ],
+    }
+
+
+def main() -> None:
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print(
+        f"{'graph':6} {'operation':24} {'objects/s':>12} "
+        f"{'best (ms)':>10} {'peak (KB)':>10}"
+    )
+    for name, graph in (("wide", wide_graph(records)), ("deep", deep_graph(records))):
+        objects = sum(count_objects(account) for account in graph)
+        for operation_name, operation in operations(graph).items():
+            best, peak = measure(operation, runs)
+            print(
+                f"{name:6} {operation_name:24} {objects / best:12,.0f} "
+                f"{best * 1000:10.2f} {peak / 1024:10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
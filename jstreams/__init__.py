@@ -1,403 +1,960 @@
-from jstreams.stream import Stream, Opt, stream, optional, pair_stream, nullable
-
-from jstreams.class_operations import ClassOps
-
-from jstreams.stream_operations import (
-    not_null_elements,
-    extract_list,
-    extract_non_null_list,
-    extract_list_strict,
-    extract_non_null_list_strict,
-)
-
-from jstreams.iterable_operations import (
-    find_first,
-    matching,
-    reduce,
-    find_last,
-)
-
-from jstreams.mapper import (
-    flat_map,
-    mapper_of,
-    mapper_with_of,
-    Mapper,
-    MapperWith,
-)
-
-from jstreams.iterables import (
-    map_it,
-    map_indexed,
-    filter_it,
-    cast_to,
-    chunked,
-    concat,
-    concat_of,
-    cycle,
-    repeat,
-    defer,
-    distinct,
-    drop_until,
-    drop_while,
-    take_until,
-    take_while,
-    limit,
-    skip,
-    group_adjacent,
-    windowed,
-    indexed,
-    scan,
-    pair_it,
-    pairwise,
-    sliding_window,
-    intersperse,
-    unfold,
-    zip_longest,
-)
-
-from jstreams.reducer import reducer_of, Reducer
-
-from jstreams.stream_factories import triplet_stream, tuple4_stream
-from jstreams.stream_predicates import any_of, all_of, none_of, all_none, all_not_none
-
-from jstreams.try_opt import (
-    Try,
-    ErrorLog,
-    try_,
-    try_of,
-    catch,
-    catch_with,
-    try_with_resource,
-    raises,
-)
-
-from jstreams.rx import (
-    ObservableSubscription,
-    Observable,
-    Flowable,
-    Single,
-    BehaviorSubject,
-    PublishSubject,
-    ReplaySubject,
-    CompletedHandler,
-    ErrorHandler,
-    DisposeHandler,
-    NextHandler,
-    Pipe,
-    Reduce,
-    Filter,
-    Map,
-    RxOperator,
-    BaseFilteringOperator,
-    BaseMappingOperator,
-    rx_distinct_until_changed,
-    rx_reduce,
-    rx_filter,
-    rx_map,
-    rx_take,
-    rx_take_while,
-    rx_take_until,
-    rx_drop_while,
-    rx_drop_until,
-    rx_drop,
-    rx_buffer,
-    rx_buffer_count,
-    rx_throttle,
-    TakeWhile,
-    TakeUntil,
-    Drop,
-    DropUntil,
-    DropWhile,
-    Take,
-    Buffer,
-    BufferCount,
-    Throttle,
-    DistinctUntilChanged,
-    RX,
-    Timestamped,
-    rx_defer,
-    rx_distinct,
-    rx_element_at,
-    rx_empty,
-    rx_ignore_all,
-    rx_map_to,
-    rx_never,
-    rx_of_type,
-    rx_range,
-    rx_scan,
-    rx_tap,
-    rx_throw,
-    rx_timestamp,
-    Distinct,
-    ElementAt,
-    IgnoreAll,
-    MapTo,
-    Scan,
-    Tap,
-    Ignore,
-    TimestampOperator,
-    rx_debounce,
-    Debounce,
-    rx_combine_latest,
-    rx_zip,
-    ChainBuilder,
-    DelayedBaseFilteringOperator,
-)
-
-from jstreams.thread import (
-    LoopingThread,
-    CallbackLoopingThread,
-    cancel_thread,
-    Cancellable,
-)
-
-from jstreams.timer import (
-    Timer,
-    Interval,
-    CountdownTimer,
-    set_timer,
-    set_interval,
-    clear,
-)
-
-from jstreams.ioc import (
-    injector,
-    AutoInit,
-    AutoStart,
-    inject,
-    inject_optional,
-    var,
-    InjectedDependency,
-    OptionalInjectedDependency,
-    resolve,
-    resolve_dependencies,
-    resolve_variables,
-    resolve_all,
-    component,
-    service,
-    Variable,
-    StrVariable,
-    IntVariable,
-    FloatVariable,
-    DictVariable,
-    SetVariable,
-    ListVariable,
-    Dependency,
-    InjectedVariable,
-    inject_args,
-    autowired,
-    autowired_optional,
-    provide,
-    provide_variable,
-    configuration,
-    return_wired,
-    return_wired_optional,
-    post_construct,
-    pre_destroy,
-)
-
-from jstreams.noop import (
-    NoOpCls,
-    noop,
-)
-
-from jstreams.utils import (
-    require_non_null,
-    is_number,
-    to_int,
-    to_float,
-    as_list,
-    keys_as_list,
-    is_mth_or_fn,
-    is_not_none,
-    is_empty_or_none,
-    each,
-    dict_update,
-    sort,
-    Value,
-    extract,
-    identity,
-    chunk,
-    flatten,
-    flatten_deep,
-    uniq,
-    key_by,
-    pick,
-    omit,
-    head,
-    tail,
-    tail_count,
-    last,
-    to_nullable,
-    repeat_value,
-    initial,
-    initial_count,
-)
-
-from jstreams.predicate import (
-    Predicate,
-    PredicateWith,
-    is_true,
-    is_false,
-    is_none,
-    is_in,
-    is_not_in,
-    equals,
-    is_blank,
-    default,
-    str_contains,
-    str_contains_ignore_case,
-    str_starts_with,
-    str_starts_with_ignore_case,
-    str_ends_with,
-    str_ends_with_ignore_case,
-    str_matches,
-    str_not_matches,
-    str_longer_than,
-    str_shorter_than,
-    str_longer_than_or_eq,
-    str_shorter_than_or_eq,
-    equals_ignore_case,
-    is_even,
-    is_odd,
-    is_positive,
-    is_negative,
-    is_zero,
-    is_int,
-    is_between,
-    is_between_closed,
-    is_between_closed_start,
-    is_between_closed_end,
-    not_,
-    not_strict,
-    not_equals,
-    is_not_blank,
-    is_higher_than,
-    is_higher_than_or_eq,
-    is_less_than,
-    is_less_than_or_eq,
-    has_key,
-    has_value,
-    is_in_interval,
-    is_in_open_interval,
-    is_key_in,
-    is_value_in,
-    contains,
-    is_truthy,
-    is_falsy,
-    is_identity,
-    has_length,
-    is_instance,
-    str_fullmatch,
-    str_is_alnum,
-    str_is_alpha,
-    str_is_digit,
-    str_is_lower,
-    str_is_space,
-    str_is_title,
-    str_is_upper,
-    predicate_of,
-    predicate_with_of,
-)
-
-from jstreams.match import (
-    Case,
-    Match,
-    DefaultCase,
-    case,
-    match,
-    match_opt,
-    default_case,
-)
-
-from jstreams.tuples import (
-    Pair,
-    pair,
-    Triplet,
-    triplet,
-    left_matches,
-    right_matches,
-    middle_matches,
-    pair_of,
-    triplet_of,
-    Tuple2,
-    Tuple3,
-    Tuple4,
-    val1_matches,
-    val2_matches,
-    val3_matches,
-    val4_matches,
-    tuple4,
-    tuple4_of,
-)
-
-from jstreams.collectors import (
-    grouping_by,
-    joining,
-    grouping_by_mapping,
-    Collectors,
-)
-
-from jstreams.func import (
-    get_number_of_arguments,
-    pipe,
-    partial,
-    curry,
-)
-
-from jstreams.state import (
-    default_state,
-    use_state,
-    use_async_state,
-    null_state,
-)
-
-from jstreams.scheduler import (
-    scheduler,
-    schedule_daily,
-    schedule_duration,
-    schedule_hourly,
-    schedule_periodic,
-    Duration,
-)
-
-from jstreams.eventing import (
-    events,
-    event,
-    on_event,
-    managed_events,
-    dispose_managed_events_from,
-    wait_for_event,  # Add wait_for_event to exports
-)
-
-from jstreams.annotations import (
-    builder,
-    getter,
-    setter,
-    locked,
-    synchronized_static,
-    synchronized,
-    all_args,
-    required_args,
-    validate_args,
-    default_on_error,
-    SynchronizedValue,
-)
-
-from jstreams.serialize import (
-    json_serializable,
-    json_deserialize,
-    json_serialize,
-    json_standard_serializable,
-    json_serialize_return,
-    json_deserialize_list,
-    json_serialize_return_list,
-)
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from jstreams.stream import Stream, Opt, stream, optional, pair_stream, nullable
+
+    from jstreams.async_stream import AsyncStream, async_stream
+
+    from jstreams.class_operations import ClassOps
+
+    from jstreams.stream_operations import (
+        not_null_elements,
+        extract_list,
+        extract_non_null_list,
+        extract_list_strict,
+        extract_non_null_list_strict,
+    )
+
+    from jstreams.iterable_operations import (
+        find_first,
+        matching,
+        reduce,
+        find_last,
+    )
+
+    from jstreams.mapper import (
+        flat_map,
+        mapper_of,
+        mapper_with_of,
+        Mapper,
+        MapperWith,
+    )
+
+    from jstreams.iterables import (
+        map_it,
+        map_indexed,
+        filter_it,
+        cast_to,
+        chunked,
+        concat,
+        concat_of,
+        cycle,
+        repeat,
+        defer,
+        distinct,
+        drop_until,
+        drop_while,
+        take_until,
+        take_while,
+        limit,
+        skip,
+        group_adjacent,
+        windowed,
+        indexed,
+        scan,
+        pair_it,
+        pairwise,
+        sliding_window,
+        intersperse,
+        unfold,
+        zip_longest,
+    )
+
+    from jstreams.reducer import reducer_of, Reducer
+
+    from jstreams.stream_factories import triplet_stream, tuple4_stream
+    from jstreams.stream_predicates import any_of, all_of, none_of, all_none, all_not_none
+
+    from jstreams.try_opt import (
+        Try,
+        AsyncTry,
+        Backoff,
+        ErrorLog,
+        try_,
+        try_async,
+        try_of,
+        catch,
+        catch_with,
+        try_with_resource,
+        raises,
+    )
+
+    from jstreams.resilience import (
+        CircuitBreaker,
+        CircuitState,
+        Bulkhead,
+        CallNotPermittedError,
+        CircuitBreakerOpenError,
+        BulkheadFullError,
+        circuit_breaker,
+        circuit_breakers,
+        bulkhead,
+    )
+
+    from jstreams.rx import (
+        ObservableSubscription,
+        Observable,
+        Flowable,
+        Single,
+        BehaviorSubject,
+        PublishSubject,
+        ReplaySubject,
+        CompletedHandler,
+        ErrorHandler,
+        DisposeHandler,
+        NextHandler,
+        Pipe,
+        Reduce,
+        Filter,
+        Map,
+        RxOperator,
+        BaseFilteringOperator,
+        BaseMappingOperator,
+        rx_distinct_until_changed,
+        rx_reduce,
+        rx_filter,
+        rx_map,
+        rx_take,
+        rx_take_while,
+        rx_take_until,
+        rx_drop_while,
+        rx_drop_until,
+        rx_drop,
+        rx_buffer,
+        rx_buffer_count,
+        rx_throttle,
+        TakeWhile,
+        TakeUntil,
+        Drop,
+        DropUntil,
+        DropWhile,
+        Take,
+        Buffer,
+        BufferCount,
+        Throttle,
+        DistinctUntilChanged,
+        RX,
+        Timestamped,
+        rx_defer,
+        rx_distinct,
+        rx_element_at,
+        rx_empty,
+        rx_ignore_all,
+        rx_map_to,
+        rx_never,
+        rx_of_type,
+        rx_range,
+        rx_scan,
+        rx_tap,
+        rx_throw,
+        rx_timestamp,
+        Distinct,
+        ElementAt,
+        IgnoreAll,
+        MapTo,
+        Scan,
+        Tap,
+        Ignore,
+        TimestampOperator,
+        rx_debounce,
+        Debounce,
+        rx_combine_latest,
+        rx_zip,
+        ChainBuilder,
+        DelayedBaseFilteringOperator,
+    )
+
+    from jstreams.thread import (
+        LoopingThread,
+        CallbackLoopingThread,
+        cancel_thread,
+        Cancellable,
+    )
+
+    from jstreams.timer import (
+        Timer,
+        Interval,
+        CountdownTimer,
+        set_timer,
+        set_interval,
+        clear,
+    )
+
+    from jstreams.ioc import (
+        injector,
+        AutoInit,
+        AutoStart,
+        inject,
+        inject_optional,
+        var,
+        InjectedDependency,
+        OptionalInjectedDependency,
+        resolve,
+        resolve_dependencies,
+        resolve_variables,
+        resolve_all,
+        component,
+        service,
+        Variable,
+        StrVariable,
+        IntVariable,
+        FloatVariable,
+        DictVariable,
+        SetVariable,
+        ListVariable,
+        Dependency,
+        InjectedVariable,
+        inject_args,
+        autowired,
+        autowired_optional,
+        provide,
+        provide_variable,
+        configuration,
+        return_wired,
+        return_wired_optional,
+        post_construct,
+        pre_destroy,
+        Scope,
+        request_scope,
+    )
+
+    from jstreams.noop import (
+        NoOpCls,
+        noop,
+    )
+
+    from jstreams.utils import (
+        require_non_null,
+        is_number,
+        to_int,
+        to_float,
+        as_list,
+        keys_as_list,
+        is_mth_or_fn,
+        is_not_none,
+        is_empty_or_none,
+        each,
+        dict_update,
+        sort,
+        Value,
+        extract,
+        identity,
+        chunk,
+        flatten,
+        flatten_deep,
+        uniq,
+        key_by,
+        pick,
+        omit,
+        head,
+        tail,
+        tail_count,
+        last,
+        to_nullable,
+        repeat_value,
+        initial,
+        initial_count,
+    )
+
+    from jstreams.predicate import (
+        Predicate,
+        PredicateWith,
+        is_true,
+        is_false,
+        is_none,
+        is_in,
+        is_not_in,
+        equals,
+        is_blank,
+        default,
+        str_contains,
+        str_contains_ignore_case,
+        str_starts_with,
+        str_starts_with_ignore_case,
+        str_ends_with,
+        str_ends_with_ignore_case,
+        str_matches,
+        str_not_matches,
+        str_longer_than,
+        str_shorter_than,
+        str_longer_than_or_eq,
+        str_shorter_than_or_eq,
+        equals_ignore_case,
+        is_even,
+        is_odd,
+        is_positive,
+        is_negative,
+        is_zero,
+        is_int,
+        is_between,
+        is_between_closed,
+        is_between_closed_start,
+        is_between_closed_end,
+        not_,
+        not_strict,
+        not_equals,
+        is_not_blank,
+        is_higher_than,
+        is_higher_than_or_eq,
+        is_less_than,
+        is_less_than_or_eq,
+        has_key,
+        has_value,
+        is_in_interval,
+        is_in_open_interval,
+        is_key_in,
+        is_value_in,
+        contains,
+        is_truthy,
+        is_falsy,
+        is_identity,
+        has_length,
+        is_instance,
+        str_fullmatch,
+        str_is_alnum,
+        str_is_alpha,
+        str_is_digit,
+        str_is_lower,
+        str_is_space,
+        str_is_title,
+        str_is_upper,
+        predicate_of,
+        predicate_with_of,
+        always_true,
+        always_false,
+        compile_predicate,
+        apply_many,
+        batch_function,
+    )
+
+    from jstreams.match import (
+        Case,
+        Match,
+        Matcher,
+        DefaultCase,
+        case,
+        match,
+        matcher,
+        match_opt,
+        default_case,
+    )
+
+    from jstreams.tuples import (
+        Pair,
+        pair,
+        Triplet,
+        triplet,
+        left_matches,
+        right_matches,
+        middle_matches,
+        pair_of,
+        triplet_of,
+        Tuple2,
+        Tuple3,
+        Tuple4,
+        val1_matches,
+        val2_matches,
+        val3_matches,
+        val4_matches,
+        tuple4,
+        tuple4_of,
+    )
+
+    from jstreams.collectors import (
+        grouping_by,
+        joining,
+        grouping_by_mapping,
+        Collectors,
+    )
+
+    from jstreams.func import (
+        get_number_of_arguments,
+        pipe,
+        partial,
+        curry,
+    )
+
+    from jstreams.state import (
+        default_state,
+        use_state,
+        use_async_state,
+        null_state,
+        compare_and_set_state,
+        update_state,
+        use_computed,
+    )
+
+    from jstreams.scheduler import (
+        scheduler,
+        schedule_daily,
+        schedule_duration,
+        schedule_hourly,
+        schedule_periodic,
+        Duration,
+    )
+
+    from jstreams.eventing import (
+        events,
+        event,
+        on_event,
+        managed_events,
+        dispose_managed_events_from,
+        wait_for_event,  # Add wait_for_event to exports
+    )
+
+    from jstreams.annotations import (
+        builder,
+        getter,
+        setter,
+        locked,
+        read_locked,
+        write_locked,
+        ReadWriteLock,
+        LockStats,
+        enable_lock_profiling,
+        is_lock_profiling_enabled,
+        lock_stats,
+        reset_lock_stats,
+        format_lock_stats,
+        dump_lock_stats_every,
+        synchronized_static,
+        synchronized,
+        all_args,
+        required_args,
+        validate_args,
+        set_args_validation,
+        is_args_validation_enabled,
+        default_on_error,
+        cached,
+        memoize,
+        CacheStats,
+        SynchronizedValue,
+    )
+
+    from jstreams.serialize import (
+        json_serializable,
+        json_deserialize,
+        json_serialize,
+        json_standard_serializable,
+        json_serialize_return,
+        json_deserialize_list,
+        json_serialize_return_list,
+        json_serialize_iter,
+        json_deserialize_iter,
+        json_deserialize_stream,
+        binary_serialize,
+        binary_serialize_list,
+        binary_deserialize,
+        binary_deserialize_list,
+    )
+
+# The names exported by each submodule. Submodules are imported on first access
+# of one of their names, so importing jstreams only loads what is actually used.
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    "jstreams.stream": (
+        "Stream",
+        "Opt",
+        "stream",
+        "optional",
+        "pair_stream",
+        "nullable",
+    ),
+    "jstreams.async_stream": ("AsyncStream", "async_stream"),
+    "jstreams.class_operations": ("ClassOps",),
+    "jstreams.stream_operations": (
+        "not_null_elements",
+        "extract_list",
+        "extract_non_null_list",
+        "extract_list_strict",
+        "extract_non_null_list_strict",
+    ),
+    "jstreams.iterable_operations": (
+        "find_first",
+        "matching",
+        "reduce",
+        "find_last",
+    ),
+    "jstreams.mapper": (
+        "flat_map",
+        "mapper_of",
+        "mapper_with_of",
+        "Mapper",
+        "MapperWith",
+    ),
+    "jstreams.iterables": (
+        "map_it",
+        "map_indexed",
+        "filter_it",
+        "cast_to",
+        "chunked",
+        "concat",
+        "concat_of",
+        "cycle",
+        "repeat",
+        "defer",
+        "distinct",
+        "drop_until",
+        "drop_while",
+        "take_until",
+        "take_while",
+        "limit",
+        "skip",
+        "group_adjacent",
+        "windowed",
+        "indexed",
+        "scan",
+        "pair_it",
+        "pairwise",
+        "sliding_window",
+        "intersperse",
+        "unfold",
+        "zip_longest",
+    ),
+    "jstreams.reducer": (
+        "reducer_of",
+        "Reducer",
+    ),
+    "jstreams.stream_factories": (
+        "triplet_stream",
+        "tuple4_stream",
+    ),
+    "jstreams.stream_predicates": (
+        "any_of",
+        "all_of",
+        "none_of",
+        "all_none",
+        "all_not_none",
+    ),
+    "jstreams.try_opt": (
+        "Try",
+        "AsyncTry",
+        "Backoff",
+        "ErrorLog",
+        "try_",
+        "try_async",
+        "try_of",
+        "catch",
+        "catch_with",
+        "try_with_resource",
+        "raises",
+    ),
+    "jstreams.resilience": (
+        "CircuitBreaker",
+        "CircuitState",
+        "Bulkhead",
+        "CallNotPermittedError",
+        "CircuitBreakerOpenError",
+        "BulkheadFullError",
+        "circuit_breaker",
+        "circuit_breakers",
+        "bulkhead",
+    ),
+    "jstreams.rx": (
+        "ObservableSubscription",
+        "Observable",
+        "Flowable",
+        "Single",
+        "BehaviorSubject",
+        "PublishSubject",
+        "ReplaySubject",
+        "CompletedHandler",
+        "ErrorHandler",
+        "DisposeHandler",
+        "NextHandler",
+        "Pipe",
+        "Reduce",
+        "Filter",
+        "Map",
+        "RxOperator",
+        "BaseFilteringOperator",
+        "BaseMappingOperator",
+        "rx_distinct_until_changed",
+        "rx_reduce",
+        "rx_filter",
+        "rx_map",
+        "rx_take",
+        "rx_take_while",
+        "rx_take_until",
+        "rx_drop_while",
+        "rx_drop_until",
+        "rx_drop",
+        "rx_buffer",
+        "rx_buffer_count",
+        "rx_throttle",
+        "TakeWhile",
+        "TakeUntil",
+        "Drop",
+        "DropUntil",
+        "DropWhile",
+        "Take",
+        "Buffer",
+        "BufferCount",
+        "Throttle",
+        "DistinctUntilChanged",
+        "RX",
+        "Timestamped",
+        "rx_defer",
+        "rx_distinct",
+        "rx_element_at",
+        "rx_empty",
+        "rx_ignore_all",
+        "rx_map_to",
+        "rx_never",
+        "rx_of_type",
+        "rx_range",
+        "rx_scan",
+        "rx_tap",
+        "rx_throw",
+        "rx_timestamp",
+        "Distinct",
+        "ElementAt",
+        "IgnoreAll",
+        "MapTo",
+        "Scan",
+        "Tap",
+        "Ignore",
+        "TimestampOperator",
+        "rx_debounce",
+        "Debounce",
+        "rx_combine_latest",
+        "rx_zip",
+        "ChainBuilder",
+        "DelayedBaseFilteringOperator",
+    ),
+    "jstreams.thread": (
+        "LoopingThread",
+        "CallbackLoopingThread",
+        "cancel_thread",
+        "Cancellable",
+    ),
+    "jstreams.timer": (
+        "Timer",
+        "Interval",
+        "CountdownTimer",
+        "set_timer",
+        "set_interval",
+        "clear",
+    ),
+    "jstreams.ioc": (
+        "injector",
+        "AutoInit",
+        "AutoStart",
+        "inject",
+        "inject_optional",
+        "var",
+        "InjectedDependency",
+        "OptionalInjectedDependency",
+        "resolve",
+        "resolve_dependencies",
+        "resolve_variables",
+        "resolve_all",
+        "component",
+        "service",
+        "Variable",
+        "StrVariable",
+        "IntVariable",
+        "FloatVariable",
+        "DictVariable",
+        "SetVariable",
+        "ListVariable",
+        "Dependency",
+        "InjectedVariable",
+        "inject_args",
+        "autowired",
+        "autowired_optional",
+        "provide",
+        "provide_variable",
+        "configuration",
+        "return_wired",
+        "return_wired_optional",
+        "post_construct",
+        "pre_destroy",
+        "Scope",
+        "request_scope",
+    ),
+    "jstreams.noop": (
+        "NoOpCls",
+        "noop",
+    ),
+    "jstreams.utils": (
+        "require_non_null",
+        "is_number",
+        "to_int",
+        "to_float",
+        "as_list",
+        "keys_as_list",
+        "is_mth_or_fn",
+        "is_not_none",
+        "is_empty_or_none",
+        "each",
+        "dict_update",
+        "sort",
+        "Value",
+        "extract",
+        "identity",
+        "chunk",
+        "flatten",
+        "flatten_deep",
+        "uniq",
+        "key_by",
+        "pick",
+        "omit",
+        "head",
+        "tail",
+        "tail_count",
+        "last",
+        "to_nullable",
+        "repeat_value",
+        "initial",
+        "initial_count",
+    ),
+    "jstreams.predicate": (
+        "Predicate",
+        "PredicateWith",
+        "is_true",
+        "is_false",
+        "is_none",
+        "is_in",
+        "is_not_in",
+        "equals",
+        "is_blank",
+        "default",
+        "str_contains",
+        "str_contains_ignore_case",
+        "str_starts_with",
+        "str_starts_with_ignore_case",
+        "str_ends_with",
+        "str_ends_with_ignore_case",
+        "str_matches",
+        "str_not_matches",
+        "str_longer_than",
+        "str_shorter_than",
+        "str_longer_than_or_eq",
+        "str_shorter_than_or_eq",
+        "equals_ignore_case",
+        "is_even",
+        "is_odd",
+        "is_positive",
+        "is_negative",
+        "is_zero",
+        "is_int",
+        "is_between",
+        "is_between_closed",
+        "is_between_closed_start",
+        "is_between_closed_end",
+        "not_",
+        "not_strict",
+        "not_equals",
+        "is_not_blank",
+        "is_higher_than",
+        "is_higher_than_or_eq",
+        "is_less_than",
+        "is_less_than_or_eq",
+        "has_key",
+        "has_value",
+        "is_in_interval",
+        "is_in_open_interval",
+        "is_key_in",
+        "is_value_in",
+        "contains",
+        "is_truthy",
+        "is_falsy",
+        "is_identity",
+        "has_length",
+        "is_instance",
+        "str_fullmatch",
+        "str_is_alnum",
+        "str_is_alpha",
+        "str_is_digit",
+        "str_is_lower",
+        "str_is_space",
+        "str_is_title",
+        "str_is_upper",
+        "predicate_of",
+        "predicate_with_of",
+        "always_true",
+        "always_false",
+        "compile_predicate",
+        "apply_many",
+        "batch_function",
+    ),
+    "jstreams.match": (
+        "Case",
+        "Match",
+        "Matcher",
+        "DefaultCase",
+        "case",
+        "match",
+        "matcher",
+        "match_opt",
+        "default_case",
+    ),
+    "jstreams.tuples": (
+        "Pair",
+        "pair",
+        "Triplet",
+        "triplet",
+        "left_matches",
+        "right_matches",
+        "middle_matches",
+        "pair_of",
+        "triplet_of",
+        "Tuple2",
+        "Tuple3",
+        "Tuple4",
+        "val1_matches",
+        "val2_matches",
+        "val3_matches",
+        "val4_matches",
+        "tuple4",
+        "tuple4_of",
+    ),
+    "jstreams.collectors": (
+        "grouping_by",
+        "joining",
+        "grouping_by_mapping",
+        "Collectors",
+    ),
+    "jstreams.func": (
+        "get_number_of_arguments",
+        "pipe",
+        "partial",
+        "curry",
+    ),
+    "jstreams.state": (
+        "default_state",
+        "use_state",
+        "use_async_state",
+        "null_state",
+        "compare_and_set_state",
+        "update_state",
+        "use_computed",
+    ),
+    "jstreams.scheduler": (
+        "scheduler",
+        "schedule_daily",
+        "schedule_duration",
+        "schedule_hourly",
+        "schedule_periodic",
+        "Duration",
+    ),
+    "jstreams.eventing": (
+        "events",
+        "event",
+        "on_event",
+        "managed_events",
+        "dispose_managed_events_from",
+        "wait_for_event",
+    ),
+    "jstreams.annotations": (
+        "builder",
+        "getter",
+        "setter",
+        "locked",
+        "read_locked",
+        "write_locked",
+        "ReadWriteLock",
+        "LockStats",
+        "enable_lock_profiling",
+        "is_lock_profiling_enabled",
+        "lock_stats",
+        "reset_lock_stats",
+        "format_lock_stats",
+        "dump_lock_stats_every",
+        "synchronized_static",
+        "synchronized",
+        "all_args",
+        "required_args",
+        "validate_args",
+        "set_args_validation",
+        "is_args_validation_enabled",
+        "default_on_error",
+        "cached",
+        "memoize",
+        "CacheStats",
+        "SynchronizedValue",
+    ),
+    "jstreams.serialize": (
+        "json_serializable",
+        "json_deserialize",
+        "json_serialize",
+        "json_standard_serializable",
+        "json_serialize_return",
+        "json_deserialize_list",
+        "json_serialize_return_list",
+        "json_serialize_iter",
+        "json_deserialize_iter",
+        "json_deserialize_stream",
+        "binary_serialize",
+        "binary_serialize_list",
+        "binary_deserialize",
+        "binary_deserialize_list",
+    ),
+}
+
+_LAZY_IMPORTS: dict[str, str] = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
+
+
+def _load(name: str) -> Any:
+    # __import__ rather than importlib.import_module, so that lazily loaded
+    # submodules are still reported by python -X importtime
+    return getattr(__import__(_LAZY_IMPORTS[name], fromlist=(name,)), name)
+
+
+def _is_submodule(name: str) -> bool:
+    return not name.startswith("_") and (
+        importlib.util.find_spec(f"{__name__}.{name}") is not None
+    )
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        # Submodules are still reachable as attributes after a plain import jstreams,
+        # importing them binds them in the package
+        if _is_submodule(name):
+            return importlib.import_module(f"{__name__}.{name}")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = _load(name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+def _exported_over_submodule(name: str) -> property:
+    def getter(_: ModuleType) -> Any:
+        return _load(name)
+
+    def setter(_: ModuleType, __: Any) -> None:
+        # The import system binds submodules as attributes of the package
+        # when they are imported. The exported function takes precedence.
+        pass
+
+    return property(getter, setter)
+
+
+class _LazyModule(ModuleType):
+    pass
+
+
+# Some exported functions have the same name as the submodule defining them
+for _name in ("async_stream", "match", "scheduler", "stream"):
+    setattr(_LazyModule, _name, _exported_over_submodule(_name))
+sys.modules[__name__].__class__ = _LazyModule
 
 __all__ = [
     "each",
     "dict_update",
     "Stream",
+    "AsyncStream",
     "find_first",
     "map_it",
     "matching",
@@ -410,9 +967,21 @@ __all__ = [
     "Opt",
     "ClassOps",
     "stream",
+    "async_stream",
     "optional",
     "Try",
+    "AsyncTry",
+    "Backoff",
     "ErrorLog",
+    "CircuitBreaker",
+    "CircuitState",
+    "Bulkhead",
+    "CallNotPermittedError",
+    "CircuitBreakerOpenError",
+    "BulkheadFullError",
+    "circuit_breaker",
+    "circuit_breakers",
+    "bulkhead",
     "ObservableSubscription",
     "Observable",
     "Flowable",
@@ -493,9 +1062,11 @@ __all__ = [
     "is_mth_or_fn",
     "Case",
     "Match",
+    "Matcher",
     "DefaultCase",
     "case",
     "match",
+    "matcher",
     "match_opt",
     "default_case",
     "is_higher_than",
@@ -507,6 +1078,11 @@ __all__ = [
     "none_of",
     "predicate_of",
     "predicate_with_of",
+    "always_true",
+    "always_false",
+    "compile_predicate",
+    "apply_many",
+    "batch_function",
     "mapper_of",
     "mapper_with_of",
     "Predicate",
@@ -568,6 +1144,9 @@ __all__ = [
     "default_state",
     "use_state",
     "use_async_state",
+    "compare_and_set_state",
+    "update_state",
+    "use_computed",
     "null_state",
     "extract_list",
     "extract_non_null_list",
@@ -583,6 +1162,7 @@ __all__ = [
     "return_wired",
     "return_wired_optional",
     "try_",
+    "try_async",
     "try_of",
     "scheduler",
     "schedule_daily",
@@ -607,12 +1187,27 @@ __all__ = [
     "getter",
     "setter",
     "locked",
+    "read_locked",
+    "write_locked",
+    "ReadWriteLock",
+    "LockStats",
+    "enable_lock_profiling",
+    "is_lock_profiling_enabled",
+    "lock_stats",
+    "reset_lock_stats",
+    "format_lock_stats",
+    "dump_lock_stats_every",
     "synchronized_static",
     "synchronized",
     "all_args",
     "required_args",
     "validate_args",
+    "set_args_validation",
+    "is_args_validation_enabled",
     "default_on_error",
+    "cached",
+    "memoize",
+    "CacheStats",
     "is_truthy",
     "is_falsy",
     "is_identity",
@@ -653,7 +1248,13 @@ __all__ = [
     "json_serialize_return",
     "json_serialize_return_list",
     "json_deserialize_list",
-    "json_serialize_return_list",
+    "json_serialize_iter",
+    "json_deserialize_iter",
+    "json_deserialize_stream",
+    "binary_serialize",
+    "binary_serialize_list",
+    "binary_deserialize",
+    "binary_deserialize_list",
     "chunk",
     "flatten",
     "flatten_deep",
@@ -736,4 +1337,6 @@ __all__ = [
     "tuple4_of",
     "post_construct",
     "pre_destroy",
+    "Scope",
+    "request_scope",
 ]
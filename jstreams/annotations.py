@@ -1,10 +1,19 @@
 from __future__ import annotations
+import asyncio
+import collections.abc
 import inspect
-from threading import Lock, RLock
+import keyword
+import logging
+from collections import OrderedDict
+from itertools import islice
+from threading import Condition, Event, Lock, RLock, get_ident
+from time import monotonic, perf_counter
 from types import UnionType
 from typing import (
     Any,
     Callable,
+    Hashable,
+    Iterable,
     TypeVar,
     Union,
     cast,
@@ -14,16 +23,47 @@ from typing import (
 )
 
 from jstreams.predicate import Predicate
+from jstreams.thread import Cancellable
+from jstreams.timer import Interval
 from jstreams.utils import TypeValidationError, Value
 
 NoneType = type(None)
 T = TypeVar("T")
 
 
+def _is_plain_attribute(name: str) -> bool:
+    # Attributes are accessed directly, unless their name cannot be written in source code
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+def _generate_method(
+    owner: type, method_name: str, params: str, body: list[str]
+) -> Callable[..., Any]:
+    """
+    Generates a function from its source code, named as a method of the given class.
+    Unlike closures, generated methods read their field names as constants.
+    """
+    namespace: dict[str, Any] = {}
+    source = f"def method({params}):\n    " + "\n    ".join(body)
+    exec(source, {}, namespace)  # pylint: disable=exec-used
+    method = namespace["method"]
+    method.__name__ = method_name
+    method.__qualname__ = f"{owner.__qualname__}.{method_name}"
+    method.__module__ = owner.__module__
+    return cast(Callable[..., Any], method)
+
+
+def _public_fields(type_hints: dict[str, Any]) -> list[str]:
+    return [name for name in type_hints if not name.startswith("_")]
+
+
 def builder() -> Callable[[type[T]], type[T]]:
     """
     A decorator that adds builder methods to a class.
 
+    The `with_<field>` methods of the builder are generated when the class is decorated,
+    one for each public type hinted field.
+
     Args:
         cls: The class to decorate.
 
@@ -40,6 +80,8 @@ def builder() -> Callable[[type[T]], type[T]]:
             cls_type_hints = {}
 
         class Builder:
+            __slots__ = ("_instance", "_fields")
+
             def __init__(self) -> None:
                 self._instance = cls.__new__(cls)
                 self._fields: dict[str, Any] = {}
@@ -56,25 +98,28 @@ def builder() -> Callable[[type[T]], type[T]]:
                 return self._instance
 
             def __getattr__(self, name: str) -> Callable[[Any], Builder]:
-                if name.startswith("with_"):
-                    field_name = name[5:]
-                    if field_name.startswith("_"):
-                        raise AttributeError(
-                            f"'{cls.__name__}.{type(self).__name__}' cannot access private field '{field_name}'"
-                        )
-                    # Use cached type hints for much better performance.
-                    if field_name in cls_type_hints:
-
-                        def setter_mth(value: Any) -> "Builder":
-                            self._fields[field_name] = value
-                            return self
-
-                        return setter_mth
-
+                # Only reached for the fields without a generated method
+                if name.startswith("with_") and name[5:].startswith("_"):
+                    raise AttributeError(
+                        f"'{cls.__name__}.{type(self).__name__}' cannot access private field '{name[5:]}'"
+                    )
                 raise AttributeError(
                     f"'{cls.__name__}.{type(self).__name__}' object has no attribute '{name}'"
                 )
 
+        Builder.__qualname__ = f"{cls.__qualname__}.Builder"
+        for field_name in _public_fields(cls_type_hints):
+            setattr(
+                Builder,
+                f"with_{field_name}",
+                _generate_method(
+                    Builder,
+                    f"with_{field_name}",
+                    "self, value",
+                    [f"self._fields[{field_name!r}] = value", "return self"],
+                ),
+            )
+
         def get_builder() -> Builder:
             return Builder()
 
@@ -96,13 +141,22 @@ def getter() -> Callable[[type[T]], type[T]]:
     """
 
     def decorator(cls: type[T]) -> type[T]:
-        for field_name, _ in get_type_hints(cls).items():
-            if not field_name.startswith("_"):
-
-                def getter_method(self: Any, name: str = field_name) -> Any:
-                    return getattr(self, name)
-
-                setattr(cls, f"get_{field_name}", getter_method)
+        for field_name in _public_fields(get_type_hints(cls)):
+            method_name = f"get_{field_name}"
+            setattr(
+                cls,
+                method_name,
+                _generate_method(
+                    cls,
+                    method_name,
+                    "self",
+                    [
+                        f"return self.{field_name}"
+                        if _is_plain_attribute(field_name)
+                        else f"return getattr(self, {field_name!r})"
+                    ],
+                ),
+            )
 
         return cls
 
@@ -121,22 +175,31 @@ def setter() -> Callable[[type[T]], type[T]]:
     """
 
     def decorator(cls: type[T]) -> type[T]:
-        for field_name, _ in get_type_hints(cls).items():
-            if not field_name.startswith("_"):
-
-                def setter_method(
-                    self: Any, value: Any, name: str = field_name
-                ) -> None:
-                    setattr(self, name, value)
-
-                setattr(cls, f"set_{field_name}", setter_method)
+        for field_name in _public_fields(get_type_hints(cls)):
+            method_name = f"set_{field_name}"
+            setattr(
+                cls,
+                method_name,
+                _generate_method(
+                    cls,
+                    method_name,
+                    "self, value",
+                    [
+                        f"self.{field_name} = value"
+                        if _is_plain_attribute(field_name)
+                        else f"setattr(self, {field_name!r}, value)"
+                    ],
+                ),
+            )
 
         return cls
 
     return decorator
 
 
-def locked() -> Callable[[type[T]], type[T]]:
+def locked(
+    mode: str = "exclusive", read_methods: Iterable[str] | None = None
+) -> Callable[[type[T]], type[T]]:
     """
     A class decorator that makes instances of the decorated class thread-safe.
 
@@ -144,12 +207,25 @@ def locked() -> Callable[[type[T]], type[T]]:
     method calls with a threading.RLock to ensure that only one thread
     can access or modify the instance's state at a time.
 
+    With mode="rw", a ReadWriteLock is used instead: attribute reads and the methods
+    listed in `read_methods` run concurrently under the read lock, while attribute
+    writes, deletions and all other methods run under the exclusive write lock.
+
     Args:
-        cls: The class to decorate.
+        mode (str, optional): "exclusive" or "rw". Defaults to "exclusive".
+        read_methods (Iterable[str] | None, optional): The methods that only read the
+            instance state, used in "rw" mode. Defaults to None.
+
+    Raises:
+        ValueError: If the mode is not supported.
 
     Returns:
         The wrapped, thread-safe class.
     """
+    if mode not in ("exclusive", "rw"):
+        raise ValueError(f"Unsupported lock mode {mode}")
+    rw = mode == "rw"
+    reader_names = frozenset(read_methods or ())
 
     def decorator(cls: type[T]) -> type[T]:
         # Store original methods needed for the wrapper
@@ -174,12 +250,20 @@ def locked() -> Callable[[type[T]], type[T]]:
                 """
                 # Crucial: Initialize lock *before* creating the original instance
                 # Use object.__setattr__ to avoid triggering our wrapped __setattr__
-                object.__setattr__(self, "_lock", RLock())
+                lock: Any = ReadWriteLock() if rw else RLock()
+                object.__setattr__(self, "_lock", lock)
+                # Lock used for attribute reads, and for writes
+                object.__setattr__(
+                    self, "_read_lock", lock.read_lock if rw else lock
+                )
+                object.__setattr__(
+                    self, "_write_lock", lock.write_lock if rw else lock
+                )
                 object.__setattr__(self, "_original_instance", cls.__new__(cls))
                 object.__setattr__(self, "_method_cache", {})
 
                 # Call original __init__ under lock protection
-                with self._lock:
+                with self._write_lock:
                     try:
                         original_init(self._original_instance, *args, **kwargs)
                     except Exception as e:
@@ -193,7 +277,7 @@ def locked() -> Callable[[type[T]], type[T]]:
                 If the attribute is a method, it returns a wrapped method that also
                 acquires the lock before execution.
                 """
-                with self._lock:
+                with self._read_lock:
                     # Check cache first to avoid re-creating the wrapper
                     if name in self._method_cache:
                         return self._method_cache[name]
@@ -209,12 +293,19 @@ def locked() -> Callable[[type[T]], type[T]]:
                             is self._original_instance
                         ):
 
+                            method_lock = (
+                                self._read_lock
+                                if name in reader_names
+                                else self._write_lock
+                            )
+
                             def wrapped_method(*args: Any, **kwargs: Any) -> Any:
                                 # Method execution also needs the lock
-                                with self._lock:
+                                with method_lock:
                                     return value(*args, **kwargs)
 
-                            # Cache the wrapped method for future accesses
+                            # Cache the wrapped method for future accesses. Concurrent
+                            # readers may both create it, keeping the last one.
                             self._method_cache[name] = wrapped_method
                             return wrapped_method
                         # If it's a regular attribute or a non-bound method/function, return directly
@@ -232,11 +323,17 @@ def locked() -> Callable[[type[T]], type[T]]:
             def __setattr__(self, name: str, value: Any) -> None:
                 """Sets an attribute on the original instance, acquiring the lock."""
                 # Use object.__setattr__ for the wrapper's own attributes
-                if name in ("_lock", "_original_instance", "_method_cache"):
+                if name in (
+                    "_lock",
+                    "_read_lock",
+                    "_write_lock",
+                    "_original_instance",
+                    "_method_cache",
+                ):
                     object.__setattr__(self, name, value)
                 else:
                     # Set attribute on the original instance under lock protection
-                    with self._lock:
+                    with self._write_lock:
                         # Invalidate method cache if an attribute with the same name is being set
                         if name in self._method_cache:
                             del self._method_cache[name]
@@ -245,7 +342,7 @@ def locked() -> Callable[[type[T]], type[T]]:
 
             def __delattr__(self, name: str) -> None:
                 """Deletes an attribute from the original instance, acquiring the lock."""
-                with self._lock:
+                with self._write_lock:
                     # Invalidate method cache if an attribute with the same name is being deleted
                     if name in self._method_cache:
                         del self._method_cache[name]
@@ -256,11 +353,11 @@ def locked() -> Callable[[type[T]], type[T]]:
             # You might want to explicitly delegate other special methods if needed,
             # although __getattr__ will handle many cases if they are called.
             def __str__(self) -> str:
-                with self._lock:
+                with self._read_lock:
                     return str(self._original_instance)
 
             def __repr__(self) -> str:
-                with self._lock:
+                with self._read_lock:
                     # Indicate that it's a wrapped instance
                     return f"ThreadSafeWrapper({repr(self._original_instance)})"
 
@@ -284,9 +381,190 @@ def locked() -> Callable[[type[T]], type[T]]:
 
 # Type variable for the decorated function, bound to Callable
 F = TypeVar("F", bound=Callable[..., Any])
+# Type variable for the locks created on instances
+L = TypeVar("L")
 
 # --- Lock Management ---
 
+# --- Lock Profiling ---
+
+
+class LockStats:
+    """
+    Contention statistics of a lock, recorded while lock profiling is enabled.
+    Times are expressed in seconds.
+    """
+
+    __slots__ = (
+        "name",
+        "acquisitions",
+        "contentions",
+        "total_wait",
+        "max_wait",
+        "total_hold",
+        "max_hold",
+    )
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        # Number of times the lock was acquired
+        self.acquisitions = 0
+        # Number of acquisitions that had to wait for another thread
+        self.contentions = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_hold = 0.0
+        self.max_hold = 0.0
+
+    def average_wait(self) -> float:
+        return self.total_wait / self.acquisitions if self.acquisitions else 0.0
+
+    def average_hold(self) -> float:
+        return self.total_hold / self.acquisitions if self.acquisitions else 0.0
+
+    def copy(self) -> LockStats:
+        stats = LockStats(self.name)
+        for attr in LockStats.__slots__:
+            setattr(stats, attr, getattr(self, attr))
+        return stats
+
+    def __repr__(self) -> str:
+        return (
+            f"LockStats({self.name}: acquisitions={self.acquisitions}, "
+            f"contentions={self.contentions}, "
+            f"wait avg={self.average_wait() * 1000:.3f}ms max={self.max_wait * 1000:.3f}ms, "
+            f"hold avg={self.average_hold() * 1000:.3f}ms max={self.max_hold * 1000:.3f}ms)"
+        )
+
+
+_lock_profiling = False
+_lock_stats: dict[str, LockStats] = {}
+_lock_stats_lock = Lock()
+
+
+def enable_lock_profiling(enabled: bool = True) -> None:
+    """
+    Enables or disables the recording of wait and hold times for the locks used by
+    @synchronized_static, @synchronized, @read_locked and @write_locked. Profiling is
+    disabled by default, in which case the decorators do not measure anything.
+
+    Args:
+        enabled (bool, optional): True to record lock statistics. Defaults to True.
+    """
+    global _lock_profiling  # pylint: disable=global-statement
+    _lock_profiling = enabled
+
+
+def is_lock_profiling_enabled() -> bool:
+    return _lock_profiling
+
+
+def lock_stats() -> dict[str, LockStats]:
+    """
+    Returns a snapshot of the statistics recorded since profiling was enabled, by lock
+    name. Static locks are named after their lock name, while instance locks are
+    aggregated per class and lock attribute (e.g. "Registry._default_instance_sync_lock").
+    Read-write locks report their read and write sides separately, suffixed with
+    ":read" and ":write".
+
+    Returns:
+        dict[str, LockStats]: The statistics of each lock
+    """
+    with _lock_stats_lock:
+        return {name: stats.copy() for name, stats in _lock_stats.items()}
+
+
+def reset_lock_stats() -> None:
+    """
+    Clears the recorded lock statistics.
+    """
+    with _lock_stats_lock:
+        _lock_stats.clear()
+
+
+def format_lock_stats(stats: dict[str, LockStats] | None = None) -> str:
+    """
+    Formats lock statistics as a table, sorted by total wait time, most contended first.
+
+    Args:
+        stats (dict[str, LockStats] | None, optional): The statistics to format.
+            Defaults to None, formatting the current `lock_stats()`.
+
+    Returns:
+        str: The formatted statistics
+    """
+    if stats is None:
+        stats = lock_stats()
+    lines = [
+        f"{'lock':40} {'acquired':>9} {'contended':>9} {'wait avg/max (ms)':>20} "
+        f"{'hold avg/max (ms)':>20}"
+    ]
+    for entry in sorted(stats.values(), key=lambda e: e.total_wait, reverse=True):
+        wait = f"{entry.average_wait() * 1000:.3f}/{entry.max_wait * 1000:.3f}"
+        hold = f"{entry.average_hold() * 1000:.3f}/{entry.max_hold * 1000:.3f}"
+        lines.append(
+            f"{entry.name:40} {entry.acquisitions:9} {entry.contentions:9} "
+            f"{wait:>20} {hold:>20}"
+        )
+    return "\n".join(lines)
+
+
+def dump_lock_stats_every(
+    interval: float, sink: Callable[[str], Any] | None = None
+) -> Cancellable:
+    """
+    Periodically writes the formatted lock statistics, enabling lock profiling.
+    Cancel the returned interval to stop the dumps.
+
+    Args:
+        interval (float): The number of seconds between dumps
+        sink (Callable[[str], Any] | None, optional): Receives the formatted statistics.
+            Defaults to None, logging them with the "locks" logger.
+
+    Returns:
+        Cancellable: The running interval
+    """
+    target = sink or logging.getLogger("locks").info
+    enable_lock_profiling()
+    dumper = Interval(interval, lambda: target(format_lock_stats()))
+    # Dumps must not keep the application running
+    dumper.daemon = True
+    dumper.start()
+    return dumper
+
+
+def _call_profiled(
+    lock: Any,
+    name: str,
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> Any:
+    start = perf_counter()
+    contended = not lock.acquire(blocking=False)
+    if contended:
+        lock.acquire()
+    acquired = perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        released = perf_counter()
+        lock.release()
+        wait = acquired - start
+        hold = released - acquired
+        with _lock_stats_lock:
+            stats = _lock_stats.get(name)
+            if stats is None:
+                stats = _lock_stats[name] = LockStats(name)
+            stats.acquisitions += 1
+            if contended:
+                stats.contentions += 1
+            stats.total_wait += wait
+            stats.max_wait = max(stats.max_wait, wait)
+            stats.total_hold += hold
+            stats.max_hold = max(stats.max_hold, hold)
+
+
 # --- Synchronized Decorator ---
 
 # Global registry for named locks (maps lock name string to RLock)
@@ -372,6 +650,8 @@ def synchronized_static(lock_name: str | None = None) -> Callable[[F], F]:
             The replacement function that acquires the lock, executes the original
             function, and ensures the lock is released.
             """
+            if _lock_profiling:
+                return _call_profiled(lock, actual_lock_name, func, args, kwargs)
             # The 'with' statement elegantly handles lock acquisition and release,
             # even if the original function raises an exception.
             with lock:
@@ -402,6 +682,37 @@ _instance_lock_creation_lock = Lock()
 DEFAULT_INSTANCE_LOCK_ATTR = "_default_instance_sync_lock"
 
 
+def _get_or_create_instance_lock(
+    instance: Any, attr_name: str, factory: Callable[[], L]
+) -> L:
+    """
+    Retrieves the lock stored in the given instance attribute, or creates it using the
+    factory if the instance has no such attribute yet.
+    """
+    # Try to get the instance-specific lock attribute
+    lock: L | None = getattr(instance, attr_name, None)
+
+    # Lazy, thread-safe lock creation if it doesn't exist on the instance yet
+    if lock is None:
+        # Acquire global lock *only* for the creation phase
+        with _instance_lock_creation_lock:
+            # Double-check if another thread created it while waiting for the lock
+            lock = getattr(instance, attr_name, None)
+            if lock is None:
+                # Create a new lock for this instance and this lock name
+                lock = factory()
+                try:
+                    # Store the lock on the instance using the determined attribute name
+                    setattr(instance, attr_name, lock)
+                except AttributeError as e:
+                    # Handle cases where attribute setting might fail (e.g., __slots__)
+                    raise TypeValidationError(
+                        f"Could not set lock attribute '{attr_name}' on instance of {type(instance).__name__}. "
+                        f"Does the class use __slots__ without including '{attr_name}'?"
+                    ) from e
+    return lock
+
+
 def synchronized(
     lock_attribute_name: str | None = None,
 ) -> Callable[[F], F]:
@@ -462,30 +773,19 @@ def synchronized(
             # A more robust check might involve inspect.isclass(type(instance)),
             # but let's rely on convention for 'self' being the first arg.
 
-            # 2. Try to get the instance-specific lock attribute
-            lock: RLock | None = getattr(instance, attr_name, None)
+            # 2. Get the instance-specific lock attribute, creating it lazily
+            lock: RLock = _get_or_create_instance_lock(instance, attr_name, RLock)
 
-            # 3. Lazy, thread-safe lock creation if it doesn't exist on the instance yet
-            if lock is None:
-                # Acquire global lock *only* for the creation phase
-                with _instance_lock_creation_lock:
-                    # Double-check if another thread created it while waiting for the lock
-                    lock = getattr(instance, attr_name, None)
-                    if lock is None:
-                        # Create a new RLock for this instance and this lock name
-                        lock = RLock()
-                        try:
-                            # Store the lock on the instance using the determined attribute name
-                            setattr(instance, attr_name, lock)
-                        except AttributeError as e:
-                            # Handle cases where attribute setting might fail (e.g., __slots__)
-                            raise TypeValidationError(
-                                f"Could not set lock attribute '{attr_name}' on instance of {type(instance).__name__}. "
-                                f"Does the class use __slots__ without including '{attr_name}'?"
-                            ) from e
-
-            # 4. Execute original function under the instance lock
+            # 3. Execute original function under the instance lock
             # 'lock' is now guaranteed to be a valid RLock for this instance
+            if _lock_profiling:
+                return _call_profiled(
+                    lock,
+                    f"{type(instance).__qualname__}.{attr_name}",
+                    func,
+                    args,
+                    kwargs,
+                )
             with lock:
                 result = func(*args, **kwargs)
             return result
@@ -498,6 +798,220 @@ def synchronized(
     return decorator
 
 
+class _LockSide:
+    """
+    One side (read or write) of a ReadWriteLock, usable as a context manager.
+    """
+
+    __slots__ = ("acquire", "release")
+
+    def __init__(
+        self, acquire: Callable[..., bool], release: Callable[[], None]
+    ) -> None:
+        self.acquire = acquire
+        self.release = release
+
+    def __enter__(self) -> None:
+        self.acquire()
+
+    def __exit__(self, *args: Any) -> None:
+        self.release()
+
+
+class ReadWriteLock:
+    """
+    A reader-writer lock. Any number of threads can hold the read lock at the same time,
+    while the write lock is exclusive. Waiting writers take precedence over new readers,
+    so a steady flow of readers cannot starve them.
+
+    Both sides are reentrant, and a thread holding the write lock can also acquire the
+    read lock. A thread holding only the read lock cannot acquire the write lock, since
+    two threads upgrading at the same time would wait for each other forever.
+
+    Example:
+        lock = ReadWriteLock()
+        with lock.read_lock:
+            ...  # Shared access
+        with lock.write_lock:
+            ...  # Exclusive access
+    """
+
+    __slots__ = (
+        "__condition",
+        "__readers",
+        "__writer",
+        "__writes",
+        "__waiting_writers",
+        "read_lock",
+        "write_lock",
+    )
+
+    def __init__(self) -> None:
+        self.__condition = Condition(Lock())
+        # Read lock holders, with their acquisition count
+        self.__readers: dict[int, int] = {}
+        self.__writer: int | None = None
+        self.__writes = 0
+        self.__waiting_writers = 0
+        self.read_lock = _LockSide(self.acquire_read, self.release_read)
+        self.write_lock = _LockSide(self.acquire_write, self.release_write)
+
+    def acquire_read(self, blocking: bool = True) -> bool:
+        thread = get_ident()
+        with self.__condition:
+            if self.__writer == thread or thread in self.__readers:
+                # Reentrant acquisitions must not wait for the queued writers
+                self.__readers[thread] = self.__readers.get(thread, 0) + 1
+                return True
+            while self.__writer is not None or self.__waiting_writers:
+                if not blocking:
+                    return False
+                self.__condition.wait()
+            self.__readers[thread] = 1
+            return True
+
+    def release_read(self) -> None:
+        thread = get_ident()
+        with self.__condition:
+            count = self.__readers.get(thread)
+            if count is None:
+                raise RuntimeError("Cannot release an un-acquired read lock")
+            if count > 1:
+                self.__readers[thread] = count - 1
+                return
+            del self.__readers[thread]
+            if not self.__readers:
+                self.__condition.notify_all()
+
+    def acquire_write(self, blocking: bool = True) -> bool:
+        thread = get_ident()
+        with self.__condition:
+            if self.__writer == thread:
+                self.__writes += 1
+                return True
+            if thread in self.__readers:
+                raise RuntimeError(
+                    "Cannot acquire the write lock while holding the read lock"
+                )
+            if not blocking and (self.__writer is not None or self.__readers):
+                return False
+            self.__waiting_writers += 1
+            try:
+                while self.__writer is not None or self.__readers:
+                    self.__condition.wait()
+            finally:
+                self.__waiting_writers -= 1
+                if self.__writer is not None or self.__readers:
+                    # Interrupted while waiting, the blocked readers may proceed
+                    self.__condition.notify_all()
+            self.__writer = thread
+            self.__writes = 1
+            return True
+
+    def release_write(self) -> None:
+        with self.__condition:
+            if self.__writer != get_ident():
+                raise RuntimeError("Cannot release an un-acquired write lock")
+            self.__writes -= 1
+            if self.__writes == 0:
+                self.__writer = None
+                self.__condition.notify_all()
+
+
+# Default attribute name of the instance locks used by @read_locked and @write_locked
+DEFAULT_INSTANCE_RW_LOCK_ATTR = "_default_instance_rw_lock"
+
+
+def _rw_locked(lock_attribute_name: str | None, write: bool) -> Callable[[F], F]:
+    attr_name = (
+        lock_attribute_name
+        if lock_attribute_name is not None
+        else DEFAULT_INSTANCE_RW_LOCK_ATTR
+    )
+    side_name = "write" if write else "read"
+    decorator_name = f"{side_name}_locked"
+
+    def decorator(func: F) -> F:
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not args:
+                raise TypeValidationError(
+                    f"@{decorator_name} requires 'self' (instance) argument. "
+                    f"Decorator applied to '{func.__qualname__}' which seems to be a non-method function or static/class method."
+                )
+            lock = _get_or_create_instance_lock(args[0], attr_name, ReadWriteLock)
+            if not isinstance(lock, ReadWriteLock):
+                raise TypeValidationError(
+                    f"Lock attribute '{attr_name}' of {type(args[0]).__name__} is not a ReadWriteLock"
+                )
+            side = lock.write_lock if write else lock.read_lock
+            if _lock_profiling:
+                return _call_profiled(
+                    side,
+                    f"{type(args[0]).__qualname__}.{attr_name}:{side_name}",
+                    func,
+                    args,
+                    kwargs,
+                )
+            with side:
+                return func(*args, **kwargs)
+
+        setattr(wrapper, "_instance_synchronized_lock_attr", attr_name)
+        wrapper.__name__ = func.__name__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__module__ = func.__module__
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def read_locked(lock_attribute_name: str | None = None) -> Callable[[F], F]:
+    """
+    Decorator allowing concurrent calls of an instance method, as long as no method
+    decorated with @write_locked runs on the same instance. Both decorators share the
+    ReadWriteLock stored in the given instance attribute, created on first use.
+
+    Use it for the methods of read-heavy objects that do not modify their state, where
+    @synchronized would make the readers wait for each other.
+
+    Example:
+        class Registry:
+            def __init__(self) -> None:
+                self.entries: dict[str, Any] = {}
+
+            @read_locked()
+            def find(self, key: str) -> Any:
+                return self.entries.get(key)
+
+            @write_locked()
+            def register(self, key: str, value: Any) -> None:
+                self.entries[key] = value
+
+    Args:
+        lock_attribute_name (str | None, optional): The instance attribute holding the lock.
+            Defaults to None, using `_default_instance_rw_lock`.
+
+    Returns:
+        Callable[[F], F]: A decorator acquiring the read lock around the method.
+    """
+    return _rw_locked(lock_attribute_name, False)
+
+
+def write_locked(lock_attribute_name: str | None = None) -> Callable[[F], F]:
+    """
+    Decorator giving an instance method exclusive access to the instance, waiting for the
+    methods decorated with @read_locked or @write_locked on the same instance to finish.
+    See `read_locked`.
+
+    Args:
+        lock_attribute_name (str | None, optional): The instance attribute holding the lock.
+            Defaults to None, using `_default_instance_rw_lock`.
+
+    Returns:
+        Callable[[F], F]: A decorator acquiring the write lock around the method.
+    """
+    return _rw_locked(lock_attribute_name, True)
+
+
 def _args(require_all: bool) -> Callable[[type[T]], type[T]]:
     """
     A decorator that adds a static method called 'required' to a class.
@@ -599,8 +1113,208 @@ def all_args() -> Callable[[type[T]], type[T]]:
     return _args(True)
 
 
+# Global switch for the checks performed by @validate_args
+_args_validation_enabled = True
+# Number of elements checked per container by @validate_args(deep="sample")
+_DEEP_SAMPLE_SIZE = 10
+_DEEP_MODES = (None, "sample", "full")
+_SEQUENCE_ORIGINS = (
+    list,
+    set,
+    frozenset,
+    collections.abc.Sequence,
+    collections.abc.MutableSequence,
+    collections.abc.Set,
+    collections.abc.MutableSet,
+)
+_MAPPING_ORIGINS = (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+
+
+def set_args_validation(enabled: bool) -> None:
+    """
+    Globally enables or disables the checks performed by @validate_args.
+    When disabled, validated functions are called directly, without binding or
+    checking their arguments, which removes the validation cost from hot paths.
+
+    Args:
+        enabled (bool): True to validate arguments, False to skip validation
+    """
+    global _args_validation_enabled  # pylint: disable=global-statement
+    _args_validation_enabled = enabled
+
+
+def is_args_validation_enabled() -> bool:
+    """
+    Returns True if @validate_args currently checks arguments.
+    """
+    return _args_validation_enabled
+
+
+def _isinstance_target(type_hint: Any) -> Any:
+    # The class to check values against, or None if the hint cannot be used with isinstance
+    target = get_origin(type_hint) or type_hint
+    return target if inspect.isclass(target) else None
+
+
+def _compile_type_checker(
+    expected_type: Any, deep: str | None
+) -> Callable[[Any], bool] | None:
+    """
+    Compiles a type hint into a function checking if a value matches it, or None when
+    any value matches.
+    """
+    if expected_type is Any:
+        return None
+
+    origin = get_origin(expected_type)
+    args_types = get_args(expected_type)
+
+    # Handles Union and Optional (Optional[T] is Union[T, NoneType])
+    if origin is Union or origin is UnionType:
+        none_allowed = NoneType in args_types
+        members = [arg for arg in args_types if arg is not NoneType]
+        if any(member is Any for member in members):
+            # Any value matches, and Any cannot be used with isinstance
+            return None
+        targets = tuple(
+            target for target in map(_isinstance_target, members) if target is not None
+        )
+        member_checkers = [
+            checker
+            for checker in (_compile_type_checker(member, deep) for member in members)
+            if checker is not None
+        ]
+        if deep is None or len(member_checkers) < len(members):
+            # A member without a deep check (such as Any) accepts any instance of the targets
+            def check_union(value: Any) -> bool:
+                return (value is None and none_allowed) or isinstance(value, targets)
+
+            return check_union
+
+        def check_union_deep(value: Any) -> bool:
+            if value is None:
+                return none_allowed
+            return any(checker(value) for checker in member_checkers)
+
+        return check_union_deep
+
+    target = _isinstance_target(expected_type)
+    if target is None:
+        # Hints such as TypeVars or Literal are not checked
+        return None
+
+    if deep is not None and args_types:
+        element_checker = _compile_container_checker(target, args_types, deep)
+        if element_checker is not None:
+            return element_checker
+
+    def check_instance(value: Any) -> bool:
+        return isinstance(value, target)
+
+    return check_instance
+
+
+def _compile_container_checker(
+    target: type, args_types: tuple[Any, ...], deep: str
+) -> Callable[[Any], bool] | None:
+    limit = _DEEP_SAMPLE_SIZE if deep == "sample" else None
+
+    if target is tuple:
+        if len(args_types) == 2 and args_types[1] is Ellipsis:
+            item_checker = _compile_type_checker(args_types[0], deep)
+        else:
+            # Fixed size tuple, each position has its own type
+            position_checkers = [
+                _compile_type_checker(arg, deep) for arg in args_types
+            ]
+
+            def check_fixed_tuple(value: Any) -> bool:
+                return (
+                    isinstance(value, tuple)
+                    and len(value) == len(position_checkers)
+                    and all(
+                        checker is None or checker(item)
+                        for checker, item in zip(position_checkers, value)
+                    )
+                )
+
+            return check_fixed_tuple
+    elif issubclass(target, _MAPPING_ORIGINS) and len(args_types) == 2:
+        key_checker = _compile_type_checker(args_types[0], deep)
+        value_checker = _compile_type_checker(args_types[1], deep)
+
+        def check_mapping(value: Any) -> bool:
+            if not isinstance(value, target):
+                return False
+            return all(
+                (key_checker is None or key_checker(k))
+                and (value_checker is None or value_checker(v))
+                for k, v in islice(value.items(), limit)
+            )
+
+        return check_mapping
+    elif issubclass(target, _SEQUENCE_ORIGINS) and len(args_types) == 1:
+        item_checker = _compile_type_checker(args_types[0], deep)
+    else:
+        # Iterators, generators and other generics are not consumed
+        return None
+
+    def check_items(value: Any) -> bool:
+        if not isinstance(value, target):
+            return False
+        return item_checker is None or all(
+            item_checker(item) for item in islice(value, limit)
+        )
+
+    return check_items
+
+
+def _compile_validator(
+    qualname: str,
+    param_name: str,
+    expected_type: Any,
+    rule: Predicate[Any] | None,
+    deep: str | None,
+) -> Callable[[Any], None] | None:
+    """
+    Compiles the validation of one parameter into a function raising TypeValidationError
+    for invalid values, or None when the parameter is not validated.
+    """
+    checker = _compile_type_checker(expected_type, deep)
+    if checker is None and rule is None:
+        return None
+
+    def validate(value: Any) -> None:
+        is_valid = checker is None or checker(value)
+
+        # Check predicates, if available
+        if rule is not None and not rule(value):
+            raise TypeValidationError(
+                f"Argument '{param_name}' for {qualname} does not match the given predicate"
+            )
+
+        if not is_valid:
+            raise TypeValidationError(
+                f"Argument '{param_name}' for {qualname} "
+                f"expected type {expected_type}, but got {type(value).__name__}."
+            )
+
+    return validate
+
+
+def _each_value(
+    validate: Callable[[Any], None], named: bool
+) -> Callable[[Any], None]:
+    def validate_each(values: Any) -> None:
+        for value in values.values() if named else values:
+            validate(value)
+
+    return validate_each
+
+
 def validate_args(
     rules: dict[str, Predicate[Any]] | None = None,
+    deep: str | None = None,
 ) -> Callable[[F], F]:
     """
     Decorator to validate function arguments against their type hints at runtime.
@@ -611,7 +1325,12 @@ def validate_args(
 
     Supports basic types, `typing.Optional`, and `typing.Union`.
     Skips validation for parameters without type hints or hinted with `typing.Any`.
-    Does not perform deep validation of collection contents (e.g., list[int]).
+    By default, only the container type is checked for collections (e.g. list for list[int]).
+    With deep="full", the elements of lists, sets, tuples and dicts are checked as well,
+    and with deep="sample", only the first 10 elements of each container are checked.
+
+    The checks are compiled once per parameter when the function is decorated. They can
+    be turned off globally using `set_args_validation(False)`.
 
     Example:
         @validate_args()
@@ -623,9 +1342,18 @@ def validate_args(
         process_data("Charlie", "twenty") # Raises TypeError (age should be int or None)
         process_data(123, 40)           # Raises TypeError (name should be str)
 
+    Args:
+        rules (dict[str, Predicate[Any]] | None, optional): Predicates the arguments must match, by parameter name. Defaults to None.
+        deep (str | None, optional): None, "sample" or "full", the validation mode of collection elements. Defaults to None.
+
+    Raises:
+        ValueError: If the deep validation mode is not supported.
+
     Returns:
         Callable[[F], F]: A decorator function.
     """
+    if deep not in _DEEP_MODES:
+        raise ValueError(f"Unsupported deep validation mode {deep}")
 
     def decorator(func: F) -> F:
         sig = inspect.signature(func)
@@ -639,7 +1367,65 @@ def validate_args(
             # For simplicity, we'll skip validation if hints can't be resolved.
             type_hints = {}
 
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
+        params = list(sig.parameters.values())
+        validators: dict[str, Callable[[Any], None] | None] = {
+            param.name: _compile_validator(
+                func.__qualname__,
+                param.name,
+                type_hints.get(param.name, Any),
+                (rules or {}).get(param.name),
+                deep,
+            )
+            for param in params
+        }
+        # The hints of *args and **kwargs apply to each of the collected values
+        for param in params:
+            validate = validators[param.name]
+            if validate is None:
+                continue
+            if param.kind is param.VAR_POSITIONAL:
+                validators[param.name] = _each_value(validate, False)
+            elif param.kind is param.VAR_KEYWORD:
+                validators[param.name] = _each_value(validate, True)
+
+        # The fast path checks the arguments as passed, without binding them, for
+        # signatures made of regular and keyword-only parameters
+        fast = all(
+            param.kind in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY)
+            for param in params
+        )
+        positional_names = [
+            param.name for param in params if param.kind is param.POSITIONAL_OR_KEYWORD
+        ]
+        positional_validators = [validators[name] for name in positional_names]
+        max_positional = len(positional_names)
+        positions = {
+            name: index for index, name in enumerate(positional_names)
+        }
+        # Keyword-only parameters can never be passed positionally
+        no_position = len(params)
+        required = [
+            (positions.get(param.name, no_position), param.name)
+            for param in params
+            if param.default is param.empty
+        ]
+        # Defaults are validated when used, unless they are known to be valid
+        default_checks = []
+        for param in params:
+            validate = validators[param.name]
+            if param.default is param.empty or validate is None:
+                continue
+            if param.name not in (rules or {}):
+                try:
+                    validate(param.default)
+                    continue
+                except TypeValidationError:
+                    pass
+            default_checks.append(
+                (positions.get(param.name, no_position), param.name, param.default, validate)
+            )
+
+        def validate_bound(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
             # Bind provided arguments to parameter names
             try:
                 bound_args = sig.bind(*args, **kwargs)
@@ -654,60 +1440,40 @@ def validate_args(
 
             # Validate arguments against type hints
             for param_name, value in bound_args.arguments.items():
-                if param_name not in type_hints:
-                    # Skip validation if no type hint is available
-                    continue
-
-                expected_type = type_hints[param_name]
+                validate = validators.get(param_name)
+                if validate is not None:
+                    validate(value)
 
-                if expected_type is Any:
-                    # Skip validation if hinted as Any
-                    continue
+            # If all validations pass, call the original function
+            return func(*bound_args.args, **bound_args.kwargs)
 
-                origin = get_origin(expected_type)
-                args_types = get_args(expected_type)
-
-                is_valid = False
-                if (
-                    origin is Union or origin is UnionType
-                ):  # Handles Union and Optional (Optional[T] is Union[T, NoneType])
-                    # Check if the value's type is one of the types in the Union
-                    for type_arg in args_types:
-                        # Special handling for NoneType in Optional/Union
-                        if type_arg is NoneType and value is None:
-                            is_valid = True
-                            break
-                        # isinstance() doesn't work directly with NoneType before 3.10
-                        if type_arg is not NoneType and isinstance(value, type_arg):
-                            is_valid = True
-                            break
-                elif origin is not None:
-                    # Handle other generic types like list, dict, etc.
-                    # Basic check: validate the origin type (e.g., list, dict)
-                    # Deeper validation (e.g., checking list contents) is complex and skipped here.
-                    if isinstance(value, origin):
-                        is_valid = True
-                else:
-                    # Simple, non-generic type hint
-                    if isinstance(value, expected_type):
-                        is_valid = True
-
-                # Check predicates, if available
-                if rules is not None and param_name in rules:
-                    rule = rules.get(param_name)
-                    if rule is not None and not rule(value):
-                        raise TypeValidationError(
-                            f"Argument '{param_name}' for {func.__qualname__} does not match the given predicate"
-                        )
-
-                if not is_valid:
-                    raise TypeValidationError(
-                        f"Argument '{param_name}' for {func.__qualname__} "
-                        f"expected type {expected_type}, but got {type(value).__name__}."
-                    )
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _args_validation_enabled:
+                return func(*args, **kwargs)
+            nargs = len(args)
+            if not fast or nargs > max_positional:
+                return validate_bound(args, kwargs)
+            for name in kwargs:
+                # Unknown or duplicate arguments are reported by the binding
+                if name not in validators or positions.get(name, nargs) < nargs:
+                    return validate_bound(args, kwargs)
+            for index, name in required:
+                if index >= nargs and name not in kwargs:
+                    return validate_bound(args, kwargs)
+
+            for validate, value in zip(positional_validators, args):
+                if validate is not None:
+                    validate(value)
+            for name, value in kwargs.items():
+                validate = validators[name]
+                if validate is not None:
+                    validate(value)
+            for index, name, default, validate in default_checks:
+                if index >= nargs and name not in kwargs:
+                    validate(default)
 
             # If all validations pass, call the original function
-            return func(*bound_args.args, **bound_args.kwargs)
+            return func(*args, **kwargs)
 
         return cast(F, wrapper)
 
@@ -790,6 +1556,410 @@ def default_on_error(
     return decorator
 
 
-@locked()
+# --- Memoization ---
+
+_CACHE_POLICIES = ("lru", "lfu")
+# Separates the positional arguments from the keyword arguments in cache keys
+_KWARGS_MARK = object()
+
+
+class CacheStats:
+    """
+    Statistics of a function cached with @cached or @memoize.
+    """
+
+    __slots__ = ("hits", "misses", "coalesced", "evictions", "expirations", "size")
+
+    def __init__(self) -> None:
+        # Calls answered from the cache
+        self.hits = 0
+        # Calls that computed the value
+        self.misses = 0
+        # Calls that waited for the value computed by a concurrent call
+        self.coalesced = 0
+        # Entries removed to respect the maximum size
+        self.evictions = 0
+        # Entries found past their time to live
+        self.expirations = 0
+        self.size = 0
+
+    def copy(self) -> CacheStats:
+        stats = CacheStats()
+        for attr in CacheStats.__slots__:
+            setattr(stats, attr, getattr(self, attr))
+        return stats
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStats(hits={self.hits}, misses={self.misses}, "
+            f"coalesced={self.coalesced}, evictions={self.evictions}, "
+            f"expirations={self.expirations}, size={self.size})"
+        )
+
+
+class _CacheEntry:
+    __slots__ = ("value", "expires", "uses")
+
+    def __init__(self, value: Any, expires: float | None) -> None:
+        self.value = value
+        self.expires = expires
+        self.uses = 1
+
+
+class _Flight:
+    """
+    A value being computed by one thread, awaited by the concurrent callers asking for
+    the same key.
+    """
+
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.value: Any = None
+        self.error: BaseException | None = None
+
+    def wait(self) -> Any:
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class _MemoCache:
+    """
+    The entries of a cached function, evicted by least recent (LRU) or least frequent
+    (LFU) use. All methods must be called while holding the cache lock.
+    """
+
+    __slots__ = (
+        "max_size",
+        "ttl",
+        "lfu",
+        "entries",
+        "frequencies",
+        "min_uses",
+        "pending",
+        "stats",
+    )
+
+    def __init__(self, max_size: int | None, ttl: float | None, lfu: bool) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.lfu = lfu
+        self.entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        # LFU only: the keys by number of uses, each in least recent use order
+        self.frequencies: dict[int, OrderedDict[Hashable, None]] = {}
+        self.min_uses = 0
+        # Flights (or futures, for coroutines) of the values being computed
+        self.pending: dict[Hashable, Any] = {}
+        self.stats = CacheStats()
+
+    def lookup(self, key: Hashable) -> _CacheEntry | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires is not None and entry.expires <= monotonic():
+            self.remove(key)
+            self.stats.expirations += 1
+            return None
+        if self.lfu:
+            self.__use(key, entry)
+        else:
+            self.entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry
+
+    def store(self, key: Hashable, value: Any) -> None:
+        self.remove(key)
+        if self.max_size is not None:
+            while len(self.entries) >= self.max_size and self.entries:
+                self.__evict()
+        expires = monotonic() + self.ttl if self.ttl is not None else None
+        self.entries[key] = _CacheEntry(value, expires)
+        if self.lfu:
+            self.frequencies.setdefault(1, OrderedDict())[key] = None
+            self.min_uses = 1
+        self.stats.size = len(self.entries)
+
+    def remove(self, key: Hashable) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        if self.lfu:
+            self.__unlink(key, entry.uses)
+        self.stats.size = len(self.entries)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.frequencies.clear()
+        self.pending.clear()
+        self.stats.size = 0
+
+    def __use(self, key: Hashable, entry: _CacheEntry) -> None:
+        self.__unlink(key, entry.uses)
+        if entry.uses == self.min_uses and entry.uses not in self.frequencies:
+            self.min_uses += 1
+        entry.uses += 1
+        self.frequencies.setdefault(entry.uses, OrderedDict())[key] = None
+
+    def __unlink(self, key: Hashable, uses: int) -> None:
+        keys = self.frequencies[uses]
+        del keys[key]
+        if not keys:
+            del self.frequencies[uses]
+
+    def __evict(self) -> None:
+        if self.lfu:
+            if self.min_uses not in self.frequencies:
+                # The least used keys were removed explicitly
+                self.min_uses = min(self.frequencies)
+            key = next(iter(self.frequencies[self.min_uses]))
+        else:
+            key = next(iter(self.entries))
+        self.remove(key)
+        self.stats.evictions += 1
+
+
+def _make_cache_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    if not kwargs:
+        return args
+    return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+
+def cached(
+    max_size: int | None = 128,
+    ttl: float | None = None,
+    policy: str = "lru",
+    key: Callable[..., Hashable] | None = None,
+    lock_name: str | None = None,
+) -> Callable[[F], F]:
+    """
+    Decorator caching the results of a function by its arguments.
+
+    Concurrent calls for a key that is not cached yet compute it only once: the first
+    caller runs the function, while the others wait for its result (single-flight).
+    Errors are not cached, and are raised to all the callers waiting for them.
+    Coroutine functions are supported, in which case the coroutines awaiting the same
+    key share one computation.
+
+    The decorated function exposes:
+        - `cache_stats()`, returning the CacheStats of the cache
+        - `invalidate(*args, **kwargs)`, removing the value cached for the given arguments
+        - `invalidate_all()`, removing all cached values
+
+    Example:
+        @cached(max_size=1000, ttl=60)
+        def load_user(user_id: int) -> User:
+            return repository.find(user_id)
+
+        load_user(1)  # Calls repository.find
+        load_user(1)  # Returns the cached user for the next 60 seconds
+        load_user.invalidate(1)
+
+    Args:
+        max_size (int | None, optional): The maximum number of cached values, or None for
+            an unbounded cache. Defaults to 128.
+        ttl (float | None, optional): The number of seconds values stay cached, or None
+            to keep them until evicted. Defaults to None.
+        policy (str, optional): The eviction policy, "lru" (least recently used) or
+            "lfu" (least frequently used). Defaults to "lru".
+        key (Callable[..., Hashable] | None, optional): Computes the cache key from the
+            call arguments. Defaults to None, using all the arguments, which must be hashable.
+        lock_name (str | None, optional): The name of the lock protecting the cache in the
+            lock registry shared with @synchronized_static. Defaults to None, generating
+            a name based on the function's module and qualified name.
+
+    Raises:
+        ValueError: If the maximum size or policy is not valid.
+
+    Returns:
+        Callable[[F], F]: The decorator.
+    """
+    if policy not in _CACHE_POLICIES:
+        raise ValueError(f"Unsupported cache policy {policy}")
+    if max_size is not None and max_size <= 0:
+        raise ValueError("max_size must be higher than 0")
+    make_key = key
+
+    def decorator(func: F) -> F:
+        cache = _MemoCache(max_size, ttl, policy == "lfu")
+        lock = _get_or_create_lock(
+            func,
+            lock_name
+            if lock_name is not None
+            else f"{func.__module__}.{func.__qualname__}.cache",
+        )
+
+        def cache_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+            if make_key is not None:
+                return make_key(*args, **kwargs)
+            return _make_cache_key(args, kwargs)
+
+        def complete(cache_key_value: Hashable, flight: Any, value: Any) -> None:
+            with lock:
+                # The key may have been invalidated while computing it
+                if cache.pending.get(cache_key_value) is flight:
+                    del cache.pending[cache_key_value]
+                    cache.store(cache_key_value, value)
+
+        def abandon(cache_key_value: Hashable, flight: Any) -> None:
+            with lock:
+                if cache.pending.get(cache_key_value) is flight:
+                    del cache.pending[cache_key_value]
+
+        if inspect.iscoroutinefunction(func):
+
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                k = cache_key(args, kwargs)
+                with lock:
+                    entry = cache.lookup(k)
+                    if entry is not None:
+                        return entry.value
+                    future = cache.pending.get(k)
+                    if future is None:
+                        future = asyncio.get_running_loop().create_future()
+                        cache.pending[k] = future
+                        cache.stats.misses += 1
+                        leader = True
+                    else:
+                        cache.stats.coalesced += 1
+                        leader = False
+                if not leader:
+                    # Cancelling a waiter must not cancel the shared computation
+                    return await asyncio.shield(future)
+                try:
+                    value = await func(*args, **kwargs)
+                except BaseException as e:
+                    abandon(k, future)
+                    if isinstance(e, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(e)
+                        # Mark the error as retrieved when no waiter awaits it
+                        future.exception()
+                    raise
+                complete(k, future, value)
+                future.set_result(value)
+                return value
+
+            wrapper: Callable[..., Any] = async_wrapper
+        else:
+
+            def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+                k = cache_key(args, kwargs)
+                with lock:
+                    entry = cache.lookup(k)
+                    if entry is not None:
+                        return entry.value
+                    flight = cache.pending.get(k)
+                    if flight is None:
+                        flight = cache.pending[k] = _Flight()
+                        cache.stats.misses += 1
+                        leader = True
+                    else:
+                        cache.stats.coalesced += 1
+                        leader = False
+                if not leader:
+                    return flight.wait()
+                try:
+                    value = func(*args, **kwargs)
+                except BaseException as e:
+                    abandon(k, flight)
+                    flight.error = e
+                    flight.done.set()
+                    raise
+                complete(k, flight, value)
+                flight.value = value
+                flight.done.set()
+                return value
+
+            wrapper = sync_wrapper
+
+        def cache_stats() -> CacheStats:
+            with lock:
+                return cache.stats.copy()
+
+        def invalidate(*args: Any, **kwargs: Any) -> None:
+            k = cache_key(args, kwargs)
+            with lock:
+                cache.remove(k)
+                # A computation in progress no longer stores its value
+                cache.pending.pop(k, None)
+
+        def invalidate_all() -> None:
+            with lock:
+                cache.clear()
+
+        setattr(wrapper, "cache_stats", cache_stats)
+        setattr(wrapper, "invalidate", invalidate)
+        setattr(wrapper, "invalidate_all", invalidate_all)
+        wrapper.__name__ = func.__name__
+        wrapper.__qualname__ = func.__qualname__
+        wrapper.__doc__ = func.__doc__
+        wrapper.__module__ = func.__module__
+        return cast(F, wrapper)
+
+    return decorator
+
+
+def memoize() -> Callable[[F], F]:
+    """
+    Decorator caching the results of a function by its arguments, without any size or
+    time limit. Equivalent to `@cached(max_size=None)`, see `cached`.
+
+    Example:
+        @memoize()
+        def fibonacci(n: int) -> int:
+            return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+    Returns:
+        Callable[[F], F]: The decorator.
+    """
+    return cached(max_size=None)
+
+
 class SynchronizedValue(Value[T]):
-    pass
+    """
+    A thread-safe Value. Writes are serialized, while reads return the current value
+    without taking any lock: the value is replaced as a whole, so readers always see
+    either the previous or the new value.
+
+    To change a mutable value, `update` it with a modified copy instead of mutating it
+    in place (copy-on-write), so that readers never observe a partial change.
+
+    Example:
+        settings = SynchronizedValue({"retries": 3})
+        settings.update(lambda current: {**(current or {}), "timeout": 10})
+    """
+
+    __slots__ = ("__lock",)
+
+    def __init__(self, value: T | None) -> None:
+        super().__init__(value)
+        self.__lock = Lock()
+
+    def set(self, value: T | None) -> None:
+        with self.__lock:
+            super().set(value)
+
+    def update(self, updater: Callable[[T | None], T | None]) -> T | None:
+        """
+        Atomically replaces the value with the result of the updater, called with the
+        current value. Concurrent updates are applied one after the other.
+
+        Args:
+            updater (Callable[[T | None], T | None]): Computes the new value
+
+        Returns:
+            T | None: The new value
+        """
+        with self.__lock:
+            value = updater(self.get())
+            super().set(value)
+            return value
+
+    def __call__(self, value: T | None = None) -> T | None:
+        if value is not None:
+            self.set(value)
+        return self.get()
@@ -0,0 +1,717 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections import deque
+from typing import Any, Generic, TypeVar, cast, final
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+)
+
+from jstreams.stream import Opt, Stream
+from jstreams.utils import require_non_null
+
+T = TypeVar("T")
+K = TypeVar("K")
+V = TypeVar("V")
+
+# A function that may be a coroutine function, its result is awaited when needed
+MaybeAsync = Callable[[T], V | Awaitable[V]]
+
+
+async def _resolve(value: V | Awaitable[V]) -> V:
+    if inspect.isawaitable(value):
+        return cast(V, await value)
+    return value
+
+
+async def _apply(fn: MaybeAsync[T, V], value: T) -> V:
+    return await _resolve(fn(value))
+
+
+async def _from_iterable(iterable: Iterable[T]) -> AsyncIterator[T]:
+    for value in iterable:
+        yield value
+
+
+class _Reiterable(Generic[V]):
+    """
+    An async iterable calling an async generator function anew each time it is
+    iterated, so that it can be iterated as many times as its source can.
+    """
+
+    __slots__ = ("__fn", "__args")
+
+    def __init__(self, fn: Callable[..., AsyncIterator[V]], *args: Any) -> None:
+        self.__fn = fn
+        self.__args = args
+
+    def __aiter__(self) -> AsyncIterator[V]:
+        return self.__fn(*self.__args)
+
+
+def _as_async_iterable(arg: AsyncIterable[T] | Iterable[T]) -> AsyncIterable[T]:
+    if hasattr(arg, "__aiter__"):
+        return cast(AsyncIterable[T], arg)
+    return _Reiterable(_from_iterable, cast(Iterable[T], arg))
+
+
+async def _map(source: AsyncIterable[T], mapper: MaybeAsync[T, V]) -> AsyncIterator[V]:
+    async for value in source:
+        yield await _resolve(mapper(value))
+
+
+async def _filter(
+    source: AsyncIterable[T], predicate: MaybeAsync[T, bool]
+) -> AsyncIterator[T]:
+    async for value in source:
+        if await _resolve(predicate(value)):
+            yield value
+
+
+async def _flat_map(
+    source: AsyncIterable[T],
+    mapper: MaybeAsync[T, AsyncIterable[V] | Iterable[V]],
+) -> AsyncIterator[V]:
+    async for value in source:
+        async for mapped in _as_async_iterable(await _resolve(mapper(value))):
+            yield mapped
+
+
+def _retrieve_exception(task: asyncio.Future[Any]) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+def _discard_tasks(tasks: Iterable[asyncio.Future[Any]]) -> None:
+    """
+    Cancels the tasks still running, and retrieves the exceptions of the others so
+    that asyncio does not report them as never retrieved.
+    """
+    for task in tasks:
+        task.cancel()
+        # Also covers tasks that finish with an error instead of being cancelled
+        task.add_done_callback(_retrieve_exception)
+
+
+async def _close(iterator: AsyncIterator[Any]) -> None:
+    aclose = getattr(iterator, "aclose", None)
+    if aclose is not None:
+        await aclose()
+
+
+async def _map_concurrent_ordered(
+    source: AsyncIterable[T], mapper: MaybeAsync[T, V], limit: int
+) -> AsyncIterator[V]:
+    iterator = source.__aiter__()
+    pending: deque[asyncio.Future[V]] = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < limit:
+                try:
+                    value = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.append(asyncio.ensure_future(_apply(mapper, value)))
+            if not pending:
+                return
+            # The other tasks keep running while waiting for the oldest one
+            yield await pending.popleft()
+    finally:
+        _discard_tasks(pending)
+        await _close(iterator)
+
+
+async def _map_concurrent_unordered(
+    source: AsyncIterable[T], mapper: MaybeAsync[T, V], limit: int
+) -> AsyncIterator[V]:
+    iterator = source.__aiter__()
+    pending: set[asyncio.Future[V]] = set()
+    # Completed tasks whose result is not yielded yet
+    done: deque[asyncio.Future[V]] = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < limit:
+                try:
+                    value = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.ensure_future(_apply(mapper, value)))
+            if not pending:
+                return
+            completed, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            done.extend(completed)
+            while done:
+                yield done.popleft().result()
+    finally:
+        _discard_tasks(done)
+        _discard_tasks(pending)
+        await _close(iterator)
+
+
+async def _each(
+    source: AsyncIterable[T], action: MaybeAsync[T, Any]
+) -> AsyncIterator[T]:
+    async for value in source:
+        await _resolve(action(value))
+        yield value
+
+
+async def _skip(source: AsyncIterable[T], count: int) -> AsyncIterator[T]:
+    skipped = 0
+    async for value in source:
+        if skipped < count:
+            skipped += 1
+            continue
+        yield value
+
+
+async def _limit(source: AsyncIterable[T], count: int) -> AsyncIterator[T]:
+    if count <= 0:
+        return
+    taken = 0
+    async for value in source:
+        yield value
+        taken += 1
+        if taken >= count:
+            return
+
+
+async def _take_while(
+    source: AsyncIterable[T], predicate: MaybeAsync[T, bool]
+) -> AsyncIterator[T]:
+    async for value in source:
+        if not await _resolve(predicate(value)):
+            return
+        yield value
+
+
+async def _drop_while(
+    source: AsyncIterable[T], predicate: MaybeAsync[T, bool]
+) -> AsyncIterator[T]:
+    dropping = True
+    async for value in source:
+        if dropping and await _resolve(predicate(value)):
+            continue
+        dropping = False
+        yield value
+
+
+async def _distinct(
+    source: AsyncIterable[T], key: Callable[[T], Any] | None
+) -> AsyncIterator[T]:
+    seen: set[Any] = set()
+    async for value in source:
+        value_key = value if key is None else key(value)
+        if value_key not in seen:
+            seen.add(value_key)
+            yield value
+
+
+async def _chunked(source: AsyncIterable[T], size: int) -> AsyncIterator[list[T]]:
+    chunk: list[T] = []
+    async for value in source:
+        chunk.append(value)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def _concat(*sources: AsyncIterable[T]) -> AsyncIterator[T]:
+    for source in sources:
+        async for value in source:
+            yield value
+
+
+@final
+class AsyncStream(Generic[T]):
+    """
+    The asynchronous counterpart of Stream, built on async iterables.
+
+    An AsyncStream consumes async iterables and async generators, as well as plain
+    iterables. Like Stream, intermediate operations are lazy and only run when a
+    terminal operation is awaited, or when the stream is consumed with `async for`.
+    The functions given to `map`, `filter`, `flat_map` and the other operations may
+    be plain functions or coroutine functions.
+
+    Each terminal operation iterates the source again, so a stream of a list or of
+    another re-iterable source can be consumed several times, like a Stream. A
+    stream of an async generator or of an iterator can only be consumed once.
+
+    Example:
+        >>> users = await (
+        ...     AsyncStream(user_ids)
+        ...     .map_concurrent(fetch_user, limit=10)
+        ...     .filter(lambda user: user.active)
+        ...     .to_list()
+        ... )
+    """
+
+    __slots__ = ("__arg",)
+
+    def __init__(self, arg: AsyncIterable[T] | Iterable[T]) -> None:
+        self.__arg = _as_async_iterable(require_non_null(arg))
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self.__arg.__aiter__()
+
+    def map(self, mapper: MaybeAsync[T, V]) -> AsyncStream[V]:
+        """
+        Produces a new stream by mapping the stream elements using the given mapper
+        function. Each result is awaited before the next element is mapped, see
+        `map_concurrent` to await several at once.
+
+        Args:
+            mapper (MaybeAsync[T, V]): The mapper, possibly a coroutine function
+
+        Returns:
+            AsyncStream[V]: The result stream
+        """
+        return AsyncStream(_Reiterable(_map, self.__arg, mapper))
+
+    def map_concurrent(
+        self, mapper: MaybeAsync[T, V], limit: int, ordered: bool = True
+    ) -> AsyncStream[V]:
+        """
+        Maps the stream elements with a coroutine function, awaiting up to `limit`
+        calls concurrently. Elements are pulled from this stream only as calls
+        complete, so at most `limit` calls are ever in flight. If a call fails, the
+        others are cancelled and the error propagates to the consumer.
+
+        Args:
+            mapper (MaybeAsync[T, V]): The mapper, usually a coroutine function
+            limit (int): The maximum number of concurrent calls. Must be positive.
+            ordered (bool): If True, the results keep the order of the elements. If
+                False, results are produced as soon as they complete. Defaults to True.
+
+        Returns:
+            AsyncStream[V]: The result stream
+
+        Raises:
+            ValueError: If limit is not positive.
+        """
+        if limit < 1:
+            raise ValueError("Concurrency limit must be positive.")
+        if ordered:
+            return AsyncStream(
+                _Reiterable(_map_concurrent_ordered, self.__arg, mapper, limit)
+            )
+        return AsyncStream(
+            _Reiterable(_map_concurrent_unordered, self.__arg, mapper, limit)
+        )
+
+    def filter(self, predicate: MaybeAsync[T, bool]) -> AsyncStream[T]:
+        """
+        Returns a stream of objects that match the given predicate.
+
+        Args:
+            predicate (MaybeAsync[T, bool]): The predicate, possibly a coroutine
+                function
+
+        Returns:
+            AsyncStream[T]: The stream of filtered objects
+        """
+        return AsyncStream(_Reiterable(_filter, self.__arg, predicate))
+
+    def flat_map(
+        self, mapper: MaybeAsync[T, AsyncIterable[V] | Iterable[V]]
+    ) -> AsyncStream[V]:
+        """
+        Produces a flat stream by mapping each element of this stream to an iterable
+        or async iterable, then concatenating them into a single stream.
+
+        Args:
+            mapper (MaybeAsync[T, AsyncIterable[V] | Iterable[V]]): The mapper
+
+        Returns:
+            AsyncStream[V]: The result stream
+        """
+        return AsyncStream(_Reiterable(_flat_map, self.__arg, mapper))
+
+    def each(self, action: MaybeAsync[T, Any]) -> AsyncStream[T]:
+        """
+        Calls the action for each element as it passes through the stream.
+
+        Args:
+            action (MaybeAsync[T, Any]): The action, possibly a coroutine function
+
+        Returns:
+            AsyncStream[T]: This stream's elements, unchanged
+        """
+        return AsyncStream(_Reiterable(_each, self.__arg, action))
+
+    def peek(self, action: MaybeAsync[T, Any]) -> AsyncStream[T]:
+        """
+        Alias of `each`.
+        """
+        return self.each(action)
+
+    def cast(
+        self, cast_to_type: type[V]  # pylint: disable=unused-argument
+    ) -> AsyncStream[V]:
+        """
+        Returns this stream typed as a stream of the given type.
+
+        Args:
+            cast_to_type (type[V]): The type all objects will be casted to
+
+        Returns:
+            AsyncStream[V]: The stream of casted objects
+        """
+        return cast(AsyncStream[V], self)
+
+    def of_type(self, the_type: type[V]) -> AsyncStream[V]:
+        """
+        Returns a stream of the elements that are instances of the given type.
+
+        Args:
+            the_type (type[V]): The type
+
+        Returns:
+            AsyncStream[V]: The result stream
+        """
+        return self.filter(lambda value: isinstance(value, the_type)).cast(the_type)
+
+    def non_null(self) -> AsyncStream[T]:
+        """
+        Returns a stream of non null objects from this stream
+
+        Returns:
+            AsyncStream[T]: The result stream
+        """
+        return self.filter(lambda value: value is not None)
+
+    def skip(self, count: int) -> AsyncStream[T]:
+        """
+        Returns a stream without the first number of items specified by 'count'
+
+        Args:
+            count (int): How many items should be skipped
+
+        Returns:
+            AsyncStream[T]: The result stream
+        """
+        return AsyncStream(_Reiterable(_skip, self.__arg, count))
+
+    def limit(self, count: int) -> AsyncStream[T]:
+        """
+        Returns a stream limited to the first 'count' items of this stream. The
+        source is not consumed past the last item taken.
+
+        Args:
+            count (int): The max amount of items
+
+        Returns:
+            AsyncStream[T]: The result stream
+        """
+        return AsyncStream(_Reiterable(_limit, self.__arg, count))
+
+    def take_while(self, predicate: MaybeAsync[T, bool]) -> AsyncStream[T]:
+        """
+        Returns a stream of elements until the first element that DOES NOT match the
+        given predicate
+
+        Args:
+            predicate (MaybeAsync[T, bool]): The predicate
+
+        Returns:
+            AsyncStream[T]: The result stream
+        """
+        return AsyncStream(_Reiterable(_take_while, self.__arg, predicate))
+
+    def drop_while(self, predicate: MaybeAsync[T, bool]) -> AsyncStream[T]:
+        """
+        Returns a stream of elements by dropping the first elements that match the
+        given predicate
+
+        Args:
+            predicate (MaybeAsync[T, bool]): The predicate
+
+        Returns:
+            AsyncStream[T]: The result stream
+        """
+        return AsyncStream(_Reiterable(_drop_while, self.__arg, predicate))
+
+    def distinct(self, key: Callable[[T], Any] | None = None) -> AsyncStream[T]:
+        """
+        Returns a stream consisting of the distinct elements of this stream.
+        Uniqueness is determined by the element itself or by the result of applying
+        the key function.
+
+        Args:
+            key (Callable[[T], Any] | None, optional): The key function. Defaults
+                to None.
+
+        Returns:
+            AsyncStream[T]: The result stream
+        """
+        return AsyncStream(_Reiterable(_distinct, self.__arg, key))
+
+    def chunked(self, size: int) -> AsyncStream[list[T]]:
+        """
+        Groups elements of the stream into chunks (lists) of a specified size.
+        The last chunk may contain fewer elements than the specified size.
+
+        Args:
+            size (int): The desired size of each chunk. Must be positive.
+
+        Returns:
+            AsyncStream[list[T]]: A stream where each element is a list (chunk).
+
+        Raises:
+            ValueError: If size is not positive.
+        """
+        if size <= 0:
+            raise ValueError("Chunk size must be positive.")
+        return AsyncStream(_Reiterable(_chunked, self.__arg, size))
+
+    def concat(self, other: AsyncIterable[T] | Iterable[T]) -> AsyncStream[T]:
+        """
+        Returns a stream of this stream's elements followed by the other's.
+
+        Args:
+            other (AsyncIterable[T] | Iterable[T]): The elements to append
+
+        Returns:
+            AsyncStream[T]: The result stream
+        """
+        return AsyncStream(_Reiterable(_concat, self.__arg, _as_async_iterable(other)))
+
+    # ==========================================
+    #          TERMINAL OPERATIONS
+    # ==========================================
+    async def to_list(self) -> list[T]:
+        """
+        Creates a list with the contents of the stream
+
+        Returns:
+            list[T]: The list
+        """
+        return [value async for value in self.__arg]
+
+    async def to_set(self) -> set[T]:
+        """
+        Creates a set with the contents of the stream
+
+        Returns:
+            set[T]: The set
+        """
+        return {value async for value in self.__arg}
+
+    async def to_tuple(self) -> tuple[T, ...]:
+        """
+        Creates a tuple with the contents of the stream
+
+        Returns:
+            tuple[T, ...]: The tuple
+        """
+        return tuple(await self.to_list())
+
+    async def to_dict(
+        self,
+        key_mapper: Callable[[T], V],
+        value_mapper: Callable[[T], K],
+    ) -> dict[V, K]:
+        """
+        Creates a dictionary with the contents of the stream creating keys using
+        the given key mapper and values using the value mapper
+
+        Args:
+            key_mapper (Callable[[T], V]): The key mapper
+            value_mapper (Callable[[T], K]): The value mapper
+
+        Returns:
+            dict[V, K]: The resulting dictionary
+        """
+        return {key_mapper(value): value_mapper(value) async for value in self.__arg}
+
+    async def to_stream(self) -> Stream[T]:
+        """
+        Collects the elements and returns a synchronous Stream of them.
+
+        Returns:
+            Stream[T]: The stream
+        """
+        return Stream(await self.to_list())
+
+    async def collect_using(self, collector: Callable[[Iterable[T]], K]) -> K:
+        """
+        Collects the elements, then transforms them using the collector. Any
+        collector accepted by `Stream.collect_using`, such as the ones provided by
+        `Collectors`, can be used.
+
+        Args:
+            collector (Callable[[Iterable[T]], K]): The collector
+
+        Returns:
+            K: The tranformed type
+        """
+        return collector(await self.to_list())
+
+    async def for_each(self, action: MaybeAsync[T, Any]) -> None:
+        """
+        Calls the action for each element, consuming the stream.
+
+        Args:
+            action (MaybeAsync[T, Any]): The action, possibly a coroutine function
+        """
+        async for value in self.__arg:
+            await _resolve(action(value))
+
+    async def first(self) -> Opt[T]:
+        """
+        Finds and returns the first element of the stream.
+
+        Returns:
+            Opt[T]: First element
+        """
+        async for value in self.__arg:
+            return Opt(value)
+        return Opt(None)
+
+    async def find_first(self, predicate: MaybeAsync[T, bool]) -> Opt[T]:
+        """
+        Finds and returns the first element matching the predicate
+
+        Args:
+            predicate (MaybeAsync[T, bool]): The predicate
+
+        Returns:
+            Opt[T]: The first element found
+        """
+        return await self.filter(predicate).first()
+
+    async def any_match(self, predicate: MaybeAsync[T, bool]) -> bool:
+        """
+        Checks if any stream object matches the given predicate
+
+        Args:
+            predicate (MaybeAsync[T, bool]): The predicate
+
+        Returns:
+            bool: True if any object matches, False otherwise
+        """
+        async for value in self.__arg:
+            if await _resolve(predicate(value)):
+                return True
+        return False
+
+    async def all_match(self, predicate: MaybeAsync[T, bool]) -> bool:
+        """
+        Checks if all of the stream objects match the given predicate.
+
+        Args:
+            predicate (MaybeAsync[T, bool]): The predicate
+
+        Returns:
+            bool: True if all objects match, False otherwise
+        """
+        async for value in self.__arg:
+            if not await _resolve(predicate(value)):
+                return False
+        return True
+
+    async def none_match(self, predicate: MaybeAsync[T, bool]) -> bool:
+        """
+        Checks if none of the stream objects matches the given predicate.
+
+        Args:
+            predicate (MaybeAsync[T, bool]): The predicate
+
+        Returns:
+            bool: True if no object matches, False otherwise
+        """
+        return not await self.any_match(predicate)
+
+    async def count(self) -> int:
+        """
+        Counts the elements of the stream.
+
+        Returns:
+            int: The number of elements
+        """
+        total = 0
+        async for _ in self.__arg:
+            total += 1
+        return total
+
+    async def reduce(self, reducer: Callable[[T, T], T]) -> Opt[T]:
+        """
+        Reduces a stream to a single value. The reducer takes two values and
+        returns only one.
+
+        Args:
+            reducer (Callable[[T, T], T]): The reducer
+
+        Returns:
+            Opt[T]: The resulting optional
+        """
+        iterator = self.__arg.__aiter__()
+        try:
+            result = await iterator.__anext__()
+        except StopAsyncIteration:
+            return Opt(None)
+        async for value in iterator:
+            result = reducer(result, value)
+        return Opt(result)
+
+    # ==========================================
+    #          FACTORY METHODS
+    # ==========================================
+    @staticmethod
+    def of(arg: AsyncIterable[T] | Iterable[T]) -> AsyncStream[T]:
+        """
+        Creates an async stream from an async iterable or an iterable.
+
+        Args:
+            arg (AsyncIterable[T] | Iterable[T]): The source
+
+        Returns:
+            AsyncStream[T]: The stream
+        """
+        return AsyncStream(arg)
+
+    @staticmethod
+    def of_items(*items: T) -> AsyncStream[T]:
+        """
+        Creates an async stream from the provided items.
+
+        Returns:
+            AsyncStream[T]: A stream containing the provided items.
+        """
+        return AsyncStream(items)
+
+    @staticmethod
+    def empty() -> AsyncStream[Any]:
+        """
+        Creates an empty async stream.
+
+        Returns:
+            AsyncStream[Any]: The empty stream
+        """
+        return AsyncStream(())
+
+
+def async_stream(it: AsyncIterable[T] | Iterable[T]) -> AsyncStream[T]:
+    """
+    Helper method, equivalent to AsyncStream(it)
+
+    Args:
+        it (AsyncIterable[T] | Iterable[T]): The source
+
+    Returns:
+        AsyncStream[T]: The stream
+    """
+    return AsyncStream(it)
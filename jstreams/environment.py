@@ -10,6 +10,10 @@ JSTREAMS_PACKAGES: Final[str] = "JSTREAMS_PACKAGES"
 JSTREAMS_PACKAGES_LOWER: Final[str] = "jstreams_packages"
 JSTREAMS_PACKAGES_CAMEL: Final[str] = "jstreamsPackages"
 
+JSTREAMS_MANIFEST: Final[str] = "JSTREAMS_MANIFEST"
+JSTREAMS_MANIFEST_LOWER: Final[str] = "jstreams_manifest"
+JSTREAMS_MANIFEST_CAMEL: Final[str] = "jstreamsManifest"
+
 JSTREAMS_CONFIG_JSON: Final[str] = "JSTREAMS_CONFIG_JSON"
 DEFAULT_FILE: Final[str] = "jstreams.json"
 
@@ -37,12 +41,15 @@ class JStreamsEnv:
         self.__load_config()
 
     def __load_config(self) -> None:
-        if profile := self.__get_env_profile() is not None:
+        if (profile := self.__get_env_profile()) is not None:
             self.__config[JSTREAMS_PROFILE] = profile
 
-        if packages := self.__get_env_packages() is not None:
+        if (packages := self.__get_env_packages()) is not None:
             self.__config[JSTREAMS_PACKAGES] = packages
 
+        if (manifest := self.__get_env_manifest()) is not None:
+            self.__config[JSTREAMS_MANIFEST] = manifest
+
         config_file = get_env_config_file()
         if os.path.exists(config_file):
             try:
@@ -60,6 +67,12 @@ class JStreamsEnv:
                             or config.get(JSTREAMS_PACKAGES_LOWER)
                             or config.get(JSTREAMS_PACKAGES_CAMEL)
                         )
+                    if self.__config.get(JSTREAMS_MANIFEST) is None:
+                        self.__config[JSTREAMS_MANIFEST] = (
+                            config.get(JSTREAMS_MANIFEST)
+                            or config.get(JSTREAMS_MANIFEST_LOWER)
+                            or config.get(JSTREAMS_MANIFEST_CAMEL)
+                        )
 
                     if self.__config.get(JSTREAMS_RAISE_BEAN_ERRORS) is None:
                         self.__config[JSTREAMS_RAISE_BEAN_ERRORS] = (
@@ -81,6 +94,10 @@ class JStreamsEnv:
         packages: list[str] | None = self.__config.get(JSTREAMS_PACKAGES)
         return packages
 
+    def get_manifest(self) -> str | None:
+        manifest: str | None = self.__config.get(JSTREAMS_MANIFEST)
+        return manifest
+
     def get_raise_bean_errors(self) -> bool:
         return bool(self.__config.get(JSTREAMS_RAISE_BEAN_ERRORS, False))
 
@@ -91,6 +108,13 @@ class JStreamsEnv:
             or os.getenv(JSTREAMS_PROFILE_CAMEL)
         )
 
+    def __get_env_manifest(self) -> str | None:
+        return (
+            os.getenv(JSTREAMS_MANIFEST)
+            or os.getenv(JSTREAMS_MANIFEST_LOWER)
+            or os.getenv(JSTREAMS_MANIFEST_CAMEL)
+        )
+
     def __get_env_packages(self) -> list[str] | None:
         packages = (
             os.getenv(JSTREAMS_PACKAGES)
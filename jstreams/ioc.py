@@ -1,15 +1,20 @@
 from __future__ import annotations
 import atexit
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from enum import Enum
 import importlib
 import inspect
-from threading import Lock, RLock
-from typing import Any, Generic, TypeVar, cast, get_type_hints
+from threading import Lock, RLock, local
+import time
+from typing import Any, Generic, TypeVar, cast, get_args, get_type_hints
+from weakref import WeakKeyDictionary, finalize
 from collections.abc import Callable
 
 from jstreams.noop import NoOp, NoOpCls
 from jstreams.stream import Opt, Stream
-from jstreams.try_opt import Try
 from jstreams.utils import (
     TypeInjectionError,
     ValueInjectionError,
@@ -17,6 +22,7 @@ from jstreams.utils import (
     require_non_null,
 )
 from jstreams.environment import JStreamsEnv
+from jstreams.manifest import read_manifest, record_component, type_paths
 
 
 class Strategy(Enum):
@@ -27,6 +33,11 @@ class Strategy(Enum):
 class Scope(Enum):
     SINGLETON = 0
     PROTOTYPE = 1
+    # One instance per request scope, see request_scope()
+    REQUEST = 2
+    CONTEXT = 2
+    # One instance per thread, disposed when the thread ends
+    THREAD = 3
 
 
 class Dependency:
@@ -150,6 +161,133 @@ def pre_destroy(fn: Callable[..., None]) -> Callable[..., None]:
     return fn
 
 
+class _LifecycleHooks:
+    """
+    The lifecycle hooks of a class, discovered once and reused for every instance.
+    """
+
+    __slots__ = ("auto_init", "auto_start", "auto_close", "post_construct", "pre_destroy")
+
+    def __init__(self, cls: type) -> None:
+        self.auto_init = issubclass(cls, AutoInit)
+        self.auto_start = issubclass(cls, AutoStart)
+        self.auto_close = issubclass(cls, AutoClose)
+        post_construct_names: list[str] = []
+        pre_destroy_names: list[str] = []
+        for name in dir(cls):
+            if name.startswith("__"):
+                continue
+            # Inspect the class statically, so that properties and injected
+            # fields are not evaluated
+            attr = inspect.getattr_static(cls, name, None)
+            fn = getattr(attr, "__func__", attr)
+            if not callable(fn):
+                continue
+            if getattr(fn, "__post_construct__", False):
+                post_construct_names.append(name)
+            if getattr(fn, "__pre_destroy__", False):
+                pre_destroy_names.append(name)
+        self.post_construct = tuple(post_construct_names)
+        self.pre_destroy = tuple(pre_destroy_names)
+
+
+# Weakly keyed, so that hook tables do not keep dynamically created classes alive
+_hook_tables: WeakKeyDictionary[type, _LifecycleHooks] = WeakKeyDictionary()
+
+
+def _lifecycle_hooks(cls: type) -> _LifecycleHooks:
+    hooks = _hook_tables.get(cls)
+    if hooks is None:
+        hooks = _LifecycleHooks(cls)
+        _hook_tables[cls] = hooks
+    return hooks
+
+
+def _destroy_component(comp: Any) -> None:
+    hooks = _lifecycle_hooks(type(comp))
+    if hooks.auto_close:
+        try:
+            comp.close()
+        except Exception as e:
+            print(f"Error closing component: {e}")
+
+    # Handle @pre_destroy
+    for name in hooks.pre_destroy:
+        try:
+            getattr(comp, name)()
+        except Exception as e:
+            print(f"Error executing pre_destroy on {name}: {e}")
+
+
+def _destroy_scoped(instances: dict[tuple[Any, str], Any]) -> None:
+    for comp in list(instances.values()):
+        _destroy_component(comp)
+    instances.clear()
+
+
+# Instances of the REQUEST scoped components for the current context
+_request_instances: ContextVar[dict[tuple[Any, str], Any] | None] = ContextVar(
+    "jstreams_request_instances", default=None
+)
+
+
+class _ThreadInstances:
+    __slots__ = ("instances", "__weakref__")
+
+    def __init__(self) -> None:
+        self.instances: dict[tuple[Any, str], Any] = {}
+
+
+# Holds a _ThreadInstances object for each thread. The holder is released when the thread
+# ends, and its finalizer destroys the THREAD scoped instances.
+_thread_local = local()
+
+
+def _scoped_instances(scope: Scope) -> dict[tuple[Any, str], Any]:
+    if scope == Scope.REQUEST:
+        instances = _request_instances.get()
+        if instances is None:
+            raise ValueInjectionError(
+                "Request scoped components can only be retrieved inside a request_scope()"
+            )
+        return instances
+    holder: _ThreadInstances | None = getattr(_thread_local, "holder", None)
+    if holder is None:
+        holder = _ThreadInstances()
+        finalize(holder, _destroy_scoped, holder.instances)
+        _thread_local.holder = holder
+    return holder.instances
+
+
+@contextmanager
+def request_scope() -> Iterator[None]:
+    """
+    Opens a request scope. Components with the Scope.REQUEST scope are created once
+    inside a request scope, and reused for the duration of it. When the scope exits,
+    the created components are destroyed, calling their @pre_destroy methods and
+    closing the AutoClose ones. The scope is bound to the current context, so it
+    follows the current thread or asyncio task.
+
+    Example:
+        @component(scope=Scope.REQUEST)
+        class DbSession(AutoClose):
+            ...
+
+        with request_scope():
+            inject(DbSession) # Created once for the request
+            inject(DbSession) # Same instance
+        # DbSession closed here
+    """
+    token = _request_instances.set({})
+    try:
+        yield
+    finally:
+        instances = _request_instances.get()
+        _request_instances.reset(token)
+        if instances is not None:
+            _destroy_scoped(instances)
+
+
 class _ContainerDependency:
     __slots__ = ("qualified_dependencies", "qualified_scopes", "lock")
 
@@ -191,15 +329,52 @@ class _Injector:
         )
 
         self.__modules_scanned = False
+        # Modules known from a manifest to register a type (by its import path), and
+        # to register subtypes of a type. They are imported when the type is requested.
+        self.__lazy_modules: dict[str, list[str]] = {}
+        self.__lazy_subtype_modules: dict[str, list[str]] = {}
+        self.__manifest = self.env.get_manifest()
         self.__raise_beans_error = self.env.get_raise_bean_errors()
-        self.__comp_cache: dict[tuple[type, str | None], Any] = {}
+        # Resolution caches, keyed by (type, qualifier, active profile). They are
+        # invalidated whenever the registry or the active profile changes.
+        self.__comp_cache: dict[tuple[type, str | None, str | None], Any] = {}
+        self.__location_cache: dict[
+            tuple[type, str | None, str | None], tuple[_ContainerDependency, str, Scope]
+        ] = {}
         self.__var_cache: dict[tuple[type, str], Any] = {}
+        # Maps a requested type to the registered (type, full qualifier) pairs that may hold
+        # instances of the requested type
+        self.__subtype_index: dict[type, list[tuple[type, str]]] = {}
         atexit.register(self.__auto_close)
 
     def scan_modules(self, modules_to_scan: list[str]) -> _Injector:
         self.__modules_to_scan = set(modules_to_scan)
         return self
 
+    def load_manifest(self, path: str) -> _Injector:
+        """
+        Registers the components recorded in a manifest built by `jstreams.manifest.build_manifest`,
+        instead of scanning the configured modules. The module registering a component is
+        only imported when the component's type, or a base type of it, is first requested.
+
+        Args:
+            path (str): The manifest file
+
+        Returns:
+            _Injector: The injector
+        """
+        with self.load_modules_lock:
+            self.__load_manifest(path)
+        return self
+
+    def __load_manifest(self, path: str) -> None:
+        self.__modules_scanned = True
+        for record in read_manifest(path)["components"]:
+            module = record["module"]
+            self.__lazy_modules.setdefault(record["type"], []).append(module)
+            for base in record["bases"]:
+                self.__lazy_subtype_modules.setdefault(base, []).append(module)
+
     def __scan_packages(self) -> None:
         if self.__modules_scanned:
             return
@@ -207,9 +382,22 @@ class _Injector:
             if self.__modules_scanned:
                 return
             self.__modules_scanned = True
+            if self.__manifest is not None:
+                self.__load_manifest(self.__manifest)
+                return
             for module in self.__modules_to_scan:
                 importlib.import_module(module)
 
+    def __import_lazy_modules(self, index: dict[str, list[str]], path: str) -> bool:
+        # Entries are dropped only once imported, so that a concurrent lookup of the same
+        # type waits on the import lock instead of missing the component
+        if (modules := index.get(path)) is None:
+            return False
+        for module in modules:
+            importlib.import_module(module)
+        index.pop(path, None)
+        return True
+
     def __get_profile_str(self) -> str:
         return self.__compute_profile(self.__profile)
 
@@ -236,6 +424,7 @@ class _Injector:
         if self.__profile is not None:
             raise ValueInjectionError(f"Profile ${self.__profile} is already active")
         self.__profile = profile
+        self.__invalidate_caches()
 
     def get_active_profile(self) -> str | None:
         return self.__get_profile_str()
@@ -257,44 +446,24 @@ class _Injector:
         self.__profile = None
         self.__modules_scanned = False
         self.__modules_to_scan = set()
+        self.__manifest = None
+        self.__lazy_modules = {}
+        self.__lazy_subtype_modules = {}
+        self.__invalidate_caches()
+
+    def __invalidate_caches(self) -> None:
+        # Caches are replaced rather than cleared, so that lookups in progress
+        # only populate the discarded dictionaries
         self.__comp_cache = {}
+        self.__location_cache = {}
         self.__var_cache = {}
+        self.__subtype_index = {}
 
     def __auto_close(self) -> None:
         # Close all AutoClose components before clearing
         for dep in self.__components.values():
             for comp in dep.qualified_dependencies.values():
-                if isinstance(comp, AutoClose):
-                    try:
-                        comp.close()
-                    except Exception as e:
-                        print(f"Error closing component: {e}")
-
-                # Handle @pre_destroy
-                for name in dir(comp):
-                    if name.startswith("__"):
-                        continue
-                    (
-                        Try(lambda: getattr(comp, name))
-                        .get()
-                        .filter(
-                            lambda attr: (
-                                callable(attr)
-                                and getattr(attr, "__pre_destroy__", False)
-                            )
-                        )
-                        .if_present(
-                            lambda attr: (
-                                Try(lambda: attr())
-                                .on_failure(
-                                    lambda e: print(
-                                        f"Error executing pre_destroy on {name}: {e}"
-                                    )
-                                )
-                                .get()
-                            )
-                        )
-                    )
+                _destroy_component(comp)
 
     def get(self, class_name: type[T], qualifier: str | None = None) -> T:
         if (found_obj := self.find(class_name, qualifier)) is None:
@@ -341,26 +510,37 @@ class _Injector:
         return or_val if found_var is None else found_var
 
     def find(self, class_name: type[T], qualifier: str | None = None) -> T | None:
+        cache_key = (class_name, qualifier, self.__profile)
+        comp_cache = self.__comp_cache
+        location_cache = self.__location_cache
         # Try to get the component from the cache
-        found_obj = self.__comp_cache.get((class_name, qualifier))
+        found_obj = comp_cache.get(cache_key)
         if found_obj is not None:
             return cast(T, found_obj)
 
-        # Try to get the dependency using the active profile
-        found_obj, scope = self._get(class_name, qualifier)
-        if found_obj is None:
-            # or get it for the default profile
-            found_obj, scope = self._get(
-                class_name,
-                self.__get_component_key_with_profile(
-                    qualifier or self.__default_qualifier,
-                    self.__compute_default_profile(),
-                ),
-                True,
-            )
+        # Try to get the cached location of the dependency
+        location = location_cache.get(cache_key)
+        if location is None:
+            # Locate the dependency using the active profile
+            location = self.__locate(class_name, qualifier)
+            if location is None:
+                # or locate it for the default profile
+                location = self.__locate(
+                    class_name,
+                    self.__get_component_key_with_profile(
+                        qualifier or self.__default_qualifier,
+                        self.__compute_default_profile(),
+                    ),
+                    True,
+                )
+            if location is None:
+                return None
+            location_cache[cache_key] = location
+
+        found_obj, scope = self.__get_located(*location)
         # Store the object in cache if it's not None AND it is a Singleton
         if found_obj is not None and scope == Scope.SINGLETON:
-            self.__comp_cache[(class_name, qualifier)] = found_obj
+            comp_cache[cache_key] = found_obj
         return found_obj if found_obj is None else cast(T, found_obj)
 
     def find_or(
@@ -406,6 +586,7 @@ class _Injector:
         profiles: list[str] | None = None,
     ) -> _Injector:
         with self.provide_lock:
+            self.__invalidate_caches()
             if (var_dep := self.__variables.get(class_name)) is None:
                 var_dep = _VariableDependency()
                 self.__variables[class_name] = var_dep
@@ -458,6 +639,7 @@ class _Injector:
         scope: Scope = Scope.SINGLETON,
     ) -> _Injector:
         with self.provide_lock:
+            self.__invalidate_caches()
             if (container_dep := self.__components.get(class_name)) is None:
                 container_dep = _ContainerDependency()
                 self.__components[class_name] = container_dep
@@ -481,14 +663,33 @@ class _Injector:
         return self
 
     def _get_all(self, class_name: type[T]) -> list[T]:
+        self.__scan_packages()
+        if self.__lazy_modules:
+            # Import whatever may register the type, its subtypes or its base types
+            self.__import_lazy_modules(
+                self.__lazy_subtype_modules, f"{class_name.__module__}:{class_name.__qualname__}"
+            )
+            for path in type_paths(class_name):
+                self.__import_lazy_modules(self.__lazy_modules, path)
+        subtype_index = self.__subtype_index
+        candidates = subtype_index.get(class_name)
+        if candidates is None:
+            candidates = [
+                (key, dependency_key)
+                for key, dep in list(self.__components.items())
+                for dependency_key, dependency in list(
+                    dep.qualified_dependencies.items()
+                )
+                if self.__is_dependency_active(dependency_key)
+                and _may_hold_instance_of(dependency, class_name)
+            ]
+            subtype_index[class_name] = candidates
+
         elements: list[T] = []
-        for key in self.__components:
-            dep = self.__components[key]
-            for dependency_key in dep.qualified_dependencies:
-                if self.__is_dependency_active(dependency_key):
-                    comp, _ = self._get(key, dependency_key, True)
-                    if isinstance(comp, class_name):
-                        elements.append(comp)
+        for key, dependency_key in candidates:
+            comp, _ = self._get(key, dependency_key, True)
+            if isinstance(comp, class_name):
+                elements.append(comp)
         return elements
 
     def __is_dependency_active(self, dependency_key: str) -> bool:
@@ -539,19 +740,64 @@ class _Injector:
         qualifier: str | None,
         override_qualifier: bool = False,
     ) -> tuple[Any, Scope]:
-        self.__scan_packages()
-        if (container_dep := self.__components.get(class_name)) is None:
+        location = self.__locate(class_name, qualifier, override_qualifier)
+        if location is None:
             return None, Scope.SINGLETON
+        return self.__get_located(*location)
+
+    # Find where a component is registered in the container
+    def __locate(
+        self,
+        class_name: type,
+        qualifier: str | None,
+        override_qualifier: bool = False,
+    ) -> tuple[_ContainerDependency, str, Scope] | None:
+        self.__scan_packages()
+        container_dep = self.__components.get(class_name)
         full_qualifier = self.__get_full_qualifier(qualifier, override_qualifier)
+        if (
+            container_dep is None
+            or container_dep.qualified_dependencies.get(full_qualifier, None) is None
+        ):
+            if not self.__lazy_modules or not self.__import_lazy_modules(
+                self.__lazy_modules, f"{class_name.__module__}:{class_name.__qualname__}"
+            ):
+                return None
+            # The modules registering the type are now imported
+            container_dep = self.__components.get(class_name)
+            if (
+                container_dep is None
+                or container_dep.qualified_dependencies.get(full_qualifier, None)
+                is None
+            ):
+                return None
+        scope = container_dep.qualified_scopes.get(full_qualifier, Scope.SINGLETON)
+        return container_dep, full_qualifier, scope
+
+    def __get_located(
+        self,
+        container_dep: _ContainerDependency,
+        full_qualifier: str,
+        scope: Scope,
+    ) -> tuple[Any, Scope]:
         found_component = container_dep.qualified_dependencies.get(
             full_qualifier,
             None,
         )
-        scope = container_dep.qualified_scopes.get(full_qualifier, Scope.SINGLETON)
-
         if found_component is None:
             return None, Scope.SINGLETON
 
+        if scope in (Scope.REQUEST, Scope.THREAD) and is_mth_or_fn(found_component):
+            # Scoped components are created once per request or thread
+            instances = _scoped_instances(scope)
+            key = (container_dep, full_qualifier)
+            comp = instances.get(key)
+            if comp is None:
+                comp = instances.setdefault(
+                    key, self.__init_meta(found_component())  # type: ignore[operator]
+                )
+            return comp, scope
+
         # We've got a lazy component or a prototype
         if is_mth_or_fn(found_component):
             # We need to lock in the instantiation, so it will only happen once for singletons
@@ -580,21 +826,18 @@ class _Injector:
         return var_dep.qualified_variables.get(full_qualifier, None)
 
     def __init_meta(self, comp: Any) -> Any:
-        if isinstance(comp, AutoInit):
+        hooks = _lifecycle_hooks(type(comp))
+        if hooks.auto_init:
             comp.init()
-        if isinstance(comp, AutoStart):
+        if hooks.auto_start:
             comp.start()
 
         # Handle @post_construct
-        for name in dir(comp):
-            if name.startswith("__"):
-                continue
+        for name in hooks.post_construct:
             try:
-                attr = getattr(comp, name)
-                if callable(attr) and getattr(attr, "__post_construct__", False):
-                    attr()
-            except Exception:
-                pass
+                getattr(comp, name)()
+            except Exception as e:
+                print(f"Error executing post_construct on {name}: {e}")
         return comp
 
     def provide_dependencies(
@@ -650,12 +893,154 @@ class _Injector:
         """
         return Stream(self.all_of_type(class_name))
 
+    def warm_up(self, parallel: int = 1) -> dict[tuple[type, str | None], float]:
+        """
+        Eagerly instantiates all the lazy singletons available for the active profile.
+
+        The dependency graph of the singletons is built from the type hints of the
+        constructors of @component classes, the fields injected by @resolve/@resolve_all
+        and the arguments of @provide methods. Singletons are then created in dependency
+        order, with independent singletons created concurrently.
+
+        Args:
+            parallel (int, optional): The maximum number of singletons created concurrently. Defaults to 1.
+
+        Returns:
+            dict[tuple[type, str | None], float]: The construction time in seconds of each singleton,
+                keyed by the dependency class and qualifier
+        """
+        self.__scan_packages()
+        nodes: list[tuple[type, str]] = [
+            (class_name, full_qualifier)
+            for class_name, container_dep in list(self.__components.items())
+            for full_qualifier, comp in list(
+                container_dep.qualified_dependencies.items()
+            )
+            if is_mth_or_fn(comp)
+            and self.__is_dependency_active(full_qualifier)
+            and container_dep.qualified_scopes.get(full_qualifier, Scope.SINGLETON)
+            == Scope.SINGLETON
+        ]
+        # For each node, the nodes it depends on
+        dependencies: dict[tuple[type, str], set[tuple[type, str]]] = {}
+        for node in nodes:
+            required_types = _declared_dependencies(
+                self.__components[node[0]].qualified_dependencies[node[1]]
+            )
+            dependencies[node] = {
+                other
+                for other in nodes
+                if other != node
+                and any(_is_subclass(other[0], typ) for typ in required_types)
+            }
+
+        timings: dict[tuple[type, str | None], float] = {}
+
+        def create(node: tuple[type, str]) -> None:
+            start = time.perf_counter()
+            self._get(node[0], node[1], True)
+            timings[(node[0], self.__strip_profile(node[1]))] = (
+                time.perf_counter() - start
+            )
+
+        done: set[tuple[type, str]] = set()
+        remaining = list(nodes)
+        with ThreadPoolExecutor(
+            max_workers=max(parallel, 1), thread_name_prefix="jstreams-warm-up"
+        ) as executor:
+            running: dict[Future[None], tuple[type, str]] = {}
+            while remaining or running:
+                ready = [node for node in remaining if dependencies[node] <= done]
+                if not ready and not running:
+                    # Cyclic dependencies, create the rest in registration order
+                    ready = remaining[:1]
+                for node in ready:
+                    remaining.remove(node)
+                    running[executor.submit(create, node)] = node
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    done.add(running.pop(future))
+                    future.result()
+        return timings
+
+    def __strip_profile(self, full_qualifier: str) -> str | None:
+        for profile in (self.__default_profile, self.__profile):
+            if profile is not None and full_qualifier.startswith(profile):
+                qualifier = full_qualifier[len(profile) :]
+                return None if qualifier == self.__default_qualifier else qualifier
+        return full_qualifier
+
+
+def _is_subclass(typ: type, parent: type) -> bool:
+    try:
+        return issubclass(typ, parent)
+    except TypeError:
+        return False
+
 
-Injector = _Injector.get_instance()
+def _hinted_types(fn: Any) -> list[type]:
+    try:
+        hints = get_type_hints(inspect.unwrap(fn))
+    except Exception:
+        return []
+    types: list[type] = []
+    for name, hint in hints.items():
+        if name == "return":
+            continue
+        # Unwrap Optional and Union hints
+        for typ in get_args(hint) or (hint,):
+            if isinstance(typ, type) and typ is not type(None):
+                types.append(typ)
+    return types
+
+
+def _declared_dependencies(factory: Any) -> list[type]:
+    # Factories created by @component and @provide keep a reference to the
+    # class or function they were created from
+    source = getattr(factory, "__jstreams_source__", None)
+    if source is None:
+        return []
+    if isinstance(source, type):
+        return _hinted_types(source.__init__) + [
+            attr.dependency_type()
+            for attr in vars(source).values()
+            if isinstance(attr, _InjectedField) and attr.dependency_type() is not None
+        ]
+    return _hinted_types(source)
+
+
+def _may_hold_instance_of(dependency: Any, requested_type: type) -> bool:
+    # Instances are checked against their actual class, as the type they are
+    # registered for may be only one of the types they implement
+    if not is_mth_or_fn(dependency):
+        return isinstance(dependency, requested_type)
+    # A factory is only skipped when its return annotation rules out the requested
+    # type. Without one, it may produce any subclass of the registered type, so it
+    # is called and its result checked.
+    try:
+        produced_type = get_type_hints(dependency).get("return")
+    except Exception:
+        return True
+    if produced_type is None:
+        return True
+    try:
+        return issubclass(produced_type, requested_type) or issubclass(
+            requested_type, produced_type
+        )
+    except TypeError:
+        # Not a class, so the relationship cannot be determined
+        return True
 
 
 def injector() -> _Injector:
-    return Injector
+    # The container is created on first use rather than at import time
+    return _Injector.instance or _Injector.get_instance()
+
+
+def __getattr__(name: str) -> Any:
+    if name == "Injector":
+        return injector()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def inject(class_name: type[T], qualifier: str | None = None) -> T:
@@ -713,12 +1098,25 @@ def component(
     """
 
     def wrap(cls: type[T]) -> type[T]:
+        # Recorded regardless of the condition, which is evaluated again when the
+        # module is imported on behalf of a manifest
+        record_component(
+            class_name if class_name is not None else cls,
+            cls,
+            qualifier,
+            profiles,
+            scope,
+        )
         if condition is not None and not condition():
             return cls
 
+        def factory() -> T:
+            return cls()
+
+        setattr(factory, "__jstreams_source__", cls)
         injector().provide(
             class_name if class_name is not None else cls,
-            cls() if strategy == Strategy.EAGER else lambda: cls(),
+            cls() if strategy == Strategy.EAGER else factory,
             qualifier,
             profiles,
             scope,
@@ -802,16 +1200,19 @@ def provide(
 
     def wrapper(func: Callable[..., T]) -> Callable[..., None]:
         def wrapped(*args: Any, **kwds: Any) -> None:
-            if condition is not None and not condition():
-                return
-
             profiles: list[str] | None = None
             if "profiles" in kwds:
                 profiles = kwds.pop("profiles")
 
-            injector().provide(
-                class_name, lambda: func(*args), qualifier, profiles, scope
-            )
+            record_component(class_name, func, qualifier, profiles, scope)
+            if condition is not None and not condition():
+                return
+
+            def factory() -> T:
+                return func(*args)
+
+            setattr(factory, "__jstreams_source__", func)
+            injector().provide(class_name, factory, qualifier, profiles, scope)
 
         return wrapped
 
@@ -881,6 +1282,89 @@ def resolve_dependencies(
     return resolve(cast(dict[str, type | Dependency | Variable], dependencies), eager)
 
 
+class _InjectedField:
+    """
+    Descriptor resolving a class level dependency on first access. Once the dependency
+    is resolved, the descriptor replaces itself on the class with the resolved value,
+    so subsequent accesses are plain attribute lookups.
+    """
+
+    __slots__ = ("__plan", "__name", "__dependency")
+
+    def __init__(
+        self,
+        plan: _InjectionPlan,
+        name: str,
+        dependency: type | Dependency | Variable,
+    ) -> None:
+        self.__plan = plan
+        self.__name = name
+        self.__dependency = dependency
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        if self.__plan.eager:
+            self.__plan.resolve_all()
+        return self.resolve()
+
+    def dependency_type(self) -> type | None:
+        if isinstance(self.__dependency, Variable):
+            return None
+        if isinstance(self.__dependency, Dependency):
+            return self.__dependency.get_type()
+        return self.__dependency
+
+    def is_pending(self) -> bool:
+        # Another thread may have already resolved the field and replaced the descriptor
+        return self.__plan.cls.__dict__.get(self.__name) is self
+
+    def resolve(self) -> Any:
+        dep = _get_dep(self.__dependency)
+        if dep is not None and self.is_pending():
+            setattr(self.__plan.cls, self.__name, dep)
+        return dep
+
+
+class _InjectionPlan:
+    """
+    Per class injection plan, built at decoration time.
+    """
+
+    __slots__ = ("cls", "eager", "fields")
+
+    def __init__(self, cls: type, eager: bool) -> None:
+        self.cls = cls
+        self.eager = eager
+        self.fields: list[_InjectedField] = []
+
+    def resolve_all(self) -> None:
+        for field in self.fields:
+            if field.is_pending():
+                field.resolve()
+
+
+def _install_injection_plan(
+    cls: type, dependencies: dict[str, type | Dependency | Variable], eager: bool
+) -> None:
+    plan = _InjectionPlan(cls, eager)
+    for attr_name, dependency in dependencies.items():
+        field = _InjectedField(plan, attr_name, dependency)
+        plan.fields.append(field)
+        setattr(cls, attr_name, field)
+    if eager:
+        original_get_attribute = cls.__getattribute__
+
+        def __getattribute__(self: Any, attr_name: str) -> Any:
+            # The first access to any attribute resolves all the dependencies, then
+            # attribute lookups go back to normal
+            plan.resolve_all()
+            cls.__getattribute__ = original_get_attribute  # type: ignore[method-assign]
+            return original_get_attribute(self, attr_name)
+
+        cls.__getattribute__ = __getattribute__  # type: ignore[method-assign]
+
+
 def resolve(
     dependencies: dict[str, type | Dependency | Variable],
     eager: bool = False,
@@ -910,29 +1394,7 @@ def resolve(
     validate_dependencies(dependencies)
 
     def wrap(cls: type[T]) -> type[T]:
-        original_get_attribute = cls.__getattribute__
-
-        def __getattribute__(self, attr_name: str) -> Any:  # type: ignore[no-untyped-def]
-            if eager:
-                for attr, quali in dependencies.items():
-                    setattr(cls, attr, _get_dep(quali))
-                    cls.__getattribute__ = original_get_attribute  # type: ignore[method-assign]
-                    return getattr(cls, attr_name)
-            else:
-                if attr_name in dependencies:
-                    quali = dependencies.get(attr_name, NoOpCls)
-                    dep = _get_dep(quali)
-                    if dep is not None:
-                        # If a dependency has been resolved, set it as an attribute of the class
-                        setattr(cls, attr_name, dep)
-                        # The remove it from the dependencies map
-                        dependencies.pop(attr_name)
-                        if len(dependencies) == 0:
-                            cls.__getattribute__ = original_get_attribute  # type: ignore[method-assign]
-                    return dep
-            return original_get_attribute(self, attr_name)
-
-        cls.__getattribute__ = __getattribute__  # type: ignore[method-assign]
+        _install_injection_plan(cls, dependencies, eager)
         return cls
 
     return wrap
@@ -1047,51 +1509,101 @@ def inject_args(
 
     def wrapper(func: Callable[..., T]) -> Callable[..., T]:
         sig = inspect.signature(func)
+        params = sig.parameters
+        positional_kinds = (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        )
+        positional_names = [
+            name for name, param in params.items() if param.kind in positional_kinds
+        ]
+        # The names of the positional arguments that may also be passed by keyword
+        positional_keywords = tuple(
+            name
+            if params[name].kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
+            else None
+            for name in positional_names
+        )
+        has_var_positional = any(
+            param.kind == inspect.Parameter.VAR_POSITIONAL for param in params.values()
+        )
+        has_var_keyword = any(
+            param.kind == inspect.Parameter.VAR_KEYWORD for param in params.values()
+        )
+        keyword_names = frozenset(
+            name
+            for name, param in params.items()
+            if param.kind != inspect.Parameter.POSITIONAL_ONLY
+        )
+        max_positional = None if has_var_positional else len(positional_names)
+        # The injection plan: for each injectable argument, its name, the position at which
+        # it may be passed positionally (or None) and the dependency to resolve. Arguments
+        # having defaults are considered provided, so they are never injected.
+        plan: list[tuple[str, int | None, type | Dependency | Variable]] = [
+            (
+                param_name,
+                positional_names.index(param_name)
+                if param_name in positional_names
+                else None,
+                dep_info,
+            )
+            for param_name, dep_info in dependencies.items()
+            if param_name not in params
+            or params[param_name].default is inspect.Parameter.empty
+        ]
 
-        def wrapped(*args: Any, **kwds: Any) -> T:
+        def bind_error(args: tuple[Any, ...], kwds: dict[str, Any]) -> Exception:
             try:
-                # Bind provided arguments to see what's missing
-                # Use bind_partial as not all args might be provided yet (we inject the rest)
-                bound_args = sig.bind_partial(*args, **kwds)
-                # Consider arguments with defaults as "provided" for injection purposes
-                bound_args.apply_defaults()
+                sig.bind_partial(*args, **kwds)
             except TypeError as e:
-                # Reraise if basic binding fails (e.g., too many positional args)
-                raise TypeInjectionError(
+                return TypeInjectionError(
                     f"Error binding arguments for {func.__qualname__}: {e}"
-                ) from e
-
-            # Prepare keyword arguments for injection
-            injected_kwds = {}
-            for param_name, dep_info in dependencies.items():
-                # Check if the argument was already provided by the caller or has a default
-                if param_name not in bound_args.arguments:
-                    try:
-                        # Resolve the dependency/variable
-                        resolved_dep = _get_dep(dep_info)
-                        injected_kwds[param_name] = resolved_dep
-                    except ValueError as e:
-                        # Dependency not found - re-raise with more context
-                        raise ValueInjectionError(
-                            f"Failed to inject argument '{param_name}' for {func.__qualname__}: {e}"
-                        ) from e
-                    except Exception as e:
-                        # Catch other potential errors during resolution
-                        raise RuntimeError(
-                            f"Unexpected error injecting argument '{param_name}' for {func.__qualname__}: {e}"
-                        ) from e
-
-            # Combine original kwds and injected kwds.
-            # Caller's explicit kwds take precedence over injected ones.
-            final_kwds = {**injected_kwds, **kwds}
-
-            # Call the original function with original args and combined kwds
-            return func(*args, **final_kwds)
+                )
+            return TypeInjectionError(
+                f"Error binding arguments for {func.__qualname__}"
+            )
+
+        def wrapped(*args: Any, **kwds: Any) -> T:
+            # Cheap checks for calls that cannot be bound to the signature
+            if max_positional is not None and len(args) > max_positional:
+                raise bind_error(args, kwds)
+            if kwds and not has_var_keyword and not keyword_names.issuperset(kwds):
+                raise bind_error(args, kwds)
+            if (
+                kwds
+                and args
+                and not kwds.keys().isdisjoint(positional_keywords[: len(args)])
+            ):
+                # An argument given both positionally and by keyword
+                raise bind_error(args, kwds)
+
+            for param_name, position, dep_info in plan:
+                # Check if the argument was already provided by the caller
+                if param_name in kwds or (
+                    position is not None and position < len(args)
+                ):
+                    continue
+                try:
+                    # Resolve the dependency/variable
+                    kwds[param_name] = _get_dep(dep_info)
+                except ValueError as e:
+                    # Dependency not found - re-raise with more context
+                    raise ValueInjectionError(
+                        f"Failed to inject argument '{param_name}' for {func.__qualname__}: {e}"
+                    ) from e
+                except Exception as e:
+                    # Catch other potential errors during resolution
+                    raise RuntimeError(
+                        f"Unexpected error injecting argument '{param_name}' for {func.__qualname__}: {e}"
+                    ) from e
+
+            return func(*args, **kwds)
 
         # Preserve original function metadata for introspection and debugging
         wrapped.__name__ = func.__name__
         wrapped.__qualname__ = func.__qualname__
         wrapped.__doc__ = func.__doc__
+        setattr(wrapped, "__wrapped__", func)
 
         return wrapped
 
@@ -1510,7 +2022,6 @@ def resolve_all(eager: bool = False) -> Callable[[type[T]], type[T]]:
     """
 
     def wrap(cls: type[T]) -> type[T]:
-        original_get_attribute = cls.__getattribute__
         dependencies_list = _get_class_attributes(cls)
         dependencies: dict[str, type | Dependency | Variable] = {}
         for element in dependencies_list:
@@ -1520,27 +2031,7 @@ def resolve_all(eager: bool = False) -> Callable[[type[T]], type[T]]:
                 else OptionalDependency(element.element_type)
             )
 
-        def __getattribute__(self, attr_name: str) -> Any:  # type: ignore[no-untyped-def]
-            if eager:
-                for attr, quali in dependencies.items():
-                    setattr(cls, attr, _get_dep(quali))
-                    cls.__getattribute__ = original_get_attribute  # type: ignore[method-assign]
-                    return getattr(cls, attr_name)
-            else:
-                if attr_name in dependencies:
-                    quali = dependencies.get(attr_name, NoOpCls)
-                    dep = _get_dep(quali)
-                    if dep is not None:
-                        # If a dependency has been resolved, set it as an attribute of the class
-                        setattr(cls, attr_name, dep)
-                        # Then remove it from the dependencies map
-                        dependencies.pop(attr_name)
-                        if len(dependencies) == 0:
-                            cls.__getattribute__ = original_get_attribute  # type: ignore[method-assign]
-                    return dep
-            return original_get_attribute(self, attr_name)
-
-        cls.__getattribute__ = __getattribute__  # type: ignore[method-assign]
+        _install_injection_plan(cls, dependencies, eager)
         return cls
 
     return wrap
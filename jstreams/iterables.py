@@ -4,9 +4,9 @@ from itertools import dropwhile, islice, takewhile
 import itertools
 import sys
 from typing import Any, Generic, TypeVar, cast
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from jstreams.mapper import Mapper
-from jstreams.predicate import not_strict, _extract_predicate_fn
+from jstreams.predicate import batch_function, not_strict, _extract_predicate_fn
 from jstreams.tuples import Pair
 from jstreams.utils import require_non_null
 
@@ -44,14 +44,42 @@ def _extract_mapper_fn(mapper: Callable[[T], V]) -> Callable[[T], V]:
     return mapper
 
 
+# Number of values tested at once by predicates that have a batch form
+# Batch filtering starts with small chunks, doubled up to the maximum size, so that
+# short-circuiting consumers such as first() only test a few values ahead
+FILTER_FIRST_CHUNK_SIZE = 8
+FILTER_CHUNK_SIZE = 1024
+
+
+def _filter_chunks(
+    items: Sequence[T], test_many: Callable[[Sequence[T]], Any]
+) -> Iterator[T]:
+    start = 0
+    size = FILTER_FIRST_CHUNK_SIZE
+    total = len(items)
+    while start < total:
+        chunk = items[start : start + size]
+        yield from itertools.compress(chunk, test_many(chunk))
+        start += size
+        size = min(size * 2, FILTER_CHUNK_SIZE)
+
+
 class FilterIterable(GenericIterable[T]):
-    __slots__ = ("__predicate",)
+    __slots__ = ("__predicate", "__test_many")
 
     def __init__(self, it: Iterable[T], predicate: Callable[[T], bool]) -> None:
         super().__init__(it)
         self.__predicate = _extract_predicate_fn(predicate)
+        self.__test_many = batch_function(predicate)
 
     def __iter__(self) -> Iterator[V]:
+        # Sequences are filtered in chunks by predicates with a batch form, so the
+        # predicate may test up to a chunk of values past the last one consumed.
+        # Other iterables, and other predicates, are never read ahead.
+        if self.__test_many is not None and isinstance(
+            self._iterable, (list, tuple, range)
+        ):
+            return _filter_chunks(self._iterable, self.__test_many)  # type: ignore[return-value]
         return filter(self.__predicate, self._iterable)  # type: ignore[arg-type]
 
 
@@ -0,0 +1,260 @@
+"""
+Ahead-of-time component scan manifests.
+
+Scanning a package list (``JSTREAMS_PACKAGES`` or ``scan_modules``) imports every module
+up front, only to execute the ``@component``, ``@provide`` and scheduling decorators
+they contain. ``build_manifest`` performs that scan once, as a build step, and records
+the registrations it observes:
+
+    python -m jstreams.manifest -o jstreams-manifest.json my_app.services my_app.jobs
+
+At startup, ``load_manifest`` (or the ``JSTREAMS_MANIFEST`` setting) replaces the scan:
+the injector learns which module registers each type and imports it only when that
+type is first requested, while scheduled jobs are registered right away with a proxy
+that imports the job function on its first run.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+from collections.abc import Callable
+from typing import Any
+
+MANIFEST_VERSION = 1
+
+
+class _LazyJobFunction:
+    """
+    Stand-in for a scheduled function that is only imported when the job first runs.
+    """
+
+    __slots__ = ("__module", "__qualname", "__func", "__name__")
+
+    def __init__(self, module: str, qualname: str, name: str) -> None:
+        self.__module = module
+        self.__qualname = qualname
+        self.__func: Callable[[], Any] | None = None
+        self.__name__ = name
+
+    def __call__(self) -> Any:
+        if self.__func is None:
+            self.__func = _resolve(self.__module, self.__qualname)
+        return self.__func()
+
+
+class _ManifestRecorder:
+    __slots__ = ("components", "jobs")
+
+    def __init__(self) -> None:
+        self.components: list[dict[str, Any]] = []
+        self.jobs: list[dict[str, Any]] = []
+
+
+# Active while build_manifest imports the scanned modules
+_recorder: _ManifestRecorder | None = None
+# (module, qualname) of the jobs scheduled from a loaded manifest. Importing their
+# module later must not schedule them a second time.
+_manifest_jobs: set[tuple[str, str]] = set()
+
+
+def _path(obj: Any) -> str:
+    return f"{obj.__module__}:{obj.__qualname__}"
+
+
+def _resolve(module: str, qualname: str) -> Any:
+    obj: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def type_paths(class_name: type) -> list[str]:
+    """
+    Returns the import paths ("module:qualname") of a type and of all its base classes,
+    as recorded in a manifest.
+    """
+    return [_path(base) for base in getattr(class_name, "__mro__", (class_name,))]
+
+
+def record_component(
+    class_name: type,
+    source: Callable[..., Any],
+    qualifier: str | None,
+    profiles: list[str] | None,
+    scope: Any,
+) -> None:
+    if _recorder is None:
+        return
+    _recorder.components.append(
+        {
+            "type": _path(class_name),
+            "bases": [
+                path for path in type_paths(class_name) if path != "builtins:object"
+            ],
+            "qualifier": qualifier,
+            "profiles": profiles,
+            "scope": scope.name,
+            "module": source.__module__,
+            "factory": _path(source),
+        }
+    )
+
+
+def record_job(func: Callable[..., Any], kind: str, **arguments: Any) -> None:
+    if _recorder is None:
+        return
+    callbacks = (arguments.pop("on_success", None), arguments.pop("on_error", None))
+    has_callbacks = any(callback is not None for callback in callbacks)
+    _recorder.jobs.append(
+        {
+            "module": func.__module__,
+            "function": func.__qualname__,
+            "name": func.__name__,
+            "kind": kind,
+            "arguments": arguments,
+            # Callbacks cannot be stored in the manifest, and local functions cannot
+            # be imported by name, so such jobs are scheduled by importing their module
+            "eager": has_callbacks or "<locals>" in func.__qualname__,
+        }
+    )
+
+
+def skip_scheduling(func: Callable[..., Any]) -> bool:
+    """
+    Checks if a scheduling decorator should leave the given function unscheduled, either
+    because a manifest is being built, or because the function was already scheduled
+    from a loaded manifest.
+    """
+    return _recorder is not None or (func.__module__, func.__qualname__) in _manifest_jobs
+
+
+def build_manifest(modules: list[str], path: str | None = None) -> dict[str, Any]:
+    """
+    Imports the given modules and records every component, provided bean and scheduled job
+    registered while they load. Modules imported before this call do not execute their
+    decorators again, so the manifest should be built in a fresh interpreter, as done
+    when running `python -m jstreams.manifest`.
+
+    Args:
+        modules (list[str]): The modules to scan
+        path (str | None, optional): The file the manifest is written to. Defaults to None.
+
+    Returns:
+        dict[str, Any]: The manifest
+    """
+    global _recorder  # pylint: disable=global-statement
+    recorder = _ManifestRecorder()
+    _recorder = recorder
+    try:
+        for module in modules:
+            importlib.import_module(module)
+    finally:
+        _recorder = None
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "modules": list(modules),
+        "components": recorder.components,
+        "jobs": recorder.jobs,
+    }
+    if path is not None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def read_manifest(path: str) -> dict[str, Any]:
+    """
+    Reads a manifest file written by `build_manifest`.
+
+    Raises:
+        ValueError: If the file was written by an incompatible version.
+    """
+    with open(path, encoding="utf-8") as f:
+        manifest: dict[str, Any] = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(
+            f"Unsupported manifest version {manifest.get('version')} in {path}"
+        )
+    return manifest
+
+
+def schedule_manifest_jobs(manifest: dict[str, Any]) -> None:
+    """
+    Schedules the jobs recorded in the given manifest. Called by `scheduler().load_manifest`.
+    """
+    from jstreams.scheduler import scheduler  # pylint: disable=import-outside-toplevel
+
+    lazy_jobs = []
+    for job in manifest["jobs"]:
+        key = (job["module"], job["function"])
+        if not job["eager"] and key not in _manifest_jobs:
+            _manifest_jobs.add(key)
+            lazy_jobs.append(job)
+    # Jobs of eagerly imported modules that are listed in the manifest are left to the
+    # lazy proxies, since their keys are known before the import
+    for job in manifest["jobs"]:
+        if job["eager"]:
+            importlib.import_module(job["module"])
+
+    for job in lazy_jobs:
+        func = _LazyJobFunction(job["module"], job["function"], job["name"])
+        arguments = job["arguments"]
+        if job["kind"] == "daily":
+            scheduler().schedule_daily(func, arguments["hour"], arguments["minute"])
+        elif job["kind"] == "hourly":
+            scheduler().schedule_hourly(func, arguments["minute"])
+        else:
+            scheduler().schedule_periodic(
+                func, arguments["period"], arguments["one_time"]
+            )
+
+
+def load_manifest(path: str) -> None:
+    """
+    Registers the components and scheduled jobs recorded in a manifest file, instead
+    of scanning the modules they were recorded from.
+
+    Args:
+        path (str): The manifest file
+    """
+    from jstreams.ioc import injector  # pylint: disable=import-outside-toplevel
+    from jstreams.scheduler import scheduler  # pylint: disable=import-outside-toplevel
+
+    injector().load_manifest(path)
+    scheduler().load_manifest(path)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m jstreams.manifest",
+        description="Records the components and scheduled jobs of the given modules",
+    )
+    parser.add_argument("modules", nargs="*", help="Modules to scan")
+    parser.add_argument(
+        "-o", "--output", default="jstreams-manifest.json", help="Manifest file"
+    )
+    args = parser.parse_args(argv)
+    modules = args.modules
+    if not modules:
+        from jstreams.environment import (  # pylint: disable=import-outside-toplevel
+            JStreamsEnv,
+        )
+
+        env = JStreamsEnv()
+        env.initialize()
+        modules = env.get_packages() or []
+    manifest = build_manifest(modules, args.output)
+    print(
+        f"Recorded {len(manifest['components'])} components and "
+        f"{len(manifest['jobs'])} jobs to {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    # The decorators record into the imported module, not into __main__
+    from jstreams.manifest import main as _main
+
+    _main()
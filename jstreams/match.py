@@ -1,11 +1,20 @@
-from typing import Generic, TypeVar, final, overload
-from collections.abc import Callable
+from enum import Enum
+from typing import Any, Generic, TypeVar, final, overload
+from collections.abc import Callable, Iterable
 from jstreams.stream import Opt
 from jstreams.predicate import Predicate, _extract_predicate_fn
 
 T = TypeVar("T")
 V = TypeVar("V")
 
+# Matcher only indexes values of these types, and Enum members, whose hash is
+# consistent with their equality, so that indexed lookups behave exactly like ==
+_INDEXABLE_TYPES = frozenset((str, int, bool))
+
+
+def _is_indexable(value: Any) -> bool:
+    return type(value) in _INDEXABLE_TYPES or isinstance(value, Enum)
+
 
 @final
 class Case(Generic[T, V]):
@@ -16,7 +25,7 @@ class Case(Generic[T, V]):
     or a Predicate object) and a resulting value or supplier function.
     """
 
-    __slots__ = ("__matching", "__resulting")
+    __slots__ = ("__matching", "__resulting", "__is_predicate")
 
     def __init__(
         self,
@@ -34,10 +43,9 @@ class Case(Generic[T, V]):
                         - If a value, it's returned directly.
                         - If a callable, it's invoked to produce the result.
         """
+        self.__is_predicate = callable(matching) or isinstance(matching, Predicate)
         self.__matching = (
-            _extract_predicate_fn(matching)
-            if (callable(matching) or isinstance(matching, Predicate))
-            else matching
+            _extract_predicate_fn(matching) if self.__is_predicate else matching
         )
         self.__resulting = resulting
 
@@ -51,12 +59,24 @@ class Case(Generic[T, V]):
         Returns:
             True if the value matches the condition, False otherwise.
         """
-        match_condition = self.__matching
-        if callable(match_condition):
+        if self.__is_predicate:
             # If it's a Predicate function, apply it to the value
-            return match_condition(value)
+            return self.__matching(value)  # type: ignore[operator]
         # Otherwise, perform direct equality check
-        return value == match_condition
+        return value == self.__matching
+
+    def is_predicate(self) -> bool:
+        """
+        Returns True if this case matches values using a predicate, False if it
+        matches values equal to its matching value.
+        """
+        return self.__is_predicate
+
+    def matching_value(self) -> Any:
+        """
+        Returns the value or predicate function this case matches against.
+        """
+        return self.__matching
 
     def result(self) -> V:
         """
@@ -592,6 +612,8 @@ class Match(Generic[T]):
         The cases are evaluated in the order they are provided. The evaluation stops
         as soon as a matching case is found (short-circuiting).
 
+        To apply a long list of cases to many values, build a Matcher once instead.
+
         Args:
             cases: The list of cases
 
@@ -642,6 +664,105 @@ class Match(Generic[T]):
         )
 
 
+@final
+class Matcher(Generic[T, V]):
+    """
+    A list of cases compiled once, then applied to any number of values.
+
+    The cases matching str, int, bool or Enum values are indexed in a hash table, so
+    finding them does not depend on the number of cases. Predicate cases, and the
+    cases matching other values, are kept in order as fallbacks. Values of other
+    types, such as floats, are matched by evaluating every case in order, so the
+    result is always the one of the first matching case, exactly as with `Match`.
+
+    Example:
+        route = matcher(
+            case("order", handle_order),
+            case("refund", handle_refund),
+            case(str_starts_with("audit."), handle_audit),
+            default_case(handle_unknown),
+        )
+        handler = route.of(message.type)
+    """
+
+    __slots__ = ("__cases", "__index", "__fallbacks")
+
+    def __init__(self, cases: Iterable[Case[T, V] | None]) -> None:
+        """
+        Compiles the given cases. None entries are ignored.
+
+        Args:
+            cases: The cases, in evaluation order.
+        """
+        self.__cases: list[Case[T, V]] = [c for c in cases if c is not None]
+        # Position of the first case matching each indexable equality value
+        self.__index: dict[Any, int] = {}
+        # Positions and cases that must be evaluated in order
+        self.__fallbacks: list[tuple[int, Case[T, V]]] = []
+        for position, case_item in enumerate(self.__cases):
+            if not case_item.is_predicate() and _is_indexable(
+                case_item.matching_value()
+            ):
+                self.__index.setdefault(case_item.matching_value(), position)
+            else:
+                self.__fallbacks.append((position, case_item))
+
+    def __find(self, value: T) -> Case[T, V] | None:
+        if not _is_indexable(value):
+            # Other values may compare equal to indexed values of another type
+            for case_item in self.__cases:
+                if case_item.matches(value):
+                    return case_item
+            return None
+        indexed = self.__index.get(value, len(self.__cases))
+        # A fallback case placed before the indexed case takes precedence
+        for position, case_item in self.__fallbacks:
+            if position > indexed:
+                break
+            if case_item.matches(value):
+                return case_item
+        if indexed < len(self.__cases):
+            return self.__cases[indexed]
+        return None
+
+    def opt(self, value: T) -> Opt[V]:
+        """
+        Returns an Opt containing the result of the first case matching the value,
+        or an empty Opt if no case matches.
+        """
+        case_item = self.__find(value)
+        if case_item is None:
+            return Opt.empty()
+        return Opt(case_item.result())
+
+    def of(self, value: T) -> V | None:
+        """
+        Returns the result of the first case matching the value, or None if no case
+        matches.
+        """
+        case_item = self.__find(value)
+        if case_item is None:
+            return None
+        return case_item.result()
+
+    def of_exhaustive(self, value: T) -> V:
+        """
+        Returns the result of the first case matching the value.
+
+        Raises:
+            ValueError: If no case matches the value.
+        """
+        case_item = self.__find(value)
+        if case_item is None:
+            raise ValueError(
+                f"No case matched value: {value}. Match was not exhaustive."
+            )
+        return case_item.result()
+
+    def __call__(self, value: T) -> V | None:
+        return self.of(value)
+
+
 # --- Factory Functions ---
 
 
@@ -686,6 +807,26 @@ def match(value: T) -> Match[T]:
     return Match(value)
 
 
+def matcher(*cases: Case[T, V] | None) -> Matcher[T, V]:
+    """
+    Factory function compiling cases into a reusable Matcher.
+
+    Syntactic sugar for `Matcher(cases)`.
+
+    Example:
+        to_name = matcher(case(1, "one"), case(2, "two"), default_case("many"))
+        to_name.of(2)  # "two"
+        to_name.of(7)  # "many"
+
+    Args:
+        cases: The cases, in evaluation order.
+
+    Returns:
+        A new Matcher[T, V] instance.
+    """
+    return Matcher(cases)
+
+
 def match_opt(value: T | None) -> Match[T | None]:
     """
     Factory function to start a match expression specifically for an Optional value.
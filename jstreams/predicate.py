@@ -1,6 +1,10 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+import operator
 import re
+import sys
+from itertools import compress
+from time import perf_counter
 from typing import (
     Any,
     TypeVar,
@@ -31,10 +35,37 @@ class Predicate(ABC, Generic[T]):
         """
 
     def or_(self, other: Callable[[T], bool]) -> Predicate[T]:
-        return Predicate.of(lambda v: self.apply(v) or predicate_of(other).apply(v))
+        return _combine(_AnyPredicate, (self, other))
 
     def and_(self, other: Callable[[T], bool]) -> Predicate[T]:
-        return Predicate.of(lambda v: self.apply(v) and predicate_of(other).apply(v))
+        return _combine(_AllPredicate, (self, other))
+
+    def test_many(self, values: Iterable[T]) -> Any:
+        """
+        Tests all the given values, using the batch form of the predicate if it has one.
+        See `apply_many`.
+
+        Args:
+            values (Iterable[T]): The values
+
+        Returns:
+            list[bool] | numpy.ndarray: The result for each value
+        """
+        return apply_many(self, values)
+
+    def compile(self, sample: Iterable[T] | None = None) -> Predicate[T]:
+        """
+        Optimizes and compiles this predicate into a single function.
+        See `compile_predicate`.
+
+        Args:
+            sample (Iterable[T] | None, optional): Representative values used to reorder
+                the terms of the predicate. Defaults to None.
+
+        Returns:
+            Predicate[T]: The compiled predicate
+        """
+        return compile_predicate(self, sample)
 
     def __call__(self, value: T) -> bool:
         return self.apply(value)
@@ -109,6 +140,10 @@ class _WrapPredicate(Predicate[T]):
     def apply(self, value: T) -> bool:
         return self.__predicate_fn(value)
 
+    @property
+    def fn(self) -> Callable[[T], bool]:
+        return self.__predicate_fn
+
 
 class _WrapPredicateWith(PredicateWith[T, K]):
     __slots__ = ("__predicate_fn",)
@@ -150,6 +185,75 @@ def predicate_with_of(
     return PredicateWith.of(predicate)
 
 
+def _with_batch(
+    predicate: Callable[[T], bool], batch: Callable[[Any], Any]
+) -> Callable[[T], bool]:
+    """
+    Attaches the batch form of a predicate, testing a sequence of values at once, as
+    its test_many attribute. Calling the predicate itself is not slowed down.
+    """
+    setattr(predicate, "test_many", batch)
+    return predicate
+
+
+def _is_numeric_array(values: Any) -> bool:
+    # NumPy is optional: arrays are recognized without importing it
+    return type(values).__module__ == "numpy" and getattr(
+        getattr(values, "dtype", None), "kind", None
+    ) in ("i", "u", "f", "b")
+
+
+def batch_function(predicate: Callable[[T], bool]) -> Callable[[Any], Any] | None:
+    """
+    Returns the batch form of a predicate, or None if the predicate can only test
+    values one at a time. The built-in predicates such as is_in, equals, str_matches,
+    is_between or is_higher_than, and their combinations, have a batch form.
+
+    Args:
+        predicate (Callable[[T], bool]): The predicate
+
+    Returns:
+        Callable[[Any], Any] | None: The function testing a sequence of values
+    """
+    if isinstance(predicate, _WrapPredicate):
+        return batch_function(predicate.fn)
+    if isinstance(predicate, _CompositePredicate):
+        if all(batch_function(term) is not None for term in predicate.terms):
+            return predicate.test_many
+        return None
+    if isinstance(predicate, _NotPredicate):
+        if batch_function(predicate.term) is not None:
+            return predicate.test_many
+        return None
+    if isinstance(predicate, _ConstantPredicate):
+        return predicate.test_many
+    if isinstance(predicate, Predicate):
+        # Subclasses can provide their own batch form
+        if type(predicate).test_many is not Predicate.test_many:
+            return predicate.test_many
+        return None
+    return cast(Callable[[Any], Any] | None, getattr(predicate, "test_many", None))
+
+
+def apply_many(predicate: Callable[[T], bool], values: Iterable[T]) -> Any:
+    """
+    Tests all the given values against a predicate, using its batch form if it has one.
+    For a NumPy array of numbers, the numeric predicates return a boolean array.
+
+    Args:
+        predicate (Callable[[T], bool]): The predicate
+        values (Iterable[T]): The values
+
+    Returns:
+        list[bool] | numpy.ndarray: The result for each value
+    """
+    batch = batch_function(predicate)
+    if batch is not None:
+        return batch(values)
+    fn = _extract_predicate_fn(predicate)
+    return [True if fn(value) else False for value in values]
+
+
 def is_true(var: bool) -> bool:
     """
     Returns the same value. Meant to be used as a predicate for filtering.
@@ -189,6 +293,9 @@ def is_none(val: Any) -> bool:
     return val is None
 
 
+_with_batch(is_none, lambda values: [val is None for val in values])
+
+
 def is_in(it: Iterable[Any]) -> Callable[[Any], bool]:
     """
     Predicate to check if a value is contained in an iterable.
@@ -204,14 +311,17 @@ def is_in(it: Iterable[Any]) -> Callable[[Any], bool]:
     # Convert to set for O(1) average lookup if 'it' is a list or tuple
     # and its elements are hashable. This optimizes repeated lookups.
 
+    lookup: Any = it
     if isinstance(it, (list, tuple)):
         try:
-            lookup_set = set(it)
-            return lambda elem: elem in lookup_set
+            lookup = frozenset(it)
         except TypeError:  # Fallback if elements are not hashable
-            return lambda elem: elem in it
+            pass
 
-    return lambda elem: elem in it
+    return _with_batch(
+        lambda elem: elem in lookup,
+        lambda values: list(map(lookup.__contains__, values)),
+    )
 
 
 def is_not_in(it: Iterable[Any]) -> Callable[[Any], bool]:
@@ -247,7 +357,12 @@ def equals(obj: T) -> Callable[[T], bool]:
         # Handles None comparison explicitly
         return (obj is None and other is None) or (obj == other)
 
-    return wrap
+    def test_many(values: Iterable[T]) -> list[bool]:
+        if obj is None:
+            return [other is None for other in values]
+        return [True if obj == other else False for other in values]
+
+    return _with_batch(wrap, test_many)
 
 
 def not_equals(obj: Any) -> Callable[[Any], bool]:
@@ -346,7 +461,9 @@ def contains(value: Any) -> Callable[[str | Iterable[Any] | None], bool]:
         # Check for None before using 'in'
         return val is not None and value in val
 
-    return wrap
+    return _with_batch(
+        wrap, lambda values: [val is not None and value in val for val in values]
+    )
 
 
 def str_contains(value: str) -> Callable[[str | None], bool]:
@@ -403,7 +520,10 @@ def str_starts_with(value: str) -> Callable[[str | None], bool]:
     def wrap(val: str | None) -> bool:
         return val is not None and val.startswith(value)
 
-    return wrap
+    return _with_batch(
+        wrap,
+        lambda values: [val is not None and val.startswith(value) for val in values],
+    )
 
 
 def str_starts_with_ignore_case(value: str) -> Callable[[str | None], bool]:
@@ -443,7 +563,10 @@ def str_ends_with(value: str) -> Callable[[str | None], bool]:
     def wrap(val: str | None) -> bool:
         return val is not None and val.endswith(value)
 
-    return wrap
+    return _with_batch(
+        wrap,
+        lambda values: [val is not None and val.endswith(value) for val in values],
+    )
 
 
 def str_ends_with_ignore_case(value: str) -> Callable[[str | None], bool]:
@@ -489,7 +612,11 @@ def str_matches(pattern: str) -> Callable[[str | None], bool]:
         match = compiled_pattern.match(val)
         return match is not None
 
-    return wrap
+    def test_many(values: Iterable[str | None]) -> list[bool]:
+        match = compiled_pattern.match
+        return [val is not None and match(val) is not None for val in values]
+
+    return _with_batch(wrap, test_many)
 
 
 def str_not_matches(pattern: str) -> Callable[[str | None], bool]:
@@ -653,7 +780,12 @@ def is_between_closed(
     def wrap(val: float | None) -> bool:
         return val is not None and interval_start <= val <= interval_end
 
-    return wrap
+    def test_many(values: Any) -> Any:
+        if _is_numeric_array(values):
+            return (values >= interval_start) & (values <= interval_end)
+        return [val is not None and interval_start <= val <= interval_end for val in values]
+
+    return _with_batch(wrap, test_many)
 
 
 def is_in_interval(
@@ -673,7 +805,12 @@ def is_between(
     def wrap(val: float | None) -> bool:
         return val is not None and interval_start < val < interval_end
 
-    return wrap
+    def test_many(values: Any) -> Any:
+        if _is_numeric_array(values):
+            return (values > interval_start) & (values < interval_end)
+        return [val is not None and interval_start < val < interval_end for val in values]
+
+    return _with_batch(wrap, test_many)
 
 
 def is_in_open_interval(
@@ -694,7 +831,12 @@ def is_between_closed_start(
     def wrap(val: float | None) -> bool:
         return val is not None and interval_start <= val < interval_end
 
-    return wrap
+    def test_many(values: Any) -> Any:
+        if _is_numeric_array(values):
+            return (values >= interval_start) & (values < interval_end)
+        return [val is not None and interval_start <= val < interval_end for val in values]
+
+    return _with_batch(wrap, test_many)
 
 
 def is_between_closed_end(
@@ -708,7 +850,12 @@ def is_between_closed_end(
     def wrap(val: float | None) -> bool:
         return val is not None and interval_start < val <= interval_end
 
-    return wrap
+    def test_many(values: Any) -> Any:
+        if _is_numeric_array(values):
+            return (values > interval_start) & (values <= interval_end)
+        return [val is not None and interval_start < val <= interval_end for val in values]
+
+    return _with_batch(wrap, test_many)
 
 
 def is_higher_than(value: float) -> Callable[[float | None], bool]:
@@ -717,7 +864,12 @@ def is_higher_than(value: float) -> Callable[[float | None], bool]:
     def wrap(val: float | None) -> bool:
         return val is not None and val > value
 
-    return wrap
+    def test_many(values: Any) -> Any:
+        if _is_numeric_array(values):
+            return values > value
+        return [val is not None and val > value for val in values]
+
+    return _with_batch(wrap, test_many)
 
 
 def is_higher_than_or_eq(value: float) -> Callable[[float | None], bool]:
@@ -726,7 +878,12 @@ def is_higher_than_or_eq(value: float) -> Callable[[float | None], bool]:
     def wrap(val: float | None) -> bool:
         return val is not None and val >= value
 
-    return wrap
+    def test_many(values: Any) -> Any:
+        if _is_numeric_array(values):
+            return values >= value
+        return [val is not None and val >= value for val in values]
+
+    return _with_batch(wrap, test_many)
 
 
 def is_less_than(value: float) -> Callable[[float | None], bool]:
@@ -735,7 +892,12 @@ def is_less_than(value: float) -> Callable[[float | None], bool]:
     def wrap(val: float | None) -> bool:
         return val is not None and val < value
 
-    return wrap
+    def test_many(values: Any) -> Any:
+        if _is_numeric_array(values):
+            return values < value
+        return [val is not None and val < value for val in values]
+
+    return _with_batch(wrap, test_many)
 
 
 def is_less_than_or_eq(value: float) -> Callable[[float | None], bool]:
@@ -744,7 +906,12 @@ def is_less_than_or_eq(value: float) -> Callable[[float | None], bool]:
     def wrap(val: float | None) -> bool:
         return val is not None and val <= value
 
-    return wrap
+    def test_many(values: Any) -> Any:
+        if _is_numeric_array(values):
+            return values <= value
+        return [val is not None and val <= value for val in values]
+
+    return _with_batch(wrap, test_many)
 
 
 # --- Higher-Order Predicates ---
@@ -781,7 +948,7 @@ def not_strict(
         Callable[[T], bool]: The negated predicate.
     """
 
-    return lambda x: not predicate(x)
+    return _negate(predicate)
 
 
 # --- Mapping Predicates ---
@@ -929,7 +1096,11 @@ def str_fullmatch(pattern: str) -> Callable[[str | None], bool]:
         match = compiled_pattern.fullmatch(val)
         return match is not None
 
-    return wrap
+    def test_many(values: Iterable[str | None]) -> list[bool]:
+        fullmatch = compiled_pattern.fullmatch
+        return [val is not None and fullmatch(val) is not None for val in values]
+
+    return _with_batch(wrap, test_many)
 
 
 def str_is_alpha(val: str | None) -> bool:
@@ -967,6 +1138,302 @@ def str_is_title(val: str | None) -> bool:
     return val is not None and val.istitle()
 
 
+# --- Predicate Expression Trees ---
+
+
+class _ConstantPredicate(Predicate[Any]):
+    __slots__ = ("value",)
+
+    def __init__(self, value: bool) -> None:
+        self.value = value
+
+    def apply(self, value: Any) -> bool:
+        return self.value
+
+    def test_many(self, values: Iterable[Any]) -> Any:
+        if _is_numeric_array(values):
+            return sys.modules["numpy"].full(len(values), self.value)  # type: ignore[arg-type]
+        return [self.value for _ in values]
+
+
+_ALWAYS_TRUE = _ConstantPredicate(True)
+_ALWAYS_FALSE = _ConstantPredicate(False)
+
+
+def always_true() -> Predicate[Any]:
+    """
+    Returns a predicate matching any value. Combined with other predicates, it is
+    removed from conjunctions, and turns disjunctions into itself.
+
+    Returns:
+        Predicate[Any]: The constant predicate
+    """
+    return _ALWAYS_TRUE
+
+
+def always_false() -> Predicate[Any]:
+    """
+    Returns a predicate matching no value. Combined with other predicates, it is
+    removed from disjunctions, and turns conjunctions into itself.
+
+    Returns:
+        Predicate[Any]: The constant predicate
+    """
+    return _ALWAYS_FALSE
+
+
+class _CompositePredicate(Predicate[T]):
+    """
+    A node of a predicate expression tree: the conjunction (all terms match) or the
+    disjunction (any term matches) of its terms. The tree is compiled into a single
+    function the first time it is applied.
+    """
+
+    __slots__ = ("terms", "_compiled")
+
+    # The operator joining the terms in the compiled source
+    operator = ""
+
+    def __init__(self, terms: tuple[Predicate[T], ...]) -> None:
+        self.terms = terms
+        self._compiled: Callable[[T], bool] | None = None
+
+    def apply(self, value: T) -> bool:
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = _compile_tree(self)
+        return compiled(value)
+
+    def with_terms(self, terms: tuple[Predicate[T], ...]) -> Predicate[T]:
+        return _combine(type(self), terms)
+
+    def test_many(self, values: Iterable[T]) -> Any:
+        conjunction = isinstance(self, _AllPredicate)
+        if _is_numeric_array(values):
+            numpy = sys.modules["numpy"]
+            masks = [
+                numpy.asarray(apply_many(term, values), dtype=bool)
+                for term in self.terms
+            ]
+            return (numpy.logical_and if conjunction else numpy.logical_or).reduce(
+                masks
+            )
+        items = values if isinstance(values, (list, tuple)) else list(values)
+        results = [False] * len(items)
+        # Each term only tests the values that the previous terms did not decide,
+        # like the short-circuit evaluation of a single value
+        indexes: Iterable[int] = range(len(items))
+        for term in self.terms:
+            if not items:
+                break
+            mask = apply_many(term, items)
+            if not conjunction:
+                for index in compress(indexes, mask):
+                    results[index] = True
+            # The values matching a conjunction term, or not matching a disjunction
+            # term, are still undecided
+            undecided = mask if conjunction else list(map(operator.not_, mask))
+            indexes = list(compress(indexes, undecided))
+            items = list(compress(items, undecided))
+        if conjunction:
+            for index in indexes:
+                results[index] = True
+        return results
+
+
+class _AllPredicate(_CompositePredicate[T]):
+    __slots__ = ()
+    operator = "and"
+
+
+class _AnyPredicate(_CompositePredicate[T]):
+    __slots__ = ()
+    operator = "or"
+
+
+class _NotPredicate(Predicate[T]):
+    __slots__ = ("term", "_compiled")
+
+    def __init__(self, term: Predicate[T]) -> None:
+        self.term = term
+        self._compiled: Callable[[T], bool] | None = None
+
+    def apply(self, value: T) -> bool:
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = _compile_tree(self)
+        return compiled(value)
+
+    def test_many(self, values: Iterable[T]) -> Any:
+        mask = apply_many(self.term, values)
+        if _is_numeric_array(values):
+            return sys.modules["numpy"].logical_not(mask)
+        return [not matched for matched in mask]
+
+
+def _combine(
+    node_type: type[_CompositePredicate[T]], terms: Iterable[Callable[[T], bool]]
+) -> Predicate[T]:
+    """
+    Builds a conjunction or disjunction of the given terms, flattening nested nodes of
+    the same kind and folding constant terms.
+    """
+    # The constant that decides the whole node, and the one that can be dropped
+    absorbing, neutral = (
+        (_ALWAYS_FALSE, _ALWAYS_TRUE)
+        if node_type is _AllPredicate
+        else (_ALWAYS_TRUE, _ALWAYS_FALSE)
+    )
+    flat: list[Predicate[T]] = []
+    for term in terms:
+        predicate = predicate_of(term)
+        if type(predicate) is node_type:
+            flat.extend(cast(_CompositePredicate[T], predicate).terms)
+        elif isinstance(predicate, _ConstantPredicate):
+            if predicate.value is absorbing.value:
+                return absorbing
+        else:
+            flat.append(predicate)
+    if not flat:
+        return neutral
+    if len(flat) == 1:
+        return flat[0]
+    return node_type(tuple(flat))
+
+
+def _negate(predicate: Callable[[T], bool]) -> Predicate[T]:
+    term = predicate_of(predicate)
+    if isinstance(term, _NotPredicate) and isinstance(
+        term.term, (_CompositePredicate, _NotPredicate, _ConstantPredicate)
+    ):
+        # Tree nodes return bools, so their double negation is the node itself
+        return term.term
+    if isinstance(term, _ConstantPredicate):
+        return _ALWAYS_FALSE if term.value else _ALWAYS_TRUE
+    return _NotPredicate(term)
+
+
+def _leaf_function(predicate: Predicate[T]) -> Callable[[T], bool]:
+    if isinstance(predicate, _WrapPredicate):
+        return predicate.fn
+    return predicate.apply
+
+
+def _tree_source(predicate: Predicate[T], functions: list[Callable[[T], bool]]) -> str:
+    if isinstance(predicate, _CompositePredicate):
+        joined = f" {predicate.operator} ".join(
+            _tree_source(term, functions) for term in predicate.terms
+        )
+        return f"({joined})"
+    if isinstance(predicate, _NotPredicate):
+        return f"(not {_tree_source(predicate.term, functions)})"
+    if isinstance(predicate, _ConstantPredicate):
+        return repr(predicate.value)
+    functions.append(_leaf_function(predicate))
+    return f"p{len(functions) - 1}(value)"
+
+
+def _compile_tree(predicate: Predicate[T]) -> Callable[[T], bool]:
+    """
+    Compiles an expression tree into one function evaluating all its nodes inline,
+    short-circuiting like the `and` and `or` operators.
+    """
+    functions: list[Callable[[T], bool]] = []
+    try:
+        source = _tree_source(predicate, functions)
+        namespace: dict[str, Any] = {f"p{i}": fn for i, fn in enumerate(functions)}
+        exec(  # pylint: disable=exec-used
+            f"def compiled(value):\n    return True if {source} else False",
+            namespace,
+        )
+        return cast(Callable[[T], bool], namespace["compiled"])
+    except (RecursionError, SyntaxError, MemoryError):
+        # Trees too deep for the compiler are evaluated node by node
+        return _evaluate_tree(predicate)
+
+
+def _evaluate_tree(predicate: Predicate[T]) -> Callable[[T], bool]:
+    if isinstance(predicate, _CompositePredicate):
+        terms = [_evaluate_tree(term) for term in predicate.terms]
+        if isinstance(predicate, _AllPredicate):
+            return lambda value: all(term(value) for term in terms)
+        return lambda value: any(term(value) for term in terms)
+    if isinstance(predicate, _NotPredicate):
+        term = _evaluate_tree(predicate.term)
+        return lambda value: not term(value)
+    return _leaf_function(predicate)
+
+
+def _profile(
+    terms: tuple[Predicate[T], ...], sample: list[T]
+) -> list[tuple[float, float]] | None:
+    # The time per evaluation and the match rate of each term over the sample
+    stats = []
+    for term in terms:
+        fn = _leaf_function(term) if not isinstance(term, _CompositePredicate) else term
+        matches = 0
+        start = perf_counter()
+        try:
+            for value in sample:
+                if fn(value):
+                    matches += 1
+        except Exception:  # pylint: disable=broad-exception-caught
+            # The term may rely on the terms before it, such as a None check
+            return None
+        stats.append(((perf_counter() - start) / len(sample), matches / len(sample)))
+    return stats
+
+
+def _reorder(predicate: Predicate[T], sample: list[T]) -> Predicate[T]:
+    if isinstance(predicate, _NotPredicate):
+        return _negate(_reorder(predicate.term, sample))
+    if not isinstance(predicate, _CompositePredicate):
+        return predicate
+    terms = tuple(_reorder(term, sample) for term in predicate.terms)
+    stats = _profile(terms, sample)
+    if stats is not None:
+        conjunction = isinstance(predicate, _AllPredicate)
+        # Cheap terms that usually decide the result go first: a conjunction stops at
+        # the first mismatch, and a disjunction at the first match
+        ranks = [
+            cost / max(1.0 - rate if conjunction else rate, 1e-6)
+            for cost, rate in stats
+        ]
+        order = sorted(range(len(terms)), key=ranks.__getitem__)
+        terms = tuple(terms[i] for i in order)
+    return predicate.with_terms(terms)
+
+
+def compile_predicate(
+    predicate: Callable[[T], bool], sample: Iterable[T] | None = None
+) -> Predicate[T]:
+    """
+    Optimizes a predicate built with and_, or_, not_, all_of, any_of, none_of or the
+    Predicate.and_/or_ methods, and compiles it into a single function.
+
+    Nested conjunctions and disjunctions are flattened and constant predicates
+    (always_true, always_false) are folded when the predicates are combined. If a sample
+    of values is given, the terms of each conjunction and disjunction are also reordered
+    by their measured cost and selectivity, so that the cheap terms most likely to
+    decide the result are evaluated first. Reordering assumes the terms are independent
+    and have no side effects; if a term raises an error on the sample, for example
+    because it relies on a previous None check, the order of its node is kept.
+
+    Args:
+        predicate (Callable[[T], bool]): The predicate
+        sample (Iterable[T] | None, optional): Representative values used to reorder
+            the terms. Defaults to None, keeping the original order.
+
+    Returns:
+        Predicate[T]: The compiled predicate
+    """
+    tree = predicate_of(predicate)
+    values = list(sample) if sample is not None else []
+    if values:
+        tree = _reorder(tree, values)
+    return _WrapPredicate(_compile_tree(tree))
+
+
 def _extract_predicate_fn(predicate: Callable[[T], bool]) -> Callable[[T], bool]:
     if isinstance(predicate, Predicate):
         return predicate.apply
@@ -1250,7 +1717,7 @@ def and_(
         ]
         if p is not None
     )
-    return lambda el: all(pred(el) for pred in predicates)
+    return _combine(_AllPredicate, predicates)
 
 
 @overload
@@ -1530,4 +1997,54 @@ def or_(
         ]
         if p is not None
     )
-    return lambda el: any(pred(el) for pred in predicates)
+    return _combine(_AnyPredicate, predicates)
+
+
+def all_of(
+    predicates: Iterable[Callable[[T], bool]],
+) -> Predicate[T]:
+    """
+    Produces a predicate that returns True if the input value matches *all* provided predicates.
+    Short-circuits on the first False.
+
+    Args:
+        predicates: An iterable of predicates to check against.
+
+    Returns:
+        Predicate[T]: The combined predicate.
+    """
+    # The predicates are collected once, so iterators can be used as well
+    return _combine(_AllPredicate, predicates)
+
+
+def any_of(
+    predicates: Iterable[Callable[[T], bool]],
+) -> Predicate[T]:
+    """
+    Produces a predicate that returns True if the input value matches *any* of the provided predicates.
+    Short-circuits on the first True.
+
+    Args:
+        predicates: An iterable of predicates to check against.
+
+    Returns:
+        Predicate[T]: The combined predicate.
+    """
+
+    return _combine(_AnyPredicate, predicates)
+
+
+def none_of(
+    predicates: Iterable[Callable[[T], bool]],
+) -> Predicate[T]:
+    """
+    Produces a predicate that returns True if the input value matches *none* of the provided predicates.
+
+    Args:
+        predicates: An iterable of predicates to check against.
+
+    Returns:
+        Predicate[T]: The combined predicate.
+    """
+
+    return _negate(_combine(_AnyPredicate, predicates))
@@ -0,0 +1,413 @@
+from collections import deque
+from enum import Enum
+from threading import BoundedSemaphore, Lock
+from time import monotonic
+from typing import TypeVar
+from collections.abc import Callable
+
+T = TypeVar("T")
+
+
+class CallNotPermittedError(Exception):
+    """
+    Raised when a call is rejected without being attempted, either by an open
+    CircuitBreaker or a full Bulkhead.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str, message: str) -> None:
+        super().__init__(message)
+        self.name = name
+
+
+class CircuitBreakerOpenError(CallNotPermittedError):
+    pass
+
+
+class BulkheadFullError(CallNotPermittedError):
+    pass
+
+
+class CircuitState(Enum):
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
+class CircuitBreaker:
+    """
+    Stops calling a failing dependency, failing fast instead of adding load to it.
+
+    The breaker records the outcome of the last `window_size` calls. While CLOSED,
+    calls are permitted, and once at least `minimum_calls` are recorded and the
+    failure rate reaches `failure_rate_threshold`, the breaker opens. While OPEN,
+    calls are rejected. After `open_duration` seconds it becomes HALF_OPEN and lets
+    `half_open_calls` probe calls through: a failed probe opens it again, while
+    enough successful probes close it with a fresh window.
+
+    Every permit obtained with `acquire` or `try_acquire` must be passed back to
+    `on_success`, `on_failure` or `release`. Outcomes of permits issued before the
+    breaker last changed state are ignored, so that a slow call permitted while
+    CLOSED cannot be taken for a probe. `call` and `Try.with_circuit_breaker` take
+    care of that.
+
+    Example:
+        >>> breaker = circuit_breaker("billing", failure_rate_threshold=0.3)
+        >>> Try(fetch_invoice).with_circuit_breaker(breaker).get()
+    """
+
+    __slots__ = (
+        "name",
+        "failure_rate_threshold",
+        "window_size",
+        "minimum_calls",
+        "open_duration",
+        "half_open_calls",
+        "__record_failure",
+        "__lock",
+        "__state",
+        "__outcomes",
+        "__failures",
+        "__opened_at",
+        "__generation",
+        "__probes",
+        "__probe_successes",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_calls: int = 1,
+        record_failure: Callable[[Exception], bool] | None = None,
+    ) -> None:
+        """
+        Args:
+            name: The breaker name, used in errors and by the registry.
+            failure_rate_threshold: The failure rate, between 0 and 1, opening the breaker.
+            window_size: The number of most recent calls the failure rate is computed on.
+            minimum_calls: The number of recorded calls needed before the breaker can open.
+            open_duration: The number of seconds the breaker stays open before probing.
+            half_open_calls: The number of successful probes needed to close the breaker.
+            record_failure: Decides which exceptions count as failures. Others are
+                recorded as successes. Defaults to counting every exception.
+        """
+        if not 0 < failure_rate_threshold <= 1:
+            raise ValueError("Failure rate threshold must be between 0 and 1.")
+        if window_size < 1:
+            raise ValueError("Window size must be positive.")
+        if not 1 <= minimum_calls <= window_size:
+            raise ValueError("Minimum calls must be between 1 and the window size.")
+        if open_duration < 0:
+            raise ValueError("Open duration cannot be negative.")
+        if half_open_calls < 1:
+            raise ValueError("Half open calls must be positive.")
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self.__record_failure = record_failure
+        self.__lock = Lock()
+        self.__state = CircuitState.CLOSED
+        # True for each failed call in the window
+        self.__outcomes: deque[bool] = deque()
+        self.__failures = 0
+        self.__opened_at = 0.0
+        # Incremented on every state change, identifies the permits of each state
+        self.__generation = 1
+        # Probes let through and probes that succeeded while half open
+        self.__probes = 0
+        self.__probe_successes = 0
+
+    def __refresh(self) -> None:
+        # Called with the lock held
+        if (
+            self.__state is CircuitState.OPEN
+            and monotonic() - self.__opened_at >= self.open_duration
+        ):
+            self.__state = CircuitState.HALF_OPEN
+            self.__generation += 1
+            self.__probes = 0
+            self.__probe_successes = 0
+
+    def __open(self) -> None:
+        self.__state = CircuitState.OPEN
+        self.__generation += 1
+        self.__opened_at = monotonic()
+
+    def __close(self) -> None:
+        self.__state = CircuitState.CLOSED
+        self.__generation += 1
+        self.__outcomes.clear()
+        self.__failures = 0
+
+    def state(self) -> CircuitState:
+        """Returns the current state of the breaker."""
+        with self.__lock:
+            self.__refresh()
+            return self.__state
+
+    def failure_rate(self) -> float:
+        """Returns the failure rate over the calls in the current window."""
+        with self.__lock:
+            return self.__failures / len(self.__outcomes) if self.__outcomes else 0.0
+
+    def try_acquire(self) -> int | None:
+        """
+        Returns a permit if a call is permitted, in which case its outcome must be
+        reported with it, or None if the breaker rejects it. Permits are positive
+        numbers, so they can also be tested for truth.
+        """
+        with self.__lock:
+            self.__refresh()
+            if self.__state is CircuitState.CLOSED:
+                return self.__generation
+            if (
+                self.__state is CircuitState.HALF_OPEN
+                and self.__probes < self.half_open_calls
+            ):
+                self.__probes += 1
+                return self.__generation
+            return None
+
+    def acquire(self) -> int:
+        """
+        Obtains a permit like `try_acquire`, raising CircuitBreakerOpenError if the
+        call is rejected.
+        """
+        permit = self.try_acquire()
+        if permit is None:
+            raise CircuitBreakerOpenError(
+                self.name, f"Circuit breaker {self.name} is open"
+            )
+        return permit
+
+    def on_success(self, permit: int | None = None) -> None:
+        """
+        Records a successful permitted call.
+
+        Args:
+            permit: The permit of the call. Without it, an outcome received while
+                HALF_OPEN only counts as a probe if a probe is in flight.
+        """
+        self.__record(False, permit)
+
+    def on_failure(self, exception: Exception, permit: int | None = None) -> None:
+        """Records a failed permitted call, see `on_success` for the permit."""
+        self.__record(
+            self.__record_failure is None or bool(self.__record_failure(exception)),
+            permit,
+        )
+
+    def release(self, permit: int | None = None) -> None:
+        """Gives back a permit without recording an outcome."""
+        with self.__lock:
+            if self.__is_probe(permit):
+                self.__probes -= 1
+
+    def __is_probe(self, permit: int | None) -> bool:
+        # Called with the lock held
+        if self.__state is not CircuitState.HALF_OPEN:
+            return False
+        if permit is None:
+            return self.__probes > self.__probe_successes
+        return permit == self.__generation
+
+    def __record(self, failed: bool, permit: int | None) -> None:
+        with self.__lock:
+            if permit is not None and permit != self.__generation:
+                # Permitted before the breaker last changed state
+                return
+            if self.__state is CircuitState.HALF_OPEN:
+                if not self.__is_probe(permit):
+                    # Permitted before the breaker opened
+                    return
+                if failed:
+                    self.__open()
+                else:
+                    self.__probe_successes += 1
+                    if self.__probe_successes >= self.half_open_calls:
+                        self.__close()
+                return
+            if self.__state is CircuitState.OPEN:
+                # A call permitted before the breaker opened
+                return
+            outcomes = self.__outcomes
+            if len(outcomes) == self.window_size and outcomes.popleft():
+                self.__failures -= 1
+            outcomes.append(failed)
+            if failed:
+                self.__failures += 1
+                if (
+                    len(outcomes) >= self.minimum_calls
+                    and self.__failures >= self.failure_rate_threshold * len(outcomes)
+                ):
+                    self.__open()
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """
+        Calls fn if the breaker permits it and records the outcome.
+
+        Raises:
+            CircuitBreakerOpenError: If the breaker rejects the call.
+        """
+        permit = self.acquire()
+        try:
+            result = fn()
+        except Exception as e:
+            self.on_failure(e, permit)
+            raise
+        self.on_success(permit)
+        return result
+
+    def reset(self) -> None:
+        """Closes the breaker and forgets the recorded calls."""
+        with self.__lock:
+            self.__close()
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker({self.name!r}, state={self.state().name})"
+
+
+class Bulkhead:
+    """
+    Limits the number of concurrent calls to a dependency, so that a slow
+    dependency cannot tie up every worker thread.
+
+    A call waits up to `max_wait` seconds for a free slot, and is rejected with
+    BulkheadFullError if none frees up. The default of 0 rejects immediately.
+
+    Example:
+        >>> Try(fetch_report).with_bulkhead(bulkhead("reports", 4)).get()
+    """
+
+    __slots__ = (
+        "name",
+        "max_concurrent",
+        "max_wait",
+        "__semaphore",
+        "__lock",
+        "__active",
+    )
+
+    def __init__(self, name: str, max_concurrent: int, max_wait: float = 0.0) -> None:
+        if max_concurrent < 1:
+            raise ValueError("Maximum concurrent calls must be positive.")
+        if max_wait < 0:
+            raise ValueError("Maximum wait cannot be negative.")
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_wait = max_wait
+        self.__semaphore = BoundedSemaphore(max_concurrent)
+        self.__lock = Lock()
+        self.__active = 0
+
+    def try_acquire(self) -> bool:
+        """
+        Returns True if a slot was obtained, in which case it must be released.
+        """
+        if self.max_wait > 0:
+            acquired = self.__semaphore.acquire(timeout=self.max_wait)
+        else:
+            acquired = self.__semaphore.acquire(blocking=False)
+        if acquired:
+            with self.__lock:
+                self.__active += 1
+        return acquired
+
+    def acquire(self) -> None:
+        """
+        Obtains a slot like `try_acquire`, raising BulkheadFullError if none is free.
+        """
+        if not self.try_acquire():
+            raise BulkheadFullError(self.name, f"Bulkhead {self.name} is full")
+
+    def release(self) -> None:
+        """Frees a slot obtained with `acquire` or `try_acquire`."""
+        with self.__lock:
+            self.__active -= 1
+        self.__semaphore.release()
+
+    def active(self) -> int:
+        """Returns the number of calls currently holding a slot."""
+        return self.__active
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """
+        Calls fn while holding a slot.
+
+        Raises:
+            BulkheadFullError: If no slot is free within `max_wait` seconds.
+        """
+        self.acquire()
+        try:
+            return fn()
+        finally:
+            self.release()
+
+    def __repr__(self) -> str:
+        return (
+            f"Bulkhead({self.name!r}, active={self.__active}/{self.max_concurrent})"
+        )
+
+
+_registry_lock = Lock()
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+_bulkheads: dict[str, Bulkhead] = {}
+
+
+def circuit_breaker(
+    name: str,
+    failure_rate_threshold: float = 0.5,
+    window_size: int = 20,
+    minimum_calls: int = 10,
+    open_duration: float = 30.0,
+    half_open_calls: int = 1,
+    record_failure: Callable[[Exception], bool] | None = None,
+) -> CircuitBreaker:
+    """
+    Returns the circuit breaker registered under the given name, creating it with
+    the given configuration if needed. The configuration is ignored when the
+    breaker already exists, so every caller of a dependency shares its state.
+    """
+    breaker = _circuit_breakers.get(name)
+    if breaker is not None:
+        return breaker
+    with _registry_lock:
+        if name not in _circuit_breakers:
+            _circuit_breakers[name] = CircuitBreaker(
+                name,
+                failure_rate_threshold,
+                window_size,
+                minimum_calls,
+                open_duration,
+                half_open_calls,
+                record_failure,
+            )
+        return _circuit_breakers[name]
+
+
+def bulkhead(name: str, max_concurrent: int, max_wait: float = 0.0) -> Bulkhead:
+    """
+    Returns the bulkhead registered under the given name, creating it with the
+    given configuration if needed.
+    """
+    existing = _bulkheads.get(name)
+    if existing is not None:
+        return existing
+    with _registry_lock:
+        if name not in _bulkheads:
+            _bulkheads[name] = Bulkhead(name, max_concurrent, max_wait)
+        return _bulkheads[name]
+
+
+def circuit_breakers() -> dict[str, CircuitBreaker]:
+    """Returns a snapshot of the registered circuit breakers, by name."""
+    with _registry_lock:
+        return dict(_circuit_breakers)
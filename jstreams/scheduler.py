@@ -8,6 +8,12 @@ from typing import Any
 from collections.abc import Callable
 
 from threading import Lock, Thread
+from jstreams.manifest import (
+    read_manifest,
+    record_job,
+    schedule_manifest_jobs,
+    skip_scheduling,
+)
 from jstreams.stream import Opt
 from jstreams.thread import LoopingThread
 from jstreams.try_opt import Try
@@ -411,6 +417,18 @@ class _Scheduler(LoopingThread):
                     f"Warning: Could not import module '{module}' during scan: {e}"
                 )
 
+    def load_manifest(self, path: str) -> None:
+        """
+        Schedules the jobs recorded in a manifest built by `jstreams.manifest.build_manifest`,
+        instead of scanning the modules defining them. A job's module is imported when the job
+        first runs. Jobs using on_success or on_error callbacks are scheduled by importing
+        their module right away.
+
+        Args:
+            path (str): The manifest file
+        """
+        schedule_manifest_jobs(read_manifest(path))
+
     def schedule_periodic(
         self,
         func: Callable[[], Any],
@@ -605,6 +623,16 @@ def schedule_periodic(
     """
 
     def decorator(func: Callable[[], Any]) -> Callable[[], Any]:
+        record_job(
+            func,
+            "periodic",
+            period=period,
+            one_time=one_time,
+            on_success=on_success,
+            on_error=on_error,
+        )
+        if skip_scheduling(func):
+            return func
         scheduler().schedule_periodic(
             func, period, one_time, on_success=on_success, on_error=on_error
         )
@@ -702,6 +730,16 @@ def schedule_daily(
 
     # Input validation happens in get_timestamp_today called by schedule_daily method
     def decorator(func: Callable[[], Any]) -> Callable[[], Any]:
+        record_job(
+            func,
+            "daily",
+            hour=hour,
+            minute=minute,
+            on_success=on_success,
+            on_error=on_error,
+        )
+        if skip_scheduling(func):
+            return func
         scheduler().schedule_daily(
             func, hour, minute, on_success=on_success, on_error=on_error
         )
@@ -740,6 +778,11 @@ def schedule_hourly(
 
     # Input validation happens in get_timestamp_current_hour called by schedule_hourly method
     def decorator(func: Callable[[], Any]) -> Callable[[], Any]:
+        record_job(
+            func, "hourly", minute=minute, on_success=on_success, on_error=on_error
+        )
+        if skip_scheduling(func):
+            return func
         # Note: The original code passed a timestamp here, but the method expects minute. Correcting.
         scheduler().schedule_hourly(
             func, minute, on_success=on_success, on_error=on_error
@@ -3,6 +3,7 @@ from datetime import date, datetime
 from enum import Enum
 import re
 from typing import (
+    IO,
     Any,
     TypeVar,
     Union,
@@ -12,10 +13,15 @@ from typing import (
     get_origin,
     get_args,
 )
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 import inspect
+import json
+import struct
+from types import UnionType
 from uuid import UUID
 
+from jstreams.stream import Stream
+
 # TypeVar to represent the class being decorated.
 _T = TypeVar("_T")
 # Covariant TypeVar for SerializableObject protocol
@@ -26,9 +32,10 @@ _CAMEL_TO_SNAKE_PAT1 = re.compile(r"(.)([A-Z][a-z]+)")
 _CAMEL_TO_SNAKE_PAT2 = re.compile(r"__([A-Z])")
 _CAMEL_TO_SNAKE_PAT3 = re.compile(r"([a-z0-9])([A-Z])")
 
-# Caches for _deserialize_value to speed up repeated type checks
-_ENUM_TYPE_CACHE: dict[type, bool] = {}
-_HAS_CALLABLE_FROM_DICT_CACHE: dict[type, bool] = {}
+# Marks attributes without a value, and names not yet compiled into a plan
+_MISSING = object()
+# Bounds the per-class cache of input keys, which may come from arbitrary data
+_MAX_KEY_PLANS = 1024
 
 
 def _snake_to_camel(snake_str: str) -> str:
@@ -76,155 +83,296 @@ class SerializableObject(Protocol[_T_co]):
     def from_dict(cls: type[_T_co], data: dict[str, Any]) -> _T_co: ...
 
 
-def _process_value(value: Any) -> Any:
-    """Helper function to recursively process values for serialization."""
-    # If the object conforms to SerializableObject, isinstance check is sufficient due to @runtime_checkable
+def _serialize_object(value: Any) -> Any:
+    return value.to_dict()
+
+
+def _serialize_isoformat(value: Any) -> Any:
+    return value.isoformat()
+
+
+def _serialize_enum(value: Any) -> Any:
+    return value.value  # Serialize Enums to their value
+
+
+def _serialize_list(value: Any) -> Any:
+    return [_process_value(item) for item in value]
+
 
-    if isinstance(value, SerializableObject):
+def _serialize_tuple(value: Any) -> Any:
+    # Preserve tuple type by creating a new tuple with processed items
+    return tuple(_process_value(item) for item in value)
+
+
+def _serialize_dict(value: Any) -> Any:
+    return {k: _process_value(v) for k, v in value.items()}
+
+
+def _serialize_as_is(value: Any) -> Any:
+    return value
+
+
+# Serializer functions by value type, filled on first use of each type
+_VALUE_SERIALIZERS: dict[type, Callable[[Any], Any]] = {
+    int: _serialize_as_is,
+    float: _serialize_as_is,
+    str: _serialize_as_is,
+    bool: _serialize_as_is,
+    type(None): _serialize_as_is,
+    list: _serialize_list,
+    dict: _serialize_dict,
+}
+
+
+def _compile_value_serializer(value_type: type) -> Callable[[Any], Any]:
+    """Selects the serializer for values of a type, checking types in priority order."""
+    try:
+        is_serializable = issubclass(value_type, SerializableObject)
+    except TypeError:
+        is_serializable = False
+    if is_serializable:
         # If the object conforms to SerializableObject and has a callable to_dict
-        return value.to_dict()
-    if isinstance(value, (datetime, date)):
-        return value.isoformat()
-    if isinstance(value, UUID):
-        return str(value)
-    if isinstance(value, Enum):
-        return value.value  # Serialize Enums to their value
-    if isinstance(value, list):
-        return [_process_value(item) for item in value]
-    if isinstance(value, tuple):
-        # Preserve tuple type by creating a new tuple with processed items
-        return tuple(_process_value(item) for item in value)
-    if isinstance(value, dict):
-        return {k: _process_value(v) for k, v in value.items()}
+        return _serialize_object
+    if issubclass(value_type, (datetime, date)):
+        return _serialize_isoformat
+    if issubclass(value_type, UUID):
+        return str
+    if issubclass(value_type, Enum):
+        return _serialize_enum
+    if issubclass(value_type, list):
+        return _serialize_list
+    if issubclass(value_type, tuple):
+        return _serialize_tuple
+    if issubclass(value_type, dict):
+        return _serialize_dict
     # Basic types (int, str, float, bool, None) and other unhandled types are returned as-is.
-    return value
+    return _serialize_as_is
 
 
-def _deserialize_value(target_type: Any, data_value: Any) -> Any:
+def _process_value(value: Any) -> Any:
+    """Helper function to recursively process values for serialization."""
+    value_type = type(value)
+    serializer = _VALUE_SERIALIZERS.get(value_type)
+    if serializer is None:
+        serializer = _VALUE_SERIALIZERS[value_type] = _compile_value_serializer(
+            value_type
+        )
+    return serializer(value)
+
+
+# Errors that make a Union try deserializing a value with its next member type
+_UNION_MEMBER_ERRORS = (TypeError, ValueError, AttributeError, KeyError)
+_COERCIBLE_TYPES = (int, float, str, bool)
+_NONE_TYPE = type(None)
+# Optional[X] and Union[X, Y], as well as X | Y
+_UNION_ORIGINS: tuple[Any, ...] = (Union, UnionType)
+
+# Deserializer plans by target type: the converter and whether it may raise one
+# of the errors a Union recovers from
+_DESERIALIZERS: dict[Any, tuple[Callable[[Any], Any], bool]] = {}
+
+
+def _deserialize_as_is(data_value: Any) -> Any:
+    return data_value
+
+
+def _deserializer(target_type: Any) -> Callable[[Any], Any]:
+    return _deserializer_plan(target_type)[0]
+
+
+def _deserializer_plan(target_type: Any) -> tuple[Callable[[Any], Any], bool]:
+    try:
+        plan = _DESERIALIZERS.get(target_type)
+    except TypeError:  # Unhashable type hint, compiled on each use
+        return _compile_deserializer(target_type)
+    if plan is None:
+        plan = _DESERIALIZERS[target_type] = _compile_deserializer(target_type)
+    return plan
+
+
+def _compile_deserializer(target_type: Any) -> tuple[Callable[[Any], Any], bool]:
     """
-    Helper function to recursively deserialize a data value to a target type.
+    Compiles the deserialization of values to the given type hint into a converter,
+    with the type checks resolved once. Returns the converter, and whether it may raise
+    one of the errors that make a Union try its next member.
     """
     if target_type is Any:  # No specific type hint, return as is
-        return data_value
+        return _deserialize_as_is, False
 
     origin = get_origin(target_type)
-    actual_type_to_check = origin or target_type
-
-    # 1. Handle specific known types first
-    if actual_type_to_check is datetime and isinstance(data_value, str):
-        try:
-            return datetime.fromisoformat(data_value)
-        except ValueError:
-            pass  # Fall through if not a valid ISO format string
-    if actual_type_to_check is date and isinstance(data_value, str):
-        try:
-            return date.fromisoformat(data_value)
-        except ValueError:
-            pass
-    if actual_type_to_check is UUID and isinstance(data_value, str):
-        try:
-            return UUID(data_value)
-        except ValueError:
-            pass
-    if inspect.isclass(actual_type_to_check) and issubclass(actual_type_to_check, Enum):
-        # Optimized Enum check using cache
-        is_enum_class = _ENUM_TYPE_CACHE.get(actual_type_to_check)
-        if is_enum_class is None:
-            is_enum_class = inspect.isclass(actual_type_to_check) and issubclass(
-                actual_type_to_check, Enum
-            )
-            _ENUM_TYPE_CACHE[actual_type_to_check] = is_enum_class
-
-        if is_enum_class:
+    args = get_args(target_type)
+    actual_type = origin or target_type
+
+    if origin in _UNION_ORIGINS:
+        return _compile_union_deserializer(args)
+
+    fallback, may_raise = _compile_fallback_deserializer(target_type, origin, args)
+
+    # Specific known types are parsed from strings, falling back to the generic
+    # handling if the string is not valid
+    parser: Callable[[str], Any] | None = None
+    if actual_type is datetime:
+        parser = datetime.fromisoformat
+    elif actual_type is date:
+        parser = date.fromisoformat
+    elif actual_type is UUID:
+        parser = UUID
+    if parser is not None:
+        str_parser = parser
+
+        def parse(data_value: Any) -> Any:
+            if isinstance(data_value, str):
+                try:
+                    return str_parser(data_value)
+                except ValueError:
+                    pass  # Fall through if not a valid string representation
+            return fallback(data_value)
+
+        return parse, may_raise
+
+    if inspect.isclass(actual_type) and issubclass(actual_type, Enum):
+        enum_type = actual_type
+
+        def to_enum(data_value: Any) -> Any:
             try:
                 # Attempt to create enum member from value
-                return actual_type_to_check(data_value)
+                return enum_type(data_value)
             except ValueError:
                 # If data_value is not a valid value for the enum,
                 # it might be the enum member name (less common for JSON).
-                pass
-    origin = get_origin(target_type)
-    args = get_args(target_type)
+                return fallback(data_value)
+
+        # Enums may define _missing_ hooks raising other errors
+        return to_enum, True
+
+    return fallback, may_raise
+
+
+def _compile_union_deserializer(
+    args: tuple[Any, ...],
+) -> tuple[Callable[[Any], Any], bool]:
+    # Handles Optional[X] (Union[X, NoneType]) and other Unions
+    none_allowed = _NONE_TYPE in args
+    # Members are tried in order until one deserializes the value without error.
+    # Members following one that cannot fail are never reached, so they are dropped.
+    attempts: list[Callable[[Any], Any]] = []
+    final: Callable[[Any], Any] | None = None
+    for arg_type in args:
+        if arg_type is _NONE_TYPE:
+            continue
+        converter, may_raise = _deserializer_plan(arg_type)
+        if not may_raise:
+            final = converter
+            break
+        attempts.append(converter)
+
+    def from_union(data_value: Any) -> Any:
+        # If None is a valid type in the Union (e.g., Optional), return None.
+        if data_value is None and none_allowed:
+            return None
+        for attempt in attempts:
+            try:
+                return attempt(data_value)
+            except _UNION_MEMBER_ERRORS:
+                # If deserialization with this member fails, try the next one.
+                continue
+        if final is not None:
+            return final(data_value)
+        # If no type in Union successfully deserializes, return the raw data_value.
+        # This might be the correct behavior if data_value is already of a compatible
+        # simple type that wasn't explicitly in the Union's args but is assignable.
+        return data_value
 
-    if origin is Union:  # Handles Optional[X] (Union[X, NoneType]) and other Unions
-        if data_value is None:
-            # If None is a valid type in the Union (e.g., Optional), return None.
-            if any(arg is type(None) for arg in args):
+    if not attempts and final is not None and none_allowed:
+        # Optional[X], the most common Union, needs no error handling
+        def from_optional(data_value: Any) -> Any:
+            if data_value is None:
                 return None
-            # If None is not allowed by the Union but data is None, this is a potential mismatch.
-            # For now, we let it fall through; specific error handling could be added.
+            return final(data_value)  # type: ignore[misc]
 
-        # Try to deserialize with non-None types in the Union.
-        for arg_type in args:
-            if arg_type is type(None):
-                continue
-            try:
-                # Attempt to deserialize with this type from the Union.
-                return _deserialize_value(arg_type, data_value)
-            except (TypeError, ValueError, AttributeError, KeyError):
-                # If deserialization with this arg_type fails, try the next one.
-                continue
+        return from_optional, False
+    return from_union, False
 
-        # If no type in Union matches or successfully deserializes,
-        # and data_value was not None (or None was not allowed), return raw data_value.
-        # This might be the correct behavior if data_value is already of a compatible simple type
-        # that wasn't explicitly in the Union's args but is assignable.
-        if data_value is not None or not any(arg is type(None) for arg in args):
-            return data_value
-        return None  # Should have been caught by 'if data_value is None' earlier if None was allowed
+
+def _compile_fallback_deserializer(
+    target_type: Any, origin: Any, args: tuple[Any, ...]
+) -> tuple[Callable[[Any], Any], bool]:
+    actual_type = origin or target_type
 
     if origin in (list, tuple) and args:  # Handles list[X], tuple[X, Y, ...]
-        item_type = args[0]  # Assuming list[X] or tuple[X, ...]
-        if isinstance(data_value, list):  # Expecting a list from JSON-like data
-            processed_list = [
-                _deserialize_value(item_type, item) for item in data_value
-            ]
-            return processed_list if origin is list else origin(processed_list)
-        # Data doesn't match expected list type, return as is or raise error.
-        return data_value  # Or raise TypeError(f"Expected list for {target_type}, got {type(data_value)}")
-
-    if origin is dict and args and len(args) == 2:  # Handles dict[KeyType, ValueType]
-        # key_type = args[0] # Assuming key_type is simple (e.g. str) for JSON-like dicts
-        value_type = args[1]
-        if isinstance(data_value, dict):
-            return {k: _deserialize_value(value_type, v) for k, v in data_value.items()}
-        # Data doesn't match expected dict type
-        return data_value  # Or raise TypeError
+        # Assuming list[X] or tuple[X, ...]
+        item_converter, may_raise = _deserializer_plan(args[0])
+        collection_type = origin
+
+        def to_collection(data_value: Any) -> Any:
+            # Expecting a list from JSON-like data, otherwise return as is
+            if not isinstance(data_value, list):
+                return data_value
+            processed_list = [item_converter(item) for item in data_value]
+            return (
+                processed_list
+                if collection_type is list
+                else collection_type(processed_list)
+            )
+
+        return to_collection, may_raise
+
+    if origin is dict and len(args) == 2:  # Handles dict[KeyType, ValueType]
+        # Keys are assumed to be simple (e.g. str) for JSON-like dicts
+        value_converter, may_raise = _deserializer_plan(args[1])
+
+        def to_dict(data_value: Any) -> Any:
+            if not isinstance(data_value, dict):
+                return data_value
+            return {k: value_converter(v) for k, v in data_value.items()}
+
+        return to_dict, may_raise
 
     # Check for a class that has from_dict (could be target_type itself if not a generic)
     # This handles direct SerializableObject types.
-    # Optimized check for from_dict capability using cache
-    has_callable_from_dict = _HAS_CALLABLE_FROM_DICT_CACHE.get(actual_type_to_check)
-    if has_callable_from_dict is None:
-        if inspect.isclass(
-            actual_type_to_check
-        ):  # hasattr/getattr are safer on classes
-            from_dict_method = getattr(actual_type_to_check, "from_dict", None)
-            has_callable_from_dict = callable(from_dict_method)
-        else:
-            has_callable_from_dict = (
-                False  # Not a class, so can't have classmethod from_dict
-            )
-        _HAS_CALLABLE_FROM_DICT_CACHE[actual_type_to_check] = has_callable_from_dict
+    if inspect.isclass(actual_type) and callable(
+        getattr(actual_type, "from_dict", None)
+    ):
+        object_type = actual_type
+
+        def to_object(data_value: Any) -> Any:
+            if isinstance(data_value, dict):
+                return object_type.from_dict(data_value)
+            return data_value
 
-    if has_callable_from_dict and isinstance(data_value, dict):
-        # actual_type_to_check is known to have a callable from_dict
-        return actual_type_to_check.from_dict(data_value)
+        # from_dict raises on missing constructor arguments
+        return to_object, True
 
-    # If data_value is already an instance of the target type (after considering origin)
-    if actual_type_to_check is not Any and isinstance(data_value, actual_type_to_check):
+    if actual_type in _COERCIBLE_TYPES:
+        basic_type = actual_type
+
+        def coerce(data_value: Any) -> Any:
+            if isinstance(data_value, basic_type):
+                return data_value
+            # Attempt basic type coercion, returning the original value if it fails
+            try:
+                return basic_type(data_value)
+            except (ValueError, TypeError):
+                return data_value
+
+        return coerce, False
+
+    def check_instance(data_value: Any) -> Any:
+        # Hints that are not classes, such as Literal, raise TypeError here, so
+        # that a Union moves on to its next member
+        isinstance(data_value, actual_type)
         return data_value
 
-    # Attempt basic type coercion if target_type is a basic type and data_value is not already that type
-    if actual_type_to_check in (int, float, str, bool) and not isinstance(
-        data_value, actual_type_to_check
-    ):
-        try:
-            return actual_type_to_check(data_value)
-        except (ValueError, TypeError):
-            # Coercion failed, fall through to return original data_value
-            pass
-    return data_value
+    # Plain classes are safe to check against, other hints may raise TypeError
+    return check_instance, type(actual_type) is not type
+
+
+def _deserialize_value(target_type: Any, data_value: Any) -> Any:
+    """
+    Helper function to recursively deserialize a data value to a target type.
+    The type hint is compiled once into a converter, cached per target type.
+    """
+    return _deserializer(target_type)(data_value)
 
 
 def json_standard_serializable(
@@ -370,137 +518,170 @@ def json_serializable(
 
         # --- End Caching ---
 
+        # --- Compiled serialization plan ---
+        aliases_map = aliases or {}
+        custom_serializers_map = custom_serializers or {}
+        custom_deserializers_map = custom_deserializers or {}
+        reverse_aliases_map = getattr(cls, cached_reverse_aliases_attr)
+        all_type_hints = getattr(cls, cached_type_hints_attr)
+        init_params = getattr(cls, cached_init_params_attr)
+        cls_slots = getattr(cls, cached_slots_attr)
+
+        # Per attribute name: (translated output key, output key, custom serializer),
+        # or None for the "private" or "protected" attributes that are not serialized
+        field_plans: dict[str, tuple[str, str, Callable[[Any], Any] | None] | None] = {}
+
+        def compile_field(
+            attr_name: str,
+        ) -> tuple[str, str, Callable[[Any], Any] | None] | None:
+            plan: tuple[str, str, Callable[[Any], Any] | None] | None = None
+            if not attr_name.startswith("_"):
+                output_key = aliases_map.get(attr_name, attr_name)
+                plan = (
+                    _snake_to_camel(output_key)
+                    if translate_snake_to_camel
+                    else output_key,
+                    output_key,
+                    custom_serializers_map.get(attr_name),
+                )
+            field_plans[attr_name] = plan
+            return plan
+
+        # Attributes read with getattr after the instance __dict__: the slots of the
+        # class, then the annotated attributes, which may also be class level defaults.
+        # Special slots like __dict__ and __weakref__ are excluded as private names.
+        defined_slot_names: str | Iterable[str] = getattr(cls, "__slots__", ())
+        slot_names = (
+            [defined_slot_names]
+            if isinstance(defined_slot_names, str)
+            else list(defined_slot_names)
+        )
+        getattr_fields = [
+            name
+            for name in dict.fromkeys(
+                slot_names + list(getattr(cls, "__annotations__", {}))
+            )
+            if compile_field(name) is not None
+        ]
+
         def to_dict(self: _T) -> dict[str, Any]:
             return _to_dict_convert_name(self, convert_names=True)
 
         def _to_dict_convert_name(self: _T, convert_names: bool) -> dict[str, Any]:
             serialized_data: dict[str, Any] = {}
-            aliases_map_local = aliases or {}
-            custom_serializers_map_local = custom_serializers or {}
-
-            # This map will store all potential attributes to serialize,
-            # gathered from __dict__ and __slots__.
-            attributes_map: dict[str, Any] = {}
-
-            # 1. Gather attributes from __dict__ if it exists
-            if hasattr(self, "__dict__"):
-                attributes_map.update(self.__dict__)
-
-            # 2. Gather attributes from __slots__ if the class defines them
-            # getattr() is used to fetch slot values. This correctly handles
-            # attributes defined only in __slots__ and also cases where __slots__
-            # might include '__dict__' (allowing both slotted and dynamic attributes).
-            if hasattr(cls, "__slots__"):
-                # cls.__slots__ can be a string or an iterable of strings
-                defined_slot_names: str | Iterable[str] = cls.__slots__  # type: ignore[attr-defined]
-                actual_slot_names: Iterable[str]
-
-                if isinstance(defined_slot_names, str):
-                    actual_slot_names = [defined_slot_names]
-                else:
-                    actual_slot_names = defined_slot_names
-
-                for slot_name in actual_slot_names:
-                    # Special slots like __dict__ and __weakref__ are part of Python's object model
-                    # and not typically considered data attributes for serialization.
-                    # __dict__ contents are already handled above. __weakref__ is for weak references.
-                    if slot_name in ("__dict__", "__weakref__"):
+            key_index = 0 if convert_names else 1
+            instance_dict: dict[str, Any] | None = getattr(self, "__dict__", None)
+
+            if instance_dict:
+                for attr_name, raw_value in instance_dict.items():
+                    plan = field_plans.get(attr_name, _MISSING)
+                    if plan is _MISSING:
+                        plan = compile_field(attr_name)
+                    if plan is None:
                         continue
-                    try:
-                        # Fetch the value of the slot from the instance
-                        attributes_map[slot_name] = getattr(self, slot_name)
-                    except AttributeError:
-                        # This can happen if a slot is defined but not yet assigned a value
-                        # on this particular instance, or if it's a complex descriptor.
-                        # In such cases, we'll skip it for serialization.
-                        continue  # Use continue to be explicit about skipping
-
-            # 3. Gather attributes defined purely by __annotations__ that exist on the instance
-            # This handles cases where an attribute might be defined with a type hint
-            # but not explicitly in __init__ or __slots__, but is set later on the instance.
-            if hasattr(cls, "__annotations__"):
-                for key in cls.__annotations__:
-                    # If the attribute is already in __dict__ or __slots__, we've already got it.
-                    # We only need to check annotations for attributes *not* yet in the map.
-                    if key not in attributes_map:
-                        # Try to get the value from the instance.
-                        # If it exists, add it to the map. If not, skip it.
-                        try:
-                            attributes_map[key] = getattr(self, key)
-                        except AttributeError:
-                            # Attribute defined in annotations but not set on this instance.
-                            # Skip it for serialization.
-                            continue
-
-            for attr_name, raw_value in attributes_map.items():
-                if not attr_name.startswith(
-                    "_"
-                ):  # Exclude "private" or "protected" attributes
-                    processed_value: Any
-                    if attr_name in custom_serializers_map_local:
-                        processed_value = custom_serializers_map_local[attr_name](
-                            raw_value
-                        )
-                    else:
-                        processed_value = _process_value(raw_value)
-
+                    serializer = plan[2]  # type: ignore[index]
+                    processed_value = (
+                        _process_value(raw_value)
+                        if serializer is None
+                        else serializer(raw_value)
+                    )
                     if omit_none and processed_value is None:
                         continue
-
-                    output_key = aliases_map_local.get(attr_name, attr_name)
-                    if translate_snake_to_camel and convert_names:
-                        output_key = _snake_to_camel(output_key)
-                    serialized_data[output_key] = processed_value
+                    serialized_data[plan[key_index]] = processed_value  # type: ignore[index]
+
+            for attr_name in getattr_fields:
+                if instance_dict is not None and attr_name in instance_dict:
+                    continue
+                # Slots not assigned on this instance, and annotated attributes without
+                # a value are skipped
+                raw_value = getattr(self, attr_name, _MISSING)
+                if raw_value is _MISSING:
+                    continue
+                plan = field_plans[attr_name]
+                serializer = plan[2]  # type: ignore[index]
+                processed_value = (
+                    _process_value(raw_value)
+                    if serializer is None
+                    else serializer(raw_value)
+                )
+                if omit_none and processed_value is None:
+                    continue
+                serialized_data[plan[key_index]] = processed_value  # type: ignore[index]
 
             return serialized_data
 
+        # Per input key: (attribute name, is an __init__ parameter, value converter),
+        # with no converter for unknown fields that are ignored
+        key_plans: dict[str, tuple[str, bool, Callable[[Any], Any] | None]] = {}
+        init_hints: dict[str, Any] | None = None
+
+        def resolved_init_hints() -> dict[str, Any]:
+            # Resolved on first use, since the hints may refer to the class itself,
+            # which is not bound to its name while being decorated
+            nonlocal init_hints
+            if init_hints is None:
+                try:
+                    init_hints = get_type_hints(cls.__init__)
+                except Exception:  # Unresolvable forward references
+                    init_hints = {}
+            return init_hints
+
+        def compile_key(
+            key_from_data: str,
+        ) -> tuple[str, bool, Callable[[Any], Any] | None]:
+            sanitized_key = (
+                _camel_to_snake(key_from_data)
+                if translate_snake_to_camel
+                else key_from_data
+            )
+            attr_name = reverse_aliases_map.get(sanitized_key, sanitized_key)
+            is_init_param = (
+                attr_name in init_params and init_params[attr_name].name != "self"
+            )
+            converter: Callable[[Any], Any] | None = None
+            if attr_name in custom_deserializers_map and (
+                is_init_param or attr_name in cls_slots or attr_name in all_type_hints
+            ):
+                converter = custom_deserializers_map[attr_name]
+            elif is_init_param:
+                # Determine the type hint for the __init__ parameter, with forward
+                # references resolved when possible
+                param_type_hint = resolved_init_hints().get(
+                    attr_name, init_params[attr_name].annotation
+                )
+                if param_type_hint is inspect.Parameter.empty:
+                    # If __init__ param has no type hint, try class-level hint
+                    param_type_hint = all_type_hints.get(attr_name, Any)
+                converter = _deserializer(param_type_hint)
+            elif attr_name in cls_slots or attr_name in all_type_hints:
+                converter = _deserializer(all_type_hints.get(attr_name, Any))
+            elif not ignore_unknown_fields:
+                # Deserialize with Any, which processes collections/SerializableObjects
+                # but otherwise uses the value as-is.
+                converter = _deserializer(Any)
+            plan = (attr_name, is_init_param, converter)
+            if len(key_plans) < _MAX_KEY_PLANS:
+                key_plans[key_from_data] = plan
+            return plan
+
         def from_dict(cls_target: type[_T], data: dict[str, Any]) -> _T:
             """
             Creates an instance of the class from a dictionary.
             Recursively deserializes nested objects based on type hints.
             """
-            # Retrieve cached introspection results
-            all_type_hints = getattr(cls_target, cached_type_hints_attr)
-            init_params = getattr(cls_target, cached_init_params_attr)
-            reverse_aliases_map = getattr(cls_target, cached_reverse_aliases_attr)
-            cls_slots = getattr(
-                cls_target, cached_slots_attr
-            )  # Retrieve cached slots set
-
-            custom_deserializers_map_local = custom_deserializers or {}
-
             init_kwargs: dict[str, Any] = {}
-            extra_data: dict[str, Any] = {}  # For data not used in __init__
+            # For data not used in __init__, set on the instance once created
+            extra_data: dict[str, tuple[Callable[[Any], Any], Any]] = {}
 
-            # Prepare arguments for __init__ by deserializing them
             for key_from_data, value_from_data in data.items():
-                sanitized_key = key_from_data
-                if translate_snake_to_camel:
-                    sanitized_key = _camel_to_snake(key_from_data)
-                attr_name = reverse_aliases_map.get(sanitized_key, sanitized_key)
-
-                if attr_name in init_params and init_params[attr_name].name != "self":
-                    param = init_params[attr_name]
-                    # Determine the type hint for the __init__ parameter
-                    param_type_hint = param.annotation
-                    if param_type_hint is inspect.Parameter.empty:
-                        # If __init__ param has no type hint, try class-level hint
-                        param_type_hint = all_type_hints.get(attr_name, Any)
-
-                    if attr_name in custom_deserializers_map_local:
-                        init_kwargs[attr_name] = custom_deserializers_map_local[
-                            attr_name
-                        ](value_from_data)
-
-                    else:
-                        init_kwargs[attr_name] = _deserialize_value(
-                            param_type_hint, value_from_data
-                        )
-                else:
-                    # Store with original (potentially aliased) key if it's not an init param,
-                    # or de-aliased name if it was an init param but not used (e.g. **kwargs)
-                    # For simplicity, always use de-aliased name for extra_data keys.
-                    extra_data[attr_name] = value_from_data
+                plan = key_plans.get(key_from_data)
+                if plan is None:
+                    plan = compile_key(key_from_data)
+                attr_name, is_init_param, converter = plan
+                if is_init_param:
+                    init_kwargs[attr_name] = converter(value_from_data)  # type: ignore[misc]
+                elif converter is not None:
+                    extra_data[attr_name] = (converter, value_from_data)
 
             # Instantiate the object using prepared __init__ arguments
             # This assumes __init__ can handle the provided kwargs.
@@ -509,42 +690,13 @@ def json_serializable(
             instance = cls_target(**init_kwargs)
 
             # Set any remaining attributes from `extra_data` using setattr
-            for attr_name_from_extra, original_value_from_data in extra_data.items():
-                is_known_attribute = False  # Known via slots or type hints
-                if attr_name_from_extra in cls_slots:  # Use cached slots
-                    is_known_attribute = True
-
-                if not is_known_attribute and attr_name_from_extra in all_type_hints:
-                    is_known_attribute = True
-
-                if is_known_attribute:
-                    attr_type_hint = all_type_hints.get(attr_name_from_extra, Any)
-                    final_value: Any
-                    if attr_name_from_extra in custom_deserializers_map_local:
-                        final_value = custom_deserializers_map_local[
-                            attr_name_from_extra
-                        ](original_value_from_data)
-                    else:
-                        final_value = _deserialize_value(
-                            attr_type_hint, original_value_from_data
-                        )
-                    try:
-                        setattr(instance, attr_name_from_extra, final_value)
-                    except (
-                        AttributeError
-                    ):  # e.g., property without setter, or __slots__ issue
-                        # Optionally log: f"Warning: Could not set attribute '{key}' on '{cls_target.__name__}'"
-                        pass
-                elif (
-                    not ignore_unknown_fields
-                ):  # Attribute is not known, but we are not ignoring unknown fields
-                    # Attempt to set it. Deserialize with Any, which processes collections/SerializableObjects
-                    # but otherwise uses the value as-is.
-                    value_to_set = _deserialize_value(Any, original_value_from_data)
-                    try:
-                        setattr(instance, attr_name_from_extra, value_to_set)
-                    except AttributeError:
-                        pass
+            for attr_name, (converter, value_from_data) in extra_data.items():
+                final_value = converter(value_from_data)
+                try:
+                    setattr(instance, attr_name, final_value)
+                except AttributeError:
+                    # e.g., property without setter, or __slots__ issue
+                    pass
 
             # Call post-deserialization hook if it exists
             if post_deserialize_hook_name and hasattr(
@@ -641,6 +793,424 @@ def json_serialize_list(obj: list[Any]) -> list[dict[str, Any]]:
     return [item.to_dict() for item in obj]
 
 
+def json_serialize_iter(
+    objs: Iterable[Any] | Stream[Any], fp: IO[str], ndjson: bool = False
+) -> int:
+    """
+    Serialize objects one by one into a text file-like object, as a JSON array or as
+    newline delimited JSON (one object per line). Only one object is held in memory at
+    a time, so the objects can come from a generator or a Stream.
+
+    Args:
+        objs (Iterable[Any] | Stream[Any]): The objects to serialize, each having a to_dict method
+        fp (IO[str]): The file-like object written to
+        ndjson (bool, optional): Write newline delimited JSON instead of an array. Defaults to False.
+
+    Returns:
+        int: The number of serialized objects
+
+    Raises:
+        TypeError: If an object does not have a to_dict method.
+    """
+    if isinstance(objs, Stream):
+        objs = objs.collect()
+    count = 0
+    if not ndjson:
+        fp.write("[")
+    for item in objs:
+        if not hasattr(item, "to_dict"):
+            raise TypeError(
+                f"{item.__class__.__name__} does not have a to_dict method."
+            )
+        if ndjson:
+            fp.write(json.dumps(item.to_dict()))
+            fp.write("\n")
+        else:
+            fp.write(",\n" if count else "\n")
+            fp.write(json.dumps(item.to_dict()))
+        count += 1
+    if not ndjson:
+        fp.write("\n]" if count else "]")
+    return count
+
+
+def _read_json_array(fp: IO[str], chunk_size: int) -> Iterator[Any]:
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+    expect_item = True
+
+    def fill() -> bool:
+        nonlocal buffer, pos, eof
+        if eof:
+            return False
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            eof = True
+            return False
+        # Drop the consumed part, so that memory is bounded by the largest item
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+
+    def skip_whitespace() -> bool:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buffer) or not fill():
+                return pos < len(buffer)
+
+    if not skip_whitespace() or buffer[pos] != "[":
+        raise ValueError("Expected a JSON array")
+    pos += 1
+    while True:
+        if not skip_whitespace():
+            raise ValueError("Unterminated JSON array")
+        if buffer[pos] == "]":
+            return
+        if not expect_item:
+            if buffer[pos] != ",":
+                raise ValueError(f"Expected ',' or ']' at position {pos}")
+            pos += 1
+            expect_item = True
+            continue
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # The item continues in the next chunk
+            if fill():
+                continue
+            raise
+        if end == len(buffer) and fill():
+            # A number at the end of the buffer may continue in the next chunk
+            continue
+        pos = end
+        expect_item = False
+        yield item
+
+
+def _read_ndjson(fp: IO[str]) -> Iterator[Any]:
+    for line in fp:
+        if line.strip():
+            yield json.loads(line)
+
+
+def json_deserialize_iter(
+    class_type: type[_T],
+    fp: IO[str],
+    ndjson: bool = False,
+    chunk_size: int = 65536,
+) -> Iterator[_T]:
+    """
+    Deserialize objects one by one from a text file-like object holding a JSON array,
+    or newline delimited JSON. The input is read incrementally, so memory use is bounded
+    by the size of a single object rather than the whole document.
+
+    Args:
+        class_type (type[_T]): The class of the objects, having a from_dict method
+        fp (IO[str]): The file-like object read from
+        ndjson (bool, optional): Read newline delimited JSON instead of an array. Defaults to False.
+        chunk_size (int, optional): The number of characters read at once from a JSON array. Defaults to 65536.
+
+    Returns:
+        Iterator[_T]: The deserialized objects
+
+    Raises:
+        TypeError: If the class does not have a from_dict method, or an element is not a dictionary.
+        ValueError: If the input is not valid JSON.
+    """
+    if not hasattr(class_type, "from_dict"):
+        raise TypeError(f"{class_type.__name__} does not have a from_dict method.")
+    from_dict = class_type.from_dict  # type: ignore[attr-defined]
+
+    def read() -> Iterator[_T]:
+        items = _read_ndjson(fp) if ndjson else _read_json_array(fp, chunk_size)
+        for item in items:
+            if not isinstance(item, dict):
+                raise TypeError(f"Expected a dictionary, got {type(item)}")
+            yield from_dict(item)
+
+    return read()
+
+
+def json_deserialize_stream(
+    class_type: type[_T],
+    fp: IO[str],
+    ndjson: bool = False,
+    chunk_size: int = 65536,
+) -> Stream[_T]:
+    """
+    Same as json_deserialize_iter, returning a lazy Stream over the deserialized objects.
+    """
+    return Stream(json_deserialize_iter(class_type, fp, ndjson, chunk_size))
+
+
+# Compact binary encoding of serialized objects. Dictionaries with string keys, such as
+# the ones produced by to_dict, are encoded positionally against their shape (the tuple
+# of their keys), which is written once per payload instead of repeating the keys.
+_BINARY_VERSION = 1
+(
+    _TAG_NONE,
+    _TAG_FALSE,
+    _TAG_TRUE,
+    _TAG_INT,
+    _TAG_FLOAT,
+    _TAG_STR,
+    _TAG_BYTES,
+    _TAG_LIST,
+    _TAG_DICT,
+    _TAG_SHAPED_DICT,
+) = range(10)
+_DOUBLE = struct.Struct("<d")
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class _BinaryEncoder:
+    __slots__ = ("out", "shapes")
+
+    def __init__(self) -> None:
+        self.out = bytearray()
+        self.shapes: dict[tuple[Any, ...], int] = {}
+
+    def encode(self, value: Any) -> None:
+        out = self.out
+        value_type = type(value)
+        if value_type is str:
+            encoded = value.encode()
+            out.append(_TAG_STR)
+            _write_varint(out, len(encoded))
+            out += encoded
+        elif value_type is dict:
+            keys = tuple(value)
+            shape = self.shapes.get(keys)
+            if shape is None and all(type(key) is str for key in keys):
+                shape = self.shapes[keys] = len(self.shapes)
+            if shape is None:
+                out.append(_TAG_DICT)
+                _write_varint(out, len(value))
+                for key, item in value.items():
+                    self.encode(key)
+                    self.encode(item)
+            else:
+                out.append(_TAG_SHAPED_DICT)
+                _write_varint(out, shape)
+                for item in value.values():
+                    self.encode(item)
+        elif value is None:
+            out.append(_TAG_NONE)
+        elif value_type is bool:
+            out.append(_TAG_TRUE if value else _TAG_FALSE)
+        elif value_type is int:
+            out.append(_TAG_INT)
+            # Zigzag encoding keeps small negative numbers short
+            _write_varint(out, value << 1 if value >= 0 else ((-value) << 1) - 1)
+        elif value_type is float:
+            out.append(_TAG_FLOAT)
+            out += _DOUBLE.pack(value)
+        elif value_type in (list, tuple):
+            out.append(_TAG_LIST)
+            _write_varint(out, len(value))
+            for item in value:
+                self.encode(item)
+        elif isinstance(value, (bytes, bytearray, memoryview)):
+            out.append(_TAG_BYTES)
+            _write_varint(out, len(value))
+            out += value
+        else:
+            self.encode_subclass(value)
+
+    def encode_subclass(self, value: Any) -> None:
+        # Subclasses of the basic types, such as IntEnum or str based enum values
+        for basic_type in (bool, int, float, str, list, tuple, dict):
+            if isinstance(value, basic_type):
+                self.encode(basic_type(value))
+                return
+        raise TypeError(f"Cannot encode value of type {type(value).__name__}")
+
+    def to_bytes(self) -> bytes:
+        header = bytearray((_BINARY_VERSION,))
+        _write_varint(header, len(self.shapes))
+        for keys in self.shapes:
+            _write_varint(header, len(keys))
+            for key in keys:
+                encoded = key.encode()
+                _write_varint(header, len(encoded))
+                header += encoded
+        header += self.out
+        return bytes(header)
+
+
+class _BinaryDecoder:
+    """
+    Reads a payload directly from a memoryview over the input, without copying it.
+    """
+
+    __slots__ = ("view", "pos", "shapes")
+
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
+        self.view = memoryview(data).cast("B")
+        self.pos = 0
+        self.shapes: list[tuple[str, ...]] = []
+
+    def read_varint(self) -> int:
+        view = self.view
+        pos = self.pos
+        result = view[pos]
+        if result < 0x80:
+            # Single byte, the common case for lengths and shape indexes
+            self.pos = pos + 1
+            return result
+        result = 0
+        shift = 0
+        while True:
+            byte = view[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        self.pos = pos
+        return result
+
+    def read_str(self) -> str:
+        length = self.read_varint()
+        start = self.pos
+        self.pos = start + length
+        if self.pos > len(self.view):
+            raise IndexError("String past the end of the payload")
+        return str(self.view[start : self.pos], "utf-8")
+
+    def read_header(self) -> None:
+        if self.view[0] != _BINARY_VERSION:
+            raise ValueError(f"Unsupported binary payload version {self.view[0]}")
+        self.pos = 1
+        for _ in range(self.read_varint()):
+            self.shapes.append(
+                tuple(self.read_str() for _ in range(self.read_varint()))
+            )
+
+    def decode(self) -> Any:
+        view = self.view
+        pos = self.pos
+        tag = view[pos]
+        self.pos = pos + 1
+        if tag == _TAG_SHAPED_DICT:
+            keys = self.shapes[self.read_varint()]
+            decode = self.decode
+            return {key: decode() for key in keys}
+        if tag == _TAG_STR:
+            length = view[pos + 1]
+            if length < 0x80:
+                # Short strings, read without a varint call
+                start = pos + 2
+                self.pos = start + length
+                if self.pos > len(view):
+                    raise IndexError("String past the end of the payload")
+                return str(view[start : self.pos], "utf-8")
+            return self.read_str()
+        if tag == _TAG_INT:
+            value = self.read_varint()
+            return value >> 1 if not value & 1 else -((value + 1) >> 1)
+        if tag == _TAG_NONE:
+            return None
+        if tag == _TAG_TRUE:
+            return True
+        if tag == _TAG_FALSE:
+            return False
+        if tag == _TAG_FLOAT:
+            (value,) = _DOUBLE.unpack_from(self.view, self.pos)
+            self.pos += 8
+            return value
+        if tag == _TAG_LIST:
+            return [self.decode() for _ in range(self.read_varint())]
+        if tag == _TAG_DICT:
+            return {self.decode(): self.decode() for _ in range(self.read_varint())}
+        if tag == _TAG_BYTES:
+            length = self.read_varint()
+            start = self.pos
+            self.pos = start + length
+            if self.pos > len(self.view):
+                raise IndexError("Bytes past the end of the payload")
+            return bytes(self.view[start : self.pos])
+        raise ValueError(f"Unknown binary tag {tag} at position {self.pos - 1}")
+
+
+def _binary_encode(value: Any) -> bytes:
+    encoder = _BinaryEncoder()
+    encoder.encode(value)
+    return encoder.to_bytes()
+
+
+def _binary_decode(data: bytes | bytearray | memoryview) -> Any:
+    decoder = _BinaryDecoder(data)
+    try:
+        decoder.read_header()
+        value = decoder.decode()
+    except (IndexError, struct.error) as e:
+        raise ValueError("Truncated or malformed binary payload") from e
+    if decoder.pos != len(decoder.view):
+        raise ValueError("Unexpected data after the end of the binary payload")
+    return value
+
+
+def binary_serialize(obj: Any) -> bytes:
+    """
+    Serialize an object into a compact binary payload. The object is converted using its
+    to_dict method, as for json_serialize, and field names are written once per payload
+    rather than once per object. Suited to caches, IPC and events exchanged between
+    processes using the same classes.
+    """
+    return _binary_encode(json_serialize(obj))
+
+
+def binary_serialize_list(obj: list[Any]) -> bytes:
+    """
+    Serialize a list of objects into a compact binary payload. See binary_serialize.
+    """
+    return _binary_encode(json_serialize_list(obj))
+
+
+def binary_deserialize(
+    class_type: type[_T], data: bytes | bytearray | memoryview
+) -> _T:
+    """
+    Deserialize a payload produced by binary_serialize into an instance of the specified
+    class type, using its from_dict method. The payload is read directly from the given
+    buffer, which can be a memoryview over shared memory or a larger message.
+
+    Raises:
+        ValueError: If the payload is malformed.
+    """
+    value = _binary_decode(data)
+    if not isinstance(value, dict):
+        raise TypeError(f"Expected a dictionary, got {type(value)}")
+    return json_deserialize(class_type, value)
+
+
+def binary_deserialize_list(
+    class_type: type[_T], data: bytes | bytearray | memoryview
+) -> list[_T]:
+    """
+    Deserialize a payload produced by binary_serialize_list into a list of instances of
+    the specified class type.
+
+    Raises:
+        ValueError: If the payload is malformed.
+    """
+    value = _binary_decode(data)
+    if not isinstance(value, list):
+        raise TypeError(f"Expected a list, got {type(value)}")
+    return json_deserialize_list(class_type, value)
+
+
 if sys.version_info >= (3, 10):
     from typing import ParamSpec
 
@@ -1,50 +1,262 @@
 from __future__ import annotations
-from threading import Lock, Thread
-from typing import Any, Generic, TypeVar
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, RLock
+from typing import Any, Generic, TypeVar, cast
 from collections.abc import Callable
-from jstreams.utils import each
 
 T = TypeVar("T")
 V = TypeVar("V")
 
+# Number of lock stripes used by the state manager. Keys are distributed over
+# the stripes by hash, so unrelated keys rarely contend on the same lock.
+_LOCK_STRIPES = 64
+# Maximum number of worker threads used to deliver asynchronous notifications
+_ASYNC_NOTIFICATION_WORKERS = 4
+
 
 class _State(Generic[T]):
-    __slots__ = ("__value", "__on_change_list", "__on_change_async_list")
+    __slots__ = (
+        "__value",
+        "__lock",
+        "__on_change_list",
+        "__on_change_async_list",
+        "__version",
+        "__pending_async",
+        "__pending_old_value",
+        "__dependents",
+    )
 
-    def __init__(
-        self,
-        value: T,
-    ) -> None:
+    def __init__(self, value: T, lock: RLock | None = None) -> None:
         self.__value = value
+        self.__lock = lock if lock is not None else RLock()
+        # Listener lists are copied on write, so notifications can iterate
+        # them without holding the lock.
         self.__on_change_list: list[Callable[[T, T], Any]] = []
         self.__on_change_async_list: list[Callable[[T, T], Any]] = []
+        self.__version = 0
+        self.__pending_async = False
+        self.__pending_old_value: T | None = None
+        self.__dependents: list[_Computed[Any]] = []
 
     def set_value(self, value: T) -> None:
-        old_value = self.__value
-        self.__value = value
-        if len(self.__on_change_async_list) > 0:
-            each(
-                self.__on_change_list,
-                lambda fn: Thread(target=lambda: fn(self.__value, old_value)).start(),
-            )
-        if len(self.__on_change_list) > 0:
-            each(self.__on_change_list, lambda fn: fn(self.__value, old_value))
+        with self.__lock:
+            old_value = self.__swap(value)
+        self.__notify(value, old_value)
+
+    def compare_and_set(self, expected: T, value: T) -> bool:
+        """
+        Atomically sets the value if the current value equals the expected one.
+
+        Args:
+            expected (T): The expected current value
+            value (T): The new value
+
+        Returns:
+            bool: True if the value was set, False otherwise
+        """
+        with self.__lock:
+            if self.__value != expected:
+                return False
+            old_value = self.__swap(value)
+        self.__notify(value, old_value)
+        return True
+
+    def update(self, fn: Callable[[T], T]) -> T:
+        """
+        Atomically replaces the value with the result of the given function
+        applied to the current value.
+
+        Args:
+            fn (Callable[[T], T]): The update function
+
+        Returns:
+            T: The new value
+        """
+        with self.__lock:
+            value = fn(self.__value)
+            old_value = self.__swap(value)
+        self.__notify(value, old_value)
+        return value
 
     def get_value(self) -> T:
         return self.__value
 
+    def get_version(self) -> int:
+        return self.__version
+
+    def add_dependent(self, dependent: _Computed[Any]) -> None:
+        with self.__lock:
+            self.__dependents = [*self.__dependents, dependent]
+
     def add_on_change(
         self, on_change: Callable[[T, T], Any] | None, asynchronous: bool
     ) -> None:
         if on_change is not None:
-            if asynchronous:
-                self.__on_change_async_list.append(on_change)
-            else:
-                self.__on_change_list.append(on_change)
+            with self.__lock:
+                if asynchronous:
+                    self.__on_change_async_list = [
+                        *self.__on_change_async_list,
+                        on_change,
+                    ]
+                else:
+                    self.__on_change_list = [*self.__on_change_list, on_change]
 
     def expand(self) -> tuple[Callable[[], T], Callable[[T], None]]:
         return self.get_value, self.set_value
 
+    def __swap(self, value: T) -> T:
+        # Must be called while holding the lock
+        old_value = self.__value
+        self.__value = value
+        self.__version += 1
+        # Successive sets are coalesced: only the first set after a flush
+        # schedules an asynchronous notification, keeping the oldest value seen.
+        if len(self.__on_change_async_list) > 0 and not self.__pending_async:
+            self.__pending_async = True
+            self.__pending_old_value = old_value
+            _state_manager().notify_async(self.__flush_async)
+        return old_value
+
+    def __notify(self, value: T, old_value: T) -> None:
+        for fn in self.__on_change_list:
+            fn(value, old_value)
+        if len(self.__dependents) > 0:
+            _propagate(self.__dependents)
+
+    def __flush_async(self) -> None:
+        # Notifications for one state are delivered by a single worker at a time.
+        # Changes made while listeners run are delivered in one follow-up round.
+        while True:
+            with self.__lock:
+                version = self.__version
+                old_value = self.__pending_old_value
+                value = self.__value
+                listeners = self.__on_change_async_list
+            for fn in listeners:
+                try:
+                    fn(value, old_value)  # type: ignore[arg-type]
+                except Exception as exc:
+                    logging.getLogger("state").error(exc)
+            with self.__lock:
+                if self.__version == version:
+                    self.__pending_async = False
+                    self.__pending_old_value = None
+                    return
+                self.__pending_old_value = value
+
+
+class _Computed(Generic[T]):
+    """
+    A derived state. The value is computed from the values of its dependencies,
+    memoized, and recomputed lazily only when the version of a dependency changed.
+    """
+
+    __slots__ = (
+        "__fn",
+        "__deps",
+        "__lock",
+        "__value",
+        "__dep_versions",
+        "__version",
+        "__rank",
+        "__on_change_list",
+        "__dependents",
+    )
+
+    def __init__(
+        self,
+        fn: Callable[..., T],
+        deps: list[_State[Any] | _Computed[Any]],
+    ) -> None:
+        self.__fn = fn
+        self.__deps = deps
+        # Computed nodes have their own lock. Since the dependency graph is acyclic,
+        # locks are always acquired in dependency order, and cannot deadlock.
+        self.__lock = RLock()
+        self.__value: T | None = None
+        self.__dep_versions: tuple[int, ...] | None = None
+        self.__version = 0
+        # The rank orders computed states topologically during change propagation
+        self.__rank = 1 + max(
+            (dep.rank() for dep in deps if isinstance(dep, _Computed)), default=0
+        )
+        self.__on_change_list: list[Callable[[T, T], Any]] = []
+        self.__dependents: list[_Computed[Any]] = []
+        for dep in deps:
+            dep.add_dependent(self)
+
+    def rank(self) -> int:
+        return self.__rank
+
+    def dependents(self) -> list[_Computed[Any]]:
+        return self.__dependents
+
+    def has_listeners(self) -> bool:
+        return len(self.__on_change_list) > 0
+
+    def get_value(self) -> T:
+        with self.__lock:
+            self.__refresh()
+            return cast(T, self.__value)
+
+    def get_version(self) -> int:
+        with self.__lock:
+            self.__refresh()
+            return self.__version
+
+    def add_dependent(self, dependent: _Computed[Any]) -> None:
+        with self.__lock:
+            self.__dependents = [*self.__dependents, dependent]
+
+    def add_on_change(self, on_change: Callable[[T, T], Any] | None) -> None:
+        if on_change is not None:
+            with self.__lock:
+                # Computes the initial value, so that the first change is notified
+                self.__refresh()
+                self.__on_change_list = [*self.__on_change_list, on_change]
+
+    def refresh_and_notify(self) -> None:
+        with self.__lock:
+            old_version = self.__version
+            old_value = self.__value
+            self.__refresh()
+            value = self.__value
+            changed = old_version != self.__version
+        if changed:
+            for fn in self.__on_change_list:
+                fn(value, old_value)
+
+    def __refresh(self) -> None:
+        # Must be called while holding the lock
+        dep_versions = tuple(dep.get_version() for dep in self.__deps)
+        if dep_versions == self.__dep_versions:
+            return
+        value = self.__fn(*[dep.get_value() for dep in self.__deps])
+        first = self.__dep_versions is None
+        self.__dep_versions = dep_versions
+        # Only bump the version when the value actually changed, so that
+        # downstream computed states are not recomputed needlessly
+        if first or value != self.__value:
+            self.__value = value
+            self.__version += 1
+
+
+def _propagate(dependents: list[_Computed[Any]]) -> None:
+    # Collects the downstream computed states and refreshes the ones having
+    # listeners in topological order, so listeners never observe a computed
+    # value derived from a mix of old and new upstream values.
+    seen: dict[int, _Computed[Any]] = {}
+    pending = list(dependents)
+    while len(pending) > 0:
+        computed = pending.pop()
+        if id(computed) not in seen:
+            seen[id(computed)] = computed
+            pending.extend(computed.dependents())
+    for computed in sorted(seen.values(), key=lambda c: c.rank()):
+        if computed.has_listeners():
+            computed.refresh_and_notify()
+
 
 class _StateManager:
     instance: _StateManager | None = None
@@ -52,6 +264,13 @@ class _StateManager:
 
     def __init__(self) -> None:
         self.__states: dict[str, _State[Any]] = {}
+        self.__computed: dict[str, _Computed[Any]] = {}
+        self.__locks: tuple[RLock, ...] = tuple(RLock() for _ in range(_LOCK_STRIPES))
+        self.__executor: ThreadPoolExecutor | None = None
+        self.__executor_lock = Lock()
+
+    def lock_for(self, key: str) -> RLock:
+        return self.__locks[hash(key) % _LOCK_STRIPES]
 
     def get_state(
         self,
@@ -60,14 +279,53 @@ class _StateManager:
         on_change: Callable[[T, T], Any] | None,
         asynchronous: bool,
     ) -> _State[T]:
-        if key in self.__states:
-            current_state = self.__states[key]
-            current_state.add_on_change(on_change, asynchronous)
-            return self.__states[key]
-        state = _State(value)
-        state.add_on_change(on_change, asynchronous)
-        self.__states[key] = state
-        return state
+        current_state = self.__states.get(key)
+        if current_state is None:
+            with self.lock_for(key):
+                current_state = self.__states.get(key)
+                if current_state is None:
+                    current_state = _State(value, self.lock_for(key))
+                    self.__states[key] = current_state
+        current_state.add_on_change(on_change, asynchronous)
+        return current_state
+
+    def find_state(self, key: str) -> _State[Any] | None:
+        return self.__states.get(key)
+
+    def get_computed(
+        self,
+        key: str,
+        fn: Callable[..., T],
+        deps: list[str],
+        on_change: Callable[[T, T], Any] | None,
+    ) -> _Computed[T]:
+        computed = self.__computed.get(key)
+        if computed is None:
+            with self.lock_for(key):
+                computed = self.__computed.get(key)
+                if computed is None:
+                    computed = _Computed(fn, [self.__find_node(dep) for dep in deps])
+                    self.__computed[key] = computed
+        computed.add_on_change(on_change)
+        return computed
+
+    def __find_node(self, key: str) -> _State[Any] | _Computed[Any]:
+        node: _State[Any] | _Computed[Any] | None = self.__states.get(key)
+        if node is None:
+            node = self.__computed.get(key)
+        if node is None:
+            raise ValueError(f"No state has been registered for key {key}")
+        return node
+
+    def notify_async(self, fn: Callable[[], Any]) -> None:
+        if self.__executor is None:
+            with self.__executor_lock:
+                if self.__executor is None:
+                    self.__executor = ThreadPoolExecutor(
+                        max_workers=_ASYNC_NOTIFICATION_WORKERS,
+                        thread_name_prefix="jstreams-state",
+                    )
+        self.__executor.submit(fn)
 
 
 def _state_manager() -> _StateManager:
@@ -132,10 +390,95 @@ def use_async_state(
         default_value (T): The default value of the state
         on_change (Callable[[T, T], Any] | None, optional): A function or method where the caller is notified about changes in the state.
             The first argument in this function will be the new state value, and the second will be the old state value.
-            The on change will be called asynchonously.
+            The on change will be called asynchonously, on a shared pool of notification threads.
+            Rapid successive changes are coalesced into a single notification, receiving the latest
+            value and the value before the first coalesced change.
             Defaults to None.
 
     Returns:
         tuple[Callable[[], T], Callable[[T], None]]: The getter and setter
     """
     return _state_manager().get_state(key, default_value, on_change, True).expand()
+
+
+def use_computed(
+    key: str,
+    fn: Callable[..., T],
+    deps: list[str],
+    on_change: Callable[[T, T], Any] | None = None,
+) -> Callable[[], T]:
+    """
+    Returns a getter for a computed state, derived from other managed states.
+    The computed value is memoized, and is recomputed lazily, when read, only if one
+    of its dependencies has changed since the last computation. Dependencies can
+    be both simple states and other computed states.
+
+    Example:
+        (get_price, set_price) = use_state("price", 10)
+        (get_qty, set_qty) = use_state("qty", 2)
+        get_total = use_computed("total", lambda price, qty: price * qty, ["price", "qty"])
+        get_total() # 20
+
+    Args:
+        key (str): The key of the computed state
+        fn (Callable[..., T]): The function computing the value. It receives the values of
+            the dependencies as positional arguments, in the order they are given in deps.
+        deps (list[str]): The keys of the states this computed state depends on. The states
+            must be registered before the computed state.
+        on_change (Callable[[T, T], Any] | None, optional): A function or method where the caller is notified
+            about changes in the computed value. Computed states having listeners are computed
+            when the listener is registered, then recomputed eagerly, in dependency order, when
+            an upstream state changes. Defaults to None.
+
+    Raises:
+        ValueError: Thrown when a dependency is not registered
+
+    Returns:
+        Callable[[], T]: The getter
+    """
+    return _state_manager().get_computed(key, fn, deps, on_change).get_value
+
+
+def _existing_state(key: str) -> _State[Any]:
+    state = _state_manager().find_state(key)
+    if state is None:
+        raise ValueError(f"No state has been registered for key {key}")
+    return state
+
+
+def compare_and_set_state(key: str, expected: T, value: T) -> bool:
+    """
+    Atomically sets the value of a managed state, if its current value equals the expected value.
+    On change listeners are notified only if the value was set.
+
+    Args:
+        key (str): The key of the state
+        expected (T): The expected current value
+        value (T): The new value
+
+    Raises:
+        ValueError: Thrown when no state exists for the given key
+
+    Returns:
+        bool: True if the value was set, False otherwise
+    """
+    return _existing_state(key).compare_and_set(expected, value)
+
+
+def update_state(key: str, updater: Callable[[T], T]) -> T:
+    """
+    Atomically updates the value of a managed state by applying the updater function
+    to the current value. The updater is called while holding the state lock, so it
+    should be fast and free of side effects.
+
+    Args:
+        key (str): The key of the state
+        updater (Callable[[T], T]): Function receiving the current value and returning the new one
+
+    Raises:
+        ValueError: Thrown when no state exists for the given key
+
+    Returns:
+        T: The new value
+    """
+    return cast(T, _existing_state(key).update(updater))
@@ -884,7 +884,11 @@ class Stream(Generic[T]):
 
     def filter(self, predicate: Callable[[T], bool]) -> Stream[T]:
         """
-        Returns a stream of objects that match the given predicate
+        Returns a stream of objects that match the given predicate.
+        When the stream is built from a list, tuple or range, the built-in predicates
+        (see `batch_function`) test the values in chunks. The chunks start at 8 values
+        and double up to 1024, so a short-circuiting operation such as `first` may
+        test values past the one it returns. Other predicates are never read ahead.
 
         Args:
             predicate (Callable[[T], bool]): The predicate
@@ -1,12 +1,17 @@
-from typing import Any, TypeVar
-from collections.abc import Callable, Iterable
-from jstreams.predicate import Predicate, is_none, not_, predicate_of
+from typing import Any
+from collections.abc import Iterable
+
+# all_of, any_of and none_of are defined along with the other predicate combinators
+from jstreams.predicate import (  # pylint: disable=unused-import
+    all_of,
+    any_of,
+    is_none,
+    none_of,
+    not_,
+)
 from jstreams.stream import Stream
 
 
-T = TypeVar("T")
-
-
 def all_none(it: Iterable[Any | None]) -> bool:
     """
     Checks if all elements in an iterable are None.
@@ -35,63 +40,3 @@ def all_not_none(it: Iterable[Any | None]) -> bool:
     # Using not_(is_none) might be slightly less direct than `lambda e: e is not None`
     # but maintains consistency with using predicate functions.
     return Stream(it).all_match(not_(is_none))
-
-
-def all_of(
-    predicates: Iterable[Callable[[T], bool]],
-) -> Predicate[T]:
-    """
-    Produces a predicate that returns True if the input value matches *all* provided predicates.
-    Short-circuits on the first False.
-
-    Args:
-        predicates: An iterable of predicates to check against.
-
-    Returns:
-        Predicate[T]: The combined predicate.
-    """
-    # Convert to list to avoid consuming iterator multiple times if stream doesn't cache
-
-    def wrap(val: T) -> bool:
-        return Stream(predicates).all_match(lambda p: p(val))
-
-    return predicate_of(wrap)
-
-
-def any_of(
-    predicates: Iterable[Callable[[T], bool]],
-) -> Predicate[T]:
-    """
-    Produces a predicate that returns True if the input value matches *any* of the provided predicates.
-    Short-circuits on the first True.
-
-    Args:
-        predicates: An iterable of predicates to check against.
-
-    Returns:
-        Predicate[T]: The combined predicate.
-    """
-
-    def wrap(val: T) -> bool:
-        return Stream(predicates).any_match(lambda p: p(val))
-
-    return predicate_of(wrap)
-
-
-def none_of(
-    predicates: Iterable[Callable[[T], bool]],
-) -> Predicate[T]:
-    """
-    Produces a predicate that returns True if the input value matches *none* of the provided predicates.
-
-    Args:
-        predicates: An iterable of predicates to check against.
-
-    Returns:
-        Predicate[T]: The combined predicate.
-    """
-
-    def wrap(val: T) -> bool:
-        return Stream(predicates).none_match(lambda p: p(val))
-
-    return predicate_of(wrap)
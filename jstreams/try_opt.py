@@ -1,7 +1,10 @@
 from __future__ import annotations
+import asyncio
+import inspect
 import logging
+import random
 from logging import Logger
-from time import sleep
+from time import monotonic, sleep
 from typing import (
     Any,
     Final,
@@ -10,9 +13,15 @@ from typing import (
     TypeVar,
     cast,
 )
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from jstreams.noop import noop
 from jstreams.predicate import is_identity
+from jstreams.resilience import (
+    Bulkhead,
+    BulkheadFullError,
+    CallNotPermittedError,
+    CircuitBreaker,
+)
 from jstreams.stream import Opt
 from jstreams.utils import require_non_null
 
@@ -100,6 +109,143 @@ def catch_with(
         return None
 
 
+async def _catch_with_async(
+    with_val: K,
+    fn: Callable[[K], Any],
+    logger: ErrorLogger | None = None,
+) -> None:
+    """
+    Like catch_with, but awaits the result when fn is a coroutine function.
+    """
+    try:
+        result = fn(with_val)
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        _log_exception(e, logger)
+
+
+def _select_recovery(
+    typed_suppliers: dict[type, Callable[[Any], Any]],
+    supplier: Callable[[Any], Any] | None,
+    exception: Exception,
+) -> Callable[[Any], Any] | None:
+    """
+    Returns the recovery supplier for the exception, preferring the typed ones.
+    """
+    for ex_type, typed_supplier in typed_suppliers.items():
+        if isinstance(exception, ex_type):
+            return typed_supplier
+    return supplier
+
+
+def _enter_guards(
+    breaker: CircuitBreaker | None, bulkhead: Bulkhead | None
+) -> int | None:
+    """
+    Obtains the circuit breaker permit and bulkhead slot of an attempt, raising a
+    CallNotPermittedError if either rejects it. Returns the permit, if any.
+    """
+    permit = breaker.acquire() if breaker is not None else None
+    if bulkhead is not None:
+        try:
+            bulkhead.acquire()
+        except BulkheadFullError:
+            if breaker is not None:
+                breaker.release(permit)
+            raise
+    return permit
+
+
+def _exit_guards(
+    breaker: CircuitBreaker | None,
+    bulkhead: Bulkhead | None,
+    permit: int | None,
+    exception: Exception | None,
+) -> None:
+    """Frees the bulkhead slot of an attempt and records its outcome."""
+    if bulkhead is not None:
+        bulkhead.release()
+    if breaker is not None:
+        if exception is None:
+            breaker.on_success(permit)
+        else:
+            breaker.on_failure(exception, permit)
+
+
+def _abandon_guards(
+    breaker: CircuitBreaker | None, bulkhead: Bulkhead | None, permit: int | None
+) -> None:
+    """Frees the guards of an interrupted attempt, whose outcome is unknown."""
+    if bulkhead is not None:
+        bulkhead.release()
+    if breaker is not None:
+        breaker.release(permit)
+
+
+class Backoff:
+    """
+    An exponential backoff policy for retries, optionally randomized with jitter.
+
+    The delay before retry n (counting from 0) is `initial * multiplier ** n`, capped
+    at `max_delay`. With a jitter j, each delay is drawn uniformly from
+    `[delay * (1 - j), delay]`, so a jitter of 1.0 is the "full jitter" strategy,
+    which keeps many clients that failed together from retrying in lockstep.
+
+    Example:
+        >>> Try(fetch).retry(5).with_backoff(Backoff(0.1, max_delay=2.0, jitter=1.0))
+    """
+
+    __slots__ = ("initial", "multiplier", "max_delay", "jitter")
+
+    def __init__(
+        self,
+        initial: float,
+        multiplier: float = 2.0,
+        max_delay: float | None = None,
+        jitter: float = 0.0,
+    ) -> None:
+        if initial < 0:
+            raise ValueError("Initial backoff delay cannot be negative.")
+        if multiplier < 1:
+            raise ValueError("Backoff multiplier cannot be lower than 1.")
+        if max_delay is not None and max_delay < 0:
+            raise ValueError("Maximum backoff delay cannot be negative.")
+        if not 0 <= jitter <= 1:
+            raise ValueError("Backoff jitter must be between 0 and 1.")
+        self.initial = initial
+        self.multiplier = multiplier
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, attempt: int) -> float:
+        """
+        Returns the delay in seconds before the given retry, counting from 0.
+        """
+        try:
+            delay = self.initial * self.multiplier**attempt
+        except OverflowError:
+            delay = float("inf")
+        if self.max_delay is not None and delay > self.max_delay:
+            delay = self.max_delay
+        if self.jitter:
+            delay -= random.random() * delay * self.jitter
+        return delay
+
+    @staticmethod
+    def fixed(delay: float) -> Backoff:
+        """
+        Creates a policy waiting the same delay before every retry.
+        """
+        return Backoff(delay, 1.0)
+
+    def __repr__(self) -> str:
+        return (
+            f"Backoff(initial={self.initial}, multiplier={self.multiplier}, "
+            f"max_delay={self.max_delay}, jitter={self.jitter})"
+        )
+
+
 __FAILURE_OBJECT__: Final[object] = object()
 
 
@@ -136,6 +282,10 @@ class Try(Generic[T]):
         "__retries_delay",
         "__is_resource",
         "__recovery_suppliers",
+        "__backoff",
+        "__deadline",
+        "__circuit_breaker",
+        "__bulkhead",
     )
 
     def __init__(self, fn: Callable[[], T], is_resource: bool = False) -> None:
@@ -160,6 +310,10 @@ class Try(Generic[T]):
         self.__retries: int = 0
         self.__retry_predicate: Callable[[Exception], bool] | None = None
         self.__retries_delay: float = 0.0
+        self.__backoff: Backoff | None = None
+        self.__deadline: float | None = None
+        self.__circuit_breaker: CircuitBreaker | None = None
+        self.__bulkhead: Bulkhead | None = None
 
     def mute(self) -> Try[T]:
         """
@@ -213,6 +367,46 @@ class Try(Generic[T]):
         """
         return self.retry_if(lambda _: True, retries, delay_between)
 
+    def with_backoff(self, backoff: Backoff) -> Try[T]:
+        """
+        Waits between retries according to the given backoff policy, instead of the
+        fixed `delay_between` given to `retry` or `retry_if`.
+        """
+        self.__backoff = require_non_null(backoff, "Backoff cannot be None.")
+        return self
+
+    def with_deadline(self, seconds: float) -> Try[T]:
+        """
+        Limits the total time spent on the operation and its retries. No retry is
+        started if its backoff delay would end past the deadline. The deadline
+        cannot interrupt a running attempt; see `AsyncTry.with_timeout` for that.
+        """
+        if seconds <= 0:
+            raise ValueError("Deadline must be positive.")
+        self.__deadline = seconds
+        return self
+
+    def with_circuit_breaker(self, breaker: CircuitBreaker) -> Try[T]:
+        """
+        Runs every attempt through the given circuit breaker, see `circuit_breaker`.
+        The outcome of each attempt, including its `and_then` chain, is recorded by
+        the breaker. While it is open, attempts fail fast with a
+        CircuitBreakerOpenError, which is not retried.
+        """
+        self.__circuit_breaker = require_non_null(
+            breaker, "Circuit breaker cannot be None."
+        )
+        return self
+
+    def with_bulkhead(self, bulkhead: Bulkhead) -> Try[T]:
+        """
+        Runs every attempt in a slot of the given bulkhead, see `bulkhead`. When no
+        slot is available, the attempt fails with a BulkheadFullError, which is not
+        retried. The slot is not held while waiting between retries.
+        """
+        self.__bulkhead = require_non_null(bulkhead, "Bulkhead cannot be None.")
+        return self
+
     def and_then(self, fn: Callable[[T], Any]) -> Try[T]:
         """
         Adds a function to be executed sequentially if the primary operation succeeds.
@@ -285,10 +479,22 @@ class Try(Generic[T]):
         self.__has_failed = False  # Reset failure flag for this execution attempt
         val: T | None = None
         last_exception: Exception | None = None
+        deadline_at = (
+            None if self.__deadline is None else monotonic() + self.__deadline
+        )
+        breaker = self.__circuit_breaker
+        bulkhead = self.__bulkhead
+        is_guarded = breaker is not None or bulkhead is not None
 
         # Loop for initial attempt + configured retries
         for attempt in range(self.__retries + 1):
+            guarded = False
+            permit: int | None = None
             try:
+                if is_guarded:
+                    permit = _enter_guards(breaker, bulkhead)
+                    guarded = True
+
                 # Execute the primary function
                 val = self.__fn()
                 if self.__is_resource:
@@ -299,26 +505,45 @@ class Try(Generic[T]):
                     # Exceptions in 'then' functions will be caught by the outer try-except
                     then_fn(val)
 
+                if guarded:
+                    guarded = False
+                    _exit_guards(breaker, bulkhead, permit, None)
                 last_exception = None  # Mark success for this attempt
                 break  # Exit loop on success
 
             except Exception as e:
                 last_exception = e
+                if guarded:
+                    guarded = False
+                    _exit_guards(breaker, bulkhead, permit, e)
                 if attempt < self.__retries:  # Check if more retries are available
                     # Check predicate if defined, default to True if not (e.g. direct call to retry())
-                    should_retry = (
+                    # Calls rejected by a circuit breaker or bulkhead are not retried
+                    should_retry = not isinstance(e, CallNotPermittedError) and (
                         self.__retry_predicate(e) if self.__retry_predicate else True
                     )
-                    if should_retry:
-                        if self.__retries_delay > 0:
-                            sleep(self.__retries_delay)
+                    delay = (
+                        self.__backoff.delay(attempt)
+                        if self.__backoff is not None
+                        else self.__retries_delay
+                    )
+                    if should_retry and (
+                        deadline_at is None or monotonic() + delay < deadline_at
+                    ):
+                        if delay > 0:
+                            sleep(delay)
                         continue  # Continue to the next retry iteration
-                    # Predicate returned false, do not retry further
+                    # Predicate returned false or the deadline would be exceeded,
+                    # do not retry further
                     self.__handle_exception(e)
                     break  # Exit retry loop
                 # No more retries left, handle the final exception
                 self.__handle_exception(e)
                 # Note: __handle_exception might raise if __failure_exception_supplier is set
+            except BaseException:
+                if guarded:
+                    _abandon_guards(breaker, bulkhead, permit)
+                raise
             finally:
                 if self.__is_resource and val is not None:
                     catch(val.__exit__, self.__error_log)  # type: ignore[attr-defined]
@@ -347,39 +572,26 @@ class Try(Generic[T]):
         self.get()
 
     def __recover(self, last_exception: Exception) -> Opt[T]:
-        # First try to recover for typed suppliers
-        for ex_type, supplier in self.__recovery_suppliers.items():
-            if isinstance(last_exception, ex_type):
-                try:
-                    return Opt(supplier(last_exception))
-                except Exception as recovery_exception:
-                    # Log the recovery failure
-                    _log_exception(
-                        recovery_exception,
-                        self.__error_log,
-                        "Exception during Try recovery",
-                    )
-                    # Recovery failed, return empty Opt
-                    return Opt(None)
-
-        if self.__recovery_supplier is not None:
-            # Attempt recovery
-            try:
-                # The recovery function itself might fail
-                recovered_val = self.__recovery_supplier(last_exception)
-                # If recovery succeeds, __has_failed remains True (as the original op failed),
-                # but we return the recovered value.
-                return Opt(recovered_val)
-            except Exception as recovery_exception:
-                # Log the recovery failure
-                _log_exception(
-                    recovery_exception,
-                    self.__error_log,
-                    "Exception during Try recovery",
-                )
-                # Recovery failed, return empty Opt
-                return Opt(None)
-        return Opt(None)
+        # Typed suppliers take precedence over the generic one
+        supplier = _select_recovery(
+            self.__recovery_suppliers, self.__recovery_supplier, last_exception
+        )
+        if supplier is None:
+            return Opt(None)
+        try:
+            # The recovery function itself might fail
+            # If recovery succeeds, __has_failed remains True (as the original op failed),
+            # but we return the recovered value.
+            return Opt(supplier(last_exception))
+        except Exception as recovery_exception:
+            # Log the recovery failure
+            _log_exception(
+                recovery_exception,
+                self.__error_log,
+                "Exception during Try recovery",
+            )
+            # Recovery failed, return empty Opt
+            return Opt(None)
 
     def on_failure_raise(self, exception_supplier: Callable[[], Exception]) -> Try[T]:
         """
@@ -493,6 +705,377 @@ class Try(Generic[T]):
     def with_resource(fn: Callable[[], T]) -> Try[T]:
         return Try(fn, True)
 
+    @staticmethod
+    def of_async(fn: Callable[[], Awaitable[K]]) -> AsyncTry[K]:
+        """
+        Creates an AsyncTry for a coroutine function.
+
+        Args:
+            fn: A function returning the awaitable to run on each attempt.
+
+        Returns:
+            AsyncTry[K]: A new AsyncTry instance.
+        """
+        return AsyncTry(fn)
+
+
+class AsyncTry(Generic[T]):
+    """
+    The asynchronous counterpart of Try, for operations implemented as coroutines.
+
+    Nothing runs until `get` is awaited. Retries wait with `asyncio.sleep`, so the
+    event loop keeps serving other tasks instead of a worker thread sleeping, each
+    attempt can be bounded by a timeout, and the whole operation by a deadline.
+    Chained functions, handlers and recovery suppliers may be plain functions or
+    coroutine functions.
+
+    Example:
+        >>> result = await (
+        ...     Try.of_async(lambda: client.fetch(url))
+        ...     .retry(4)
+        ...     .with_backoff(Backoff(0.2, max_delay=5.0, jitter=1.0))
+        ...     .with_timeout(2.0)
+        ...     .with_deadline(10.0)
+        ...     .get()
+        ... )
+    """
+
+    __slots__ = (
+        "__fn",
+        "__then_chain",
+        "__on_success_chain",
+        "__on_failure_chain",
+        "__finally_chain",
+        "__error_log",
+        "__error_message",
+        "__has_failed",
+        "__failure_exception_supplier",
+        "__recovery_supplier",
+        "__recovery_suppliers",
+        "__retries",
+        "__retry_predicate",
+        "__retries_delay",
+        "__backoff",
+        "__timeout",
+        "__deadline",
+        "__circuit_breaker",
+    )
+
+    def __init__(self, fn: Callable[[], Awaitable[T]]) -> None:
+        """
+        Initializes an AsyncTry operation.
+
+        Args:
+            fn: A function returning the awaitable to run, called on every attempt.
+        """
+        self.__fn = require_non_null(fn, "AsyncTry function cannot be None.")
+        self.__then_chain: list[Callable[[T], Any]] = []
+        self.__on_success_chain: list[Callable[[T | None], Any]] = []
+        self.__on_failure_chain: list[Callable[[Exception], Any]] = []
+        self.__finally_chain: list[Callable[[T | None], Any]] = []
+        self.__error_log: ErrorLogger | None = None
+        self.__error_message: str | None = None
+        self.__has_failed: bool = False
+        self.__failure_exception_supplier: Callable[[], Exception] | None = None
+        self.__recovery_supplier: Callable[[Exception | None], Any] | None = None
+        self.__recovery_suppliers: dict[type, Callable[[Any], Any]] = {}
+        self.__retries: int = 0
+        self.__retry_predicate: Callable[[Exception], bool] | None = None
+        self.__retries_delay: float = 0.0
+        self.__backoff: Backoff | None = None
+        self.__timeout: float | None = None
+        self.__deadline: float | None = None
+        self.__circuit_breaker: CircuitBreaker | None = None
+
+    def mute(self) -> AsyncTry[T]:
+        """Mutes the error logging for this AsyncTry instance."""
+        return self.with_logger(noop())
+
+    def with_logger(self, logger: ErrorLogger) -> AsyncTry[T]:
+        """Sets a specific logger for handling errors within this AsyncTry block."""
+        self.__error_log = logger
+        return self
+
+    def with_error_message(self, error_message: str) -> AsyncTry[T]:
+        """Sets a custom error message to be used when logging failures."""
+        self.__error_message = error_message
+        return self
+
+    def on_failure_log(self, message: str, error_log: ErrorLogger) -> AsyncTry[T]:
+        """Convenience method to set both an error message and a logger for failures."""
+        return self.with_error_message(message).with_logger(error_log)
+
+    def retry_if(
+        self,
+        predicate: Callable[[Exception], bool],
+        retries: int,
+        delay_between: float = 0.0,
+    ) -> AsyncTry[T]:
+        """
+        Configures the operation to retry on failure if the predicate is met.
+
+        Args:
+            predicate: A function that takes the caught exception and returns True if a retry should be attempted.
+            retries: The number of times to retry after the initial failure.
+            delay_between: The delay in seconds between retries, unless a backoff is set. Defaults to 0.
+        """
+        require_non_null(predicate, "Retry predicate cannot be None.")
+        if retries < 0:
+            raise ValueError("Number of retries cannot be negative.")
+        if delay_between < 0:
+            raise ValueError("Delay between retries cannot be negative.")
+        self.__retry_predicate = predicate
+        self.__retries = retries
+        self.__retries_delay = delay_between
+        return self
+
+    def retry(self, retries: int, delay_between: float = 0.0) -> AsyncTry[T]:
+        """
+        Configures the operation to retry on any failure.
+
+        Args:
+            retries: The number of times to retry after the initial failure.
+            delay_between: The delay in seconds between retries, unless a backoff is set. Defaults to 0.
+        """
+        return self.retry_if(lambda _: True, retries, delay_between)
+
+    def with_backoff(self, backoff: Backoff) -> AsyncTry[T]:
+        """Waits between retries according to the given backoff policy."""
+        self.__backoff = require_non_null(backoff, "Backoff cannot be None.")
+        return self
+
+    def with_timeout(self, seconds: float) -> AsyncTry[T]:
+        """
+        Cancels any attempt, including its `and_then` chain, running longer than the
+        given number of seconds. The attempt then fails with `asyncio.TimeoutError`,
+        which can be retried like any other failure.
+        """
+        if seconds <= 0:
+            raise ValueError("Timeout must be positive.")
+        self.__timeout = seconds
+        return self
+
+    def with_deadline(self, seconds: float) -> AsyncTry[T]:
+        """
+        Limits the total time spent on the operation and its retries. A running
+        attempt is cancelled when the deadline passes, and no retry is started if its
+        backoff delay would end past it.
+        """
+        if seconds <= 0:
+            raise ValueError("Deadline must be positive.")
+        self.__deadline = seconds
+        return self
+
+    def with_circuit_breaker(self, breaker: CircuitBreaker) -> AsyncTry[T]:
+        """
+        Runs every attempt through the given circuit breaker, like
+        `Try.with_circuit_breaker`. Timed out attempts are recorded as failures.
+        """
+        self.__circuit_breaker = require_non_null(
+            breaker, "Circuit breaker cannot be None."
+        )
+        return self
+
+    def and_then(self, fn: Callable[[T], Any]) -> AsyncTry[T]:
+        """
+        Adds a function to be executed sequentially if the primary operation succeeds.
+        Failures in 'and_then' functions cause the attempt to fail.
+        """
+        self.__then_chain.append(fn)
+        return self
+
+    def on_success(self, fn: Callable[[T | None], Any]) -> AsyncTry[T]:
+        """
+        Adds a function to be executed if the operation succeeds.
+        Exceptions in these handlers are caught and logged.
+        """
+        require_non_null(fn, "On success function cannot be None.")
+        self.__on_success_chain.append(fn)
+        return self
+
+    def on_failure(self, fn: Callable[[Exception], Any]) -> AsyncTry[T]:
+        """
+        Adds a function to be executed if the operation fails (after all retries).
+        Exceptions in these handlers are caught and logged.
+        """
+        self.__on_failure_chain.append(fn)
+        return self
+
+    def and_finally(self, fn: Callable[[T | None], Any]) -> AsyncTry[T]:
+        """
+        Adds a function to be executed after the operation completes, regardless of
+        success or failure. Exceptions in these handlers are caught and logged.
+        """
+        self.__finally_chain.append(fn)
+        return self
+
+    def on_failure_raise(
+        self, exception_supplier: Callable[[], Exception]
+    ) -> AsyncTry[T]:
+        """
+        Configures the operation to raise a specific exception on failure,
+        supplied by the provided function.
+        """
+        self.__failure_exception_supplier = exception_supplier
+        return self
+
+    def recover(
+        self, recovery_supplier: Callable[[Exception | None], Any]
+    ) -> AsyncTry[T]:
+        """
+        Provides a function to generate a recovery value if the operation fails.
+        """
+        self.__recovery_supplier = recovery_supplier
+        return self
+
+    def recover_from(
+        self, exception_type: type[EX_TYPE], recovery_supplier: Callable[[EX_TYPE], Any]
+    ) -> AsyncTry[T]:
+        self.__recovery_suppliers[exception_type] = recovery_supplier
+        return self
+
+    def recover_from_these(
+        self,
+        exception_types: list[type],
+        recovery_supplier: Callable[[BaseException], Any],
+    ) -> AsyncTry[T]:
+        for ex_type in exception_types:
+            self.__recovery_suppliers[ex_type] = recovery_supplier
+        return self
+
+    async def __attempt(self) -> T:
+        val = await self.__fn()
+        for then_fn in self.__then_chain:
+            result = then_fn(val)
+            if inspect.isawaitable(result):
+                await result
+        return val
+
+    def __retry_delay(
+        self, e: Exception, attempt: int, deadline_at: float | None, now: float
+    ) -> float | None:
+        """Returns the delay before the next retry, or None if it should not retry."""
+        if attempt >= self.__retries or isinstance(e, CallNotPermittedError):
+            return None
+        if self.__retry_predicate is not None and not self.__retry_predicate(e):
+            return None
+        delay = (
+            self.__backoff.delay(attempt)
+            if self.__backoff is not None
+            else self.__retries_delay
+        )
+        if deadline_at is not None and now + delay >= deadline_at:
+            return None
+        return delay
+
+    async def __handle_exception(self, e: Exception) -> None:
+        self.__has_failed = True
+        _log_exception(e, self.__error_log, self.__error_message)
+        for fail_fn in self.__on_failure_chain:
+            await _catch_with_async(e, fail_fn, self.__error_log)
+        if self.__failure_exception_supplier is not None:
+            raise self.__failure_exception_supplier()
+
+    async def __recover(self, last_exception: Exception) -> Opt[T]:
+        supplier = _select_recovery(
+            self.__recovery_suppliers, self.__recovery_supplier, last_exception
+        )
+        if supplier is None:
+            return Opt(None)
+        try:
+            recovered = supplier(last_exception)
+            if inspect.isawaitable(recovered):
+                recovered = await recovered
+            return Opt(recovered)
+        except Exception as recovery_exception:
+            _log_exception(
+                recovery_exception,
+                self.__error_log,
+                "Exception during Try recovery",
+            )
+            return Opt(None)
+
+    async def get(self) -> Opt[T]:
+        """
+        Runs the operation, including retries and handlers, on the running event loop.
+
+        Returns:
+            Opt[T]: An Opt containing the result on success or successful recovery,
+                    or an empty Opt if the operation failed and could not recover.
+        """
+        self.__has_failed = False
+        loop = asyncio.get_running_loop()
+        deadline_at = (
+            None if self.__deadline is None else loop.time() + self.__deadline
+        )
+        breaker = self.__circuit_breaker
+        val: T | None = None
+        last_exception: Exception | None = None
+        attempt = 0
+        while True:
+            timeout = self.__timeout
+            if deadline_at is not None:
+                remaining = deadline_at - loop.time()
+                timeout = remaining if timeout is None else min(timeout, remaining)
+            guarded = False
+            permit: int | None = None
+            try:
+                if breaker is not None:
+                    permit = breaker.acquire()
+                    guarded = True
+                if timeout is None:
+                    val = await self.__attempt()
+                else:
+                    val = await asyncio.wait_for(self.__attempt(), timeout)
+                if guarded:
+                    guarded = False
+                    _exit_guards(breaker, None, permit, None)
+                last_exception = None
+                break
+            except Exception as e:
+                last_exception = e
+                if guarded:
+                    guarded = False
+                    _exit_guards(breaker, None, permit, e)
+                delay = self.__retry_delay(e, attempt, deadline_at, loop.time())
+                if delay is None:
+                    await self.__handle_exception(e)
+                    break
+                attempt += 1
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            except BaseException:
+                # Cancelled, the outcome of the attempt is unknown
+                if guarded:
+                    _abandon_guards(breaker, None, permit)
+                raise
+
+        if last_exception is None:
+            for success_fn in self.__on_success_chain:
+                await _catch_with_async(val, success_fn, self.__error_log)
+
+        finally_val = val if last_exception is None else None
+        for finally_fn in self.__finally_chain:
+            await _catch_with_async(finally_val, finally_fn, self.__error_log)
+
+        if last_exception is None:
+            return Opt(val)
+        return await self.__recover(last_exception)
+
+    async def exec(self) -> None:
+        """
+        Runs the operation, including retries and handlers, discarding the result.
+        """
+        await self.get()
+
+    async def has_failed(self) -> bool:
+        """
+        Runs the operation and returns True if it failed after all retries, even if
+        a recovery supplier then provided a value.
+        """
+        await self.get()
+        return self.__has_failed
+
 
 def try_(fn: Callable[[], T]) -> Try[T]:
     """
@@ -508,6 +1091,20 @@ def try_(fn: Callable[[], T]) -> Try[T]:
     return Try(fn)
 
 
+def try_async(fn: Callable[[], Awaitable[T]]) -> AsyncTry[T]:
+    """
+    Factory function to create an AsyncTry instance from a coroutine function.
+    Syntactic sugar for `AsyncTry(fn)`.
+
+    Args:
+        fn: A function returning the awaitable to run on each attempt.
+
+    Returns:
+        AsyncTry[T]: A new AsyncTry instance.
+    """
+    return AsyncTry(fn)
+
+
 def try_with_resource(fn: Callable[[], T]) -> Try[T]:
     """
     Factory function to create a Try instance from a callable producing a closeable resource.
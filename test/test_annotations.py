@@ -159,6 +159,25 @@ class TestAnnotations(BaseTestCase):
             AttributeError, lambda: Test.builder().with__var_private(1).build()
         )
 
+    def test_generated_methods(self) -> None:
+        @builder()
+        @getter()
+        @setter()
+        class Test:
+            name: str
+            count: int
+
+        # The methods are defined on the classes, not resolved on each access
+        self.assertIn("with_name", vars(type(Test.builder())))
+        self.assertEqual(Test.get_name.__qualname__, f"{Test.__qualname__}.get_name")
+        self.assertEqual(Test.set_count.__name__, "set_count")
+        self.assertFalse(hasattr(Test.builder(), "__dict__"))
+
+        instance = Test.builder().with_name("a").build()
+        self.assertFalse(hasattr(instance, "count"))
+        instance.set_count(2)
+        self.assertEqual((instance.get_name(), instance.get_count()), ("a", 2))
+
     def test_locked_single_thread(self) -> None:
         """Tests basic functionality of @locked in a single thread."""
         LockedCounter = locked()(UnsafeCounter)  # Apply decorator manually for testing
@@ -0,0 +1,230 @@
+import asyncio
+import gc
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from baseTest import BaseTestCase
+from jstreams import AsyncStream, Collectors, Opt, async_stream
+
+
+async def numbers(count: int) -> AsyncIterator[int]:
+    for i in range(count):
+        await asyncio.sleep(0)
+        yield i
+
+
+async def double(value: int) -> int:
+    await asyncio.sleep(0.001)
+    return value * 2
+
+
+def run(coro: Any) -> Any:
+    return asyncio.run(coro)
+
+
+class TestAsyncStream(BaseTestCase):
+    def test_sources(self) -> None:
+        self.assertEqual(run(AsyncStream(numbers(3)).to_list()), [0, 1, 2])
+        self.assertEqual(run(async_stream([1, 2]).to_list()), [1, 2])
+        self.assertEqual(run(AsyncStream.of_items(1, 2).to_tuple()), (1, 2))
+        self.assertEqual(run(AsyncStream.empty().count()), 0)
+
+    def test_async_and_sync_functions(self) -> None:
+        async def is_even(value: int) -> bool:
+            return value % 2 == 0
+
+        async def pair(value: int) -> list[int]:
+            return [value, value]
+
+        result = run(
+            AsyncStream(numbers(6))
+            .filter(is_even)
+            .map(double)
+            .map(lambda v: v + 1)
+            .flat_map(pair)
+            .to_list()
+        )
+        self.assertEqual(result, [1, 1, 5, 5, 9, 9])
+
+    def test_flat_map_async_iterables(self) -> None:
+        result = run(AsyncStream([2, 3]).flat_map(numbers).to_list())
+        self.assertEqual(result, [0, 1, 0, 1, 2])
+
+    def test_chaining_operations(self) -> None:
+        seen: list[int] = []
+        result = run(
+            AsyncStream(numbers(20))
+            .each(seen.append)
+            .skip(2)
+            .drop_while(lambda v: v < 5)
+            .take_while(lambda v: v < 15)
+            .map(lambda v: v % 4)
+            .distinct()
+            .chunked(3)
+            .to_list()
+        )
+        self.assertEqual(result, [[1, 2, 3], [0]])
+        self.assertEqual(seen, list(range(16)))
+
+    def test_limit_stops_consuming(self) -> None:
+        pulled: list[int] = []
+        result = run(AsyncStream(numbers(100)).each(pulled.append).limit(3).to_list())
+        self.assertEqual(result, [0, 1, 2])
+        self.assertEqual(pulled, [0, 1, 2])
+
+    def test_terminal_operations(self) -> None:
+        async def checks() -> list[Any]:
+            return [
+                await AsyncStream(numbers(5)).first(),
+                await AsyncStream.empty().first(),
+                await AsyncStream(numbers(5)).find_first(lambda v: v > 2),
+                await AsyncStream(numbers(5)).any_match(lambda v: v == 4),
+                await AsyncStream(numbers(5)).all_match(lambda v: v < 4),
+                await AsyncStream(numbers(5)).none_match(lambda v: v > 4),
+                await AsyncStream(numbers(5)).reduce(lambda a, b: a + b),
+                await AsyncStream(numbers(3)).to_set(),
+                await AsyncStream(numbers(3)).to_dict(str, lambda v: v * v),
+                await AsyncStream([None, 1]).non_null().concat(numbers(2)).to_list(),
+                await AsyncStream([1, "a", 2]).of_type(int).to_list(),
+            ]
+
+        self.assertEqual(
+            run(checks()),
+            [
+                Opt(0),
+                Opt(None),
+                Opt(3),
+                True,
+                False,
+                True,
+                Opt(10),
+                {0, 1, 2},
+                {"0": 0, "1": 1, "2": 4},
+                [1, 0, 1],
+                [1, 2],
+            ],
+        )
+
+    def test_collectors_and_streams(self) -> None:
+        grouped = run(
+            AsyncStream(numbers(6)).collect_using(
+                Collectors.grouping_by(lambda v: v % 2)
+            )
+        )
+        self.assertEqual(grouped, {0: [0, 2, 4], 1: [1, 3, 5]})
+        stream = run(AsyncStream(numbers(3)).to_stream())
+        self.assertEqual(stream.map(str).to_list(), ["0", "1", "2"])
+
+    def test_for_each_and_async_for(self) -> None:
+        collected: list[int] = []
+
+        async def collect() -> list[int]:
+            await AsyncStream(numbers(3)).for_each(collected.append)
+            return [value async for value in AsyncStream(numbers(2)).map(double)]
+
+        self.assertEqual(run(collect()), [0, 2])
+        self.assertEqual(collected, [0, 1, 2])
+
+    def test_reiterable_sources(self) -> None:
+        stream = AsyncStream([1, 2, 3]).map(double).filter(lambda v: v > 2)
+        self.assertEqual(run(stream.to_list()), [4, 6])
+        self.assertEqual(run(stream.to_list()), [4, 6])
+        self.assertEqual(run(stream.concat([8]).count()), 3)
+
+        # Async generators and iterators can only be consumed once
+        generated = AsyncStream(numbers(2))
+        self.assertEqual(run(generated.to_list()), [0, 1])
+        self.assertEqual(run(generated.to_list()), [])
+        iterated = AsyncStream(iter([1]))
+        self.assertEqual(run(iterated.to_list()), [1])
+        self.assertEqual(run(iterated.to_list()), [])
+
+    def test_map_concurrent_is_bounded_and_ordered(self) -> None:
+        active = 0
+        max_active = 0
+
+        async def fetch(value: int) -> int:
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            # Later elements complete first
+            await asyncio.sleep(0.05 - value * 0.002)
+            active -= 1
+            return value
+
+        start = time.perf_counter()
+        result = run(AsyncStream(range(20)).map_concurrent(fetch, limit=5).to_list())
+        elapsed = time.perf_counter() - start
+        self.assertEqual(result, list(range(20)))
+        self.assertEqual(max_active, 5)
+        # Serial awaits would take about 0.6s
+        self.assertLess(elapsed, 0.4)
+
+    def test_map_concurrent_unordered(self) -> None:
+        async def fetch(value: int) -> int:
+            await asyncio.sleep(0.03 if value == 0 else 0.0)
+            return value
+
+        result = run(
+            AsyncStream(numbers(4)).map_concurrent(fetch, 4, ordered=False).to_list()
+        )
+        self.assertEqual(sorted(result), [0, 1, 2, 3])
+        self.assertEqual(result[-1], 0)
+
+    def test_map_concurrent_error_cancels_pending(self) -> None:
+        cancelled: list[int] = []
+
+        async def fetch(value: int) -> int:
+            if value == 0:
+                raise ValueError("failed")
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(value)
+                raise
+            return value
+
+        async def consume() -> None:
+            try:
+                await AsyncStream(range(3)).map_concurrent(fetch, 3).to_list()
+            finally:
+                await asyncio.sleep(0)
+
+        self.assertRaises(ValueError, lambda: run(consume()))
+        self.assertEqual(sorted(cancelled), [1, 2])
+
+    def test_map_concurrent_retrieves_every_error(self) -> None:
+        closed: list[bool] = []
+
+        async def source() -> AsyncIterator[int]:
+            try:
+                for i in range(3):
+                    yield i
+            finally:
+                closed.append(True)
+
+        async def boom(value: int) -> int:
+            raise ValueError(value)
+
+        async def consume(ordered: bool) -> list[dict[str, Any]]:
+            errors: list[dict[str, Any]] = []
+            asyncio.get_running_loop().set_exception_handler(
+                lambda _, context: errors.append(context)
+            )
+            stream = AsyncStream(source()).map_concurrent(boom, 3, ordered=ordered)
+            with self.assertRaises(ValueError):
+                await stream.to_list()
+            await asyncio.sleep(0)
+            gc.collect()
+            return errors
+
+        self.assertEqual(run(consume(True)), [])
+        self.assertEqual(run(consume(False)), [])
+        self.assertEqual(closed, [True, True])
+
+    def test_invalid_arguments(self) -> None:
+        self.assertRaises(
+            ValueError, lambda: AsyncStream([1]).map_concurrent(double, 0)
+        )
+        self.assertRaises(ValueError, lambda: AsyncStream([1]).chunked(0))
@@ -0,0 +1,189 @@
+import asyncio
+import time
+from typing import Any
+
+from baseTest import BaseTestCase
+from jstreams import AsyncTry, Backoff, Try, try_async
+
+
+class Flaky:
+    def __init__(self, failures: int, delay: float = 0.0) -> None:
+        self.failures = failures
+        self.delay = delay
+        self.calls = 0
+
+    async def call(self) -> str:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.calls <= self.failures:
+            raise ValueError(f"failure {self.calls}")
+        return "done"
+
+
+def run(coro: Any) -> Any:
+    return asyncio.run(coro)
+
+
+class TestBackoff(BaseTestCase):
+    def test_exponential_delays(self) -> None:
+        backoff = Backoff(0.1, max_delay=0.5)
+        self.assertEqual(
+            [round(backoff.delay(i), 3) for i in range(5)],
+            [0.1, 0.2, 0.4, 0.5, 0.5],
+        )
+        self.assertEqual(Backoff.fixed(0.3).delay(10), 0.3)
+        self.assertEqual(Backoff(1.0, max_delay=2.0).delay(5000), 2.0)
+
+    def test_jitter(self) -> None:
+        backoff = Backoff(1.0, jitter=0.5)
+        delays = [backoff.delay(1) for _ in range(200)]
+        self.assertTrue(all(1.0 <= delay <= 2.0 for delay in delays))
+        self.assertGreater(len(set(delays)), 1)
+
+    def test_invalid(self) -> None:
+        self.assertRaises(ValueError, lambda: Backoff(-1))
+        self.assertRaises(ValueError, lambda: Backoff(1, multiplier=0.5))
+        self.assertRaises(ValueError, lambda: Backoff(1, max_delay=-1))
+        self.assertRaises(ValueError, lambda: Backoff(1, jitter=2))
+
+
+class TestTryBackoff(BaseTestCase):
+    def test_backoff_and_deadline(self) -> None:
+        calls: list[float] = []
+
+        def fail() -> None:
+            calls.append(time.monotonic())
+            raise ValueError("fail")
+
+        result = (
+            Try(fail)
+            .mute()
+            .retry(10)
+            .with_backoff(Backoff(0.02, max_delay=0.05))
+            .with_deadline(0.15)
+            .get()
+        )
+        self.assertTrue(result.is_empty())
+        self.assertLess(len(calls), 11)
+        self.assertLess(calls[-1] - calls[0], 0.15)
+        self.assertGreaterEqual(calls[2] - calls[1], 0.035)
+
+
+class TestAsyncTry(BaseTestCase):
+    def test_success(self) -> None:
+        chained: list[str] = []
+
+        async def on_success(value: Any) -> None:
+            chained.append(f"success {value}")
+
+        result = run(
+            Try.of_async(Flaky(0).call)
+            .and_then(chained.append)
+            .on_success(on_success)
+            .and_finally(lambda v: chained.append(f"finally {v}"))
+            .get()
+        )
+        self.assertEqual(result.get(), "done")
+        self.assertEqual(chained, ["done", "success done", "finally done"])
+
+    def test_retries_with_backoff(self) -> None:
+        flaky = Flaky(2)
+        result = run(
+            try_async(flaky.call).mute().retry(3).with_backoff(Backoff(0.01)).get()
+        )
+        self.assertEqual(result.get(), "done")
+        self.assertEqual(flaky.calls, 3)
+
+    def test_failure_and_recovery(self) -> None:
+        flaky = Flaky(100)
+        errors: list[Exception] = []
+
+        async def recover(_: Any) -> str:
+            return "recovered"
+
+        operation = (
+            AsyncTry(flaky.call)
+            .mute()
+            .retry(2)
+            .on_failure(errors.append)
+            .recover_from(ValueError, recover)
+        )
+        self.assertEqual(run(operation.get()).get(), "recovered")
+        self.assertEqual(flaky.calls, 3)
+        self.assertEqual(str(errors[0]), "failure 3")
+        self.assertTrue(run(operation.has_failed()))
+
+    def test_retry_if(self) -> None:
+        flaky = Flaky(5)
+        result = run(
+            AsyncTry(flaky.call)
+            .mute()
+            .retry_if(lambda e: str(e) != "failure 2", 5)
+            .get()
+        )
+        self.assertTrue(result.is_empty())
+        self.assertEqual(flaky.calls, 2)
+
+    def test_attempt_timeout_is_retried(self) -> None:
+        slow = Flaky(0, delay=1.0)
+
+        async def call() -> str:
+            slow.delay = 1.0 if slow.calls == 0 else 0.0
+            return await slow.call()
+
+        start = time.perf_counter()
+        result = run(AsyncTry(call).mute().retry(1).with_timeout(0.05).get())
+        self.assertEqual(result.get(), "done")
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+    def test_timeout_failure(self) -> None:
+        errors: list[Exception] = []
+        run(
+            AsyncTry(Flaky(0, delay=1.0).call)
+            .mute()
+            .with_timeout(0.02)
+            .on_failure(errors.append)
+            .get()
+        )
+        self.assertIsInstance(errors[0], asyncio.TimeoutError)
+
+    def test_deadline(self) -> None:
+        flaky = Flaky(100, delay=0.03)
+        start = time.perf_counter()
+        result = run(
+            AsyncTry(flaky.call).mute().retry(100, 0.01).with_deadline(0.2).get()
+        )
+        elapsed = time.perf_counter() - start
+        self.assertTrue(result.is_empty())
+        self.assertLess(elapsed, 0.3)
+        self.assertLess(flaky.calls, 10)
+
+    def test_retries_do_not_block_the_loop(self) -> None:
+        ticks: list[int] = []
+
+        async def ticker() -> None:
+            for i in range(5):
+                ticks.append(i)
+                await asyncio.sleep(0.01)
+
+        async def main() -> Any:
+            flaky = Flaky(1)
+            return await asyncio.gather(
+                AsyncTry(flaky.call).mute().retry(1, 0.1).get(), ticker()
+            )
+
+        result, _ = run(main())
+        self.assertEqual(result.get(), "done")
+        self.assertEqual(ticks, [0, 1, 2, 3, 4])
+
+    def test_on_failure_raise(self) -> None:
+        operation = (
+            AsyncTry(Flaky(1).call).mute().on_failure_raise(lambda: KeyError("x"))
+        )
+        self.assertRaises(KeyError, lambda: run(operation.get()))
+
+    def test_invalid_configuration(self) -> None:
+        operation = AsyncTry(Flaky(0).call)
+        self.assertRaises(ValueError, lambda: operation.retry(-1))
+        self.assertRaises(ValueError, lambda: operation.with_timeout(0))
+        self.assertRaises(ValueError, lambda: operation.with_deadline(-1))
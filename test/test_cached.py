@@ -0,0 +1,204 @@
+import asyncio
+import threading
+import time
+from typing import Any, Callable
+
+from baseTest import BaseTestCase
+from jstreams.annotations import _lock_registry, cached, memoize
+
+
+def run_threads(target: Callable[[], Any], count: int) -> None:
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestCached(BaseTestCase):
+    def test_memoize(self) -> None:
+        calls: list[int] = []
+
+        @memoize()
+        def square(value: int) -> int:
+            calls.append(value)
+            return value * value
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(value=3), 9)
+        self.assertEqual(calls, [3, 3])
+        stats = square.cache_stats()  # type: ignore[attr-defined]
+        self.assertEqual((stats.hits, stats.misses, stats.size), (1, 2, 2))
+        self.assertEqual(square.__name__, "square")
+
+    def test_keyword_arguments_are_keyed_apart(self) -> None:
+        @memoize()
+        def describe(*args: Any, **kwargs: Any) -> str:
+            return f"{args} {kwargs}"
+
+        self.assertEqual(describe(1, k=2), "(1,) {'k': 2}")
+        self.assertEqual(
+            describe((1,), frozenset({("k", 2)})),
+            "((1,), frozenset({('k', 2)})) {}",
+        )
+        self.assertEqual(describe(1, (("k", 2),)), "(1, (('k', 2),)) {}")
+        self.assertEqual(describe(a=1, b=2), describe(b=2, a=1))
+
+    def test_lru_eviction(self) -> None:
+        @cached(max_size=2)
+        def identity(value: int) -> int:
+            return value
+
+        identity(1)
+        identity(2)
+        identity(1)
+        # 2 is the least recently used
+        identity(3)
+        identity(1)
+        stats = identity.cache_stats()  # type: ignore[attr-defined]
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (2, 3, 1))
+        identity(2)
+        self.assertEqual(identity.cache_stats().misses, 4)  # type: ignore[attr-defined]
+
+    def test_lfu_eviction(self) -> None:
+        @cached(max_size=2, policy="lfu")
+        def identity(value: int) -> int:
+            return value
+
+        identity(1)
+        identity(1)
+        identity(2)
+        identity(2)
+        identity(2)
+        identity(3)  # Evicts 1, used twice
+        identity(2)
+        identity(3)
+        self.assertEqual(identity.cache_stats().misses, 3)  # type: ignore[attr-defined]
+        identity(4)  # Evicts 3, used twice
+        identity(2)
+        self.assertEqual(identity.cache_stats().misses, 4)  # type: ignore[attr-defined]
+        identity(1)
+        stats = identity.cache_stats()  # type: ignore[attr-defined]
+        self.assertEqual((stats.misses, stats.evictions, stats.size), (5, 3, 2))
+
+    def test_ttl(self) -> None:
+        calls: list[int] = []
+
+        @cached(ttl=0.05)
+        def load(value: int) -> int:
+            calls.append(value)
+            return value
+
+        load(1)
+        load(1)
+        time.sleep(0.08)
+        load(1)
+        self.assertEqual(calls, [1, 1])
+        self.assertEqual(load.cache_stats().expirations, 1)  # type: ignore[attr-defined]
+
+    def test_custom_key_and_invalidation(self) -> None:
+        calls: list[str] = []
+
+        @cached(key=lambda name, **_: name.lower())
+        def greet(name: str, punctuation: str = "!") -> str:
+            calls.append(name)
+            return f"Hello {name}{punctuation}"
+
+        self.assertEqual(greet("Ann"), "Hello Ann!")
+        self.assertEqual(greet("ANN", punctuation="?"), "Hello Ann!")
+        greet.invalidate("ann")  # type: ignore[attr-defined]
+        greet("Ann")
+        greet.invalidate_all()  # type: ignore[attr-defined]
+        greet("Ann")
+        self.assertEqual(calls, ["Ann", "Ann", "Ann"])
+
+    def test_errors_are_not_cached(self) -> None:
+        attempts: list[int] = []
+
+        @cached()
+        def fail_once(value: int) -> int:
+            attempts.append(value)
+            if len(attempts) == 1:
+                raise ValueError("first")
+            return value
+
+        self.assertRaises(ValueError, lambda: fail_once(1))
+        self.assertEqual(fail_once(1), 1)
+        self.assertEqual(attempts, [1, 1])
+
+    def test_single_flight(self) -> None:
+        calls: list[int] = []
+
+        @cached()
+        def slow(value: int) -> int:
+            calls.append(value)
+            time.sleep(0.05)
+            return value
+
+        results: list[int] = []
+        run_threads(lambda: results.append(slow(1)), 8)
+        self.assertEqual(calls, [1])
+        self.assertEqual(results, [1] * 8)
+        stats = slow.cache_stats()  # type: ignore[attr-defined]
+        self.assertEqual(stats.misses, 1)
+        self.assertEqual(stats.coalesced + stats.hits, 7)
+
+    def test_single_flight_error(self) -> None:
+        @cached()
+        def slow_failure(value: int) -> int:
+            time.sleep(0.05)
+            raise ValueError(str(value))
+
+        errors: list[BaseException] = []
+
+        def call() -> None:
+            try:
+                slow_failure(1)
+            except ValueError as e:
+                errors.append(e)
+
+        run_threads(call, 4)
+        self.assertEqual(len(errors), 4)
+
+    def test_lock_registry(self) -> None:
+        @cached(lock_name="shared_cache_lock")
+        def identity(value: int) -> int:
+            return value
+
+        identity(1)
+        self.assertIn("shared_cache_lock", _lock_registry)
+
+    def test_invalid_arguments(self) -> None:
+        self.assertRaises(ValueError, lambda: cached(policy="fifo"))
+        self.assertRaises(ValueError, lambda: cached(max_size=0))
+
+    def test_async(self) -> None:
+        calls: list[int] = []
+
+        @cached()
+        async def load(value: int) -> int:
+            calls.append(value)
+            await asyncio.sleep(0.02)
+            return value * 2
+
+        async def run() -> list[int]:
+            first = await asyncio.gather(*(load(2) for _ in range(5)))
+            return [*first, await load(2)]
+
+        self.assertEqual(asyncio.run(run()), [4] * 6)
+        self.assertEqual(calls, [2])
+        stats = load.cache_stats()  # type: ignore[attr-defined]
+        self.assertEqual((stats.misses, stats.coalesced, stats.hits), (1, 4, 1))
+
+    def test_async_error(self) -> None:
+        @cached()
+        async def fail(value: int) -> int:
+            await asyncio.sleep(0.01)
+            raise ValueError(str(value))
+
+        async def run() -> list[Any]:
+            return await asyncio.gather(fail(1), fail(1), return_exceptions=True)
+
+        results = asyncio.run(run())
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
@@ -4,6 +4,7 @@ from baseTest import BaseTestCase
 from jstreams import Dependency, injector
 from jstreams.ioc import (
     InjectedDependency,
+    OptionalDependency,
     StrVariable,
     inject_args,
     resolve_all,
@@ -11,7 +12,7 @@ from jstreams.ioc import (
     resolve_variables,
 )
 from jstreams.predicate import equals
-from jstreams.utils import Value
+from jstreams.utils import TypeInjectionError, Value
 
 SUCCESS = "SUCCESS"
 
@@ -223,5 +224,124 @@ class TestIOC(BaseTestCase):
         injector().provide(str, "test1", "qual")
         injector().get(str)
         injector().get(str, "qual")
-        self.assertTrue((str, None) in injector()._Injector__comp_cache)
-        self.assertTrue((str, "qual") in injector()._Injector__comp_cache)
+        self.assertTrue((str, None, None) in injector()._Injector__comp_cache)
+        self.assertTrue((str, "qual", None) in injector()._Injector__comp_cache)
+
+    def test_resolve_replaces_field_after_resolution(self) -> None:
+        @resolve_dependencies({"str_val": str, "opt_val": OptionalDependency(int)})
+        class Test:
+            str_val: str
+            opt_val: Optional[int]
+
+        injector().provide(str, "test")
+        test = Test()
+        self.assertEqual(test.str_val, "test")
+        self.assertIsNone(test.opt_val)
+        # The resolved field is now a plain class attribute
+        self.assertEqual(Test.__dict__["str_val"], "test")
+        injector().provide(int, 5)
+        self.assertEqual(test.opt_val, 5)
+        self.assertEqual(Test.__dict__["opt_val"], 5)
+
+    def test_resolve_eager(self) -> None:
+        @resolve_dependencies({"str_val": str, "int_val": int}, eager=True)
+        class Test:
+            str_val: str
+            int_val: int
+
+        injector().provide(str, "test")
+        injector().provide(int, 1)
+        self.assertEqual(Test().str_val, "test")
+        self.assertEqual(Test.__dict__["int_val"], 1)
+
+    def test_resolve_eager_on_other_attribute(self) -> None:
+        @resolve_dependencies({"str_val": str, "int_val": int}, eager=True)
+        class Test:
+            str_val: str
+            int_val: int
+
+            def name(self) -> str:
+                return "test"
+
+        injector().provide(str, "test")
+        injector().provide(int, 1)
+        self.assertEqual(Test().name(), "test")
+        self.assertEqual(Test.__dict__["str_val"], "test")
+        self.assertEqual(Test.__dict__["int_val"], 1)
+
+    def test_inject_args_defaults_and_errors(self) -> None:
+        @inject_args({"a": int, "b": str})
+        def fn(a: int, b: str = "default") -> str:
+            return str(a) + "_" + b
+
+        injector().provide(str, "test")
+        injector().provide(int, 1)
+        self.assertEqual(fn(), "1_default")
+        self.assertEqual(fn(2, "x"), "2_x")
+        self.assertThrowsExceptionOfType(
+            lambda: fn(1, "x", 3), TypeInjectionError
+        )
+        self.assertThrowsExceptionOfType(
+            lambda: fn(unknown=1), TypeInjectionError
+        )
+        self.assertThrowsExceptionOfType(
+            lambda: fn(1, a=2), TypeInjectionError
+        )
+
+    def test_inject_args_positional_only_and_var_keyword(self) -> None:
+        @inject_args({"b": int})
+        def fn(a: int, /, b: int, **named: int) -> int:
+            return a + b + sum(named.values())
+
+        injector().provide(int, 1)
+        # The keyword argument goes to **named, not to the positional only a
+        self.assertEqual(fn(2, a=3), 6)
+
+    def test_cache_invalidated_on_provide(self) -> None:
+        injector().provide(str, "first")
+        self.assertEqual(injector().get(str), "first")
+        injector().provide(str, "second")
+        self.assertEqual(injector().get(str), "second")
+
+    def test_cache_keyed_by_profile(self) -> None:
+        injector().provide(str, "default")
+        injector().provide(str, "profiled", profiles=["p1"])
+        self.assertEqual(injector().get(str), "default")
+        injector().activate_profile("p1")
+        self.assertEqual(injector().get(str), "profiled")
+        self.assertTrue((str, None, "p1") in injector()._Injector__comp_cache)
+
+    def test_all_of_type_skips_unrelated_components(self) -> None:
+        created = Value(False)
+
+        def produce() -> str:
+            created.set(True)
+            return "test"
+
+        injector().provide(str, produce)
+        injector().provide(TestInterface, TestInterfaceImplementation())
+        self.assertEqual(len(injector().all_of_type(TestInterface)), 1)
+        self.assertEqual(len(injector().all_of_type(TestInterfaceImplementation)), 1)
+        self.assertFalse(created.get(), "Unrelated components should not be created")
+
+    def test_all_of_type_finds_components_by_their_other_bases(self) -> None:
+        class First:
+            pass
+
+        class Second:
+            pass
+
+        class Both(First, Second):
+            pass
+
+        def produce() -> Both:
+            return Both()
+
+        instance = Both()
+        injector().provide(First, instance)
+        injector().provide(First, produce, "factory")
+        # Without a return annotation, the factory is called to find its type
+        injector().provide(First, lambda: Both(), "lambda")
+        found = injector().all_of_type(Second)
+        self.assertEqual(len(found), 3)
+        self.assertIn(instance, found)
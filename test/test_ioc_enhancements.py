@@ -1,5 +1,19 @@
+import asyncio
+from threading import Thread
+from time import perf_counter, sleep
 from baseTest import BaseTestCase
-from jstreams.ioc import injector, component, Scope, AutoClose, inject
+from jstreams.ioc import (
+    injector,
+    component,
+    Scope,
+    AutoClose,
+    inject,
+    inject_args,
+    pre_destroy,
+    request_scope,
+    resolve_dependencies,
+)
+from jstreams.utils import ValueInjectionError
 
 
 class TestIocEnhancements(BaseTestCase):
@@ -66,3 +80,123 @@ class TestIocEnhancements(BaseTestCase):
             closed_flag["closed"],
             "Prototype components should not be managed/closed by container",
         )
+
+    def test_warm_up_dependency_order(self) -> None:
+        created: list[str] = []
+
+        class Repository:
+            def __init__(self) -> None:
+                created.append("repository")
+
+        class Consumer:
+            @inject_args({"repository": Repository})
+            def __init__(self, repository: Repository) -> None:
+                created.append("consumer")
+                self.repository = repository
+
+        @resolve_dependencies({"consumer": Consumer})
+        class Controller:
+            def __init__(self) -> None:
+                created.append("controller")
+
+        # Register the components in reverse dependency order
+        component(qualifier="web")(Controller)
+        component()(Consumer)
+        component()(Repository)
+
+        timings = injector().warm_up(parallel=4)
+        self.assertEqual(created, ["repository", "consumer", "controller"])
+        self.assertEqual(
+            set(timings.keys()),
+            {(Consumer, None), (Repository, None), (Controller, "web")},
+        )
+        # Singletons are already created
+        self.assertIs(inject(Consumer).repository, inject(Repository))
+        self.assertEqual(len(created), 3)
+
+    def test_warm_up_parallel(self) -> None:
+        @component()
+        class SlowComponent1:
+            def __init__(self) -> None:
+                sleep(0.3)
+
+        @component()
+        class SlowComponent2:
+            def __init__(self) -> None:
+                sleep(0.3)
+
+        start = perf_counter()
+        timings = injector().warm_up(parallel=2)
+        self.assertLess(perf_counter() - start, 0.55)
+        self.assertGreaterEqual(timings[(SlowComponent1, None)], 0.29)
+
+    def test_warm_up_skips_prototypes(self) -> None:
+        @component(scope=Scope.PROTOTYPE)
+        class PrototypeComponent:
+            pass
+
+        self.assertEqual(injector().warm_up(), {})
+
+    def test_request_scope(self) -> None:
+        destroyed: list[str] = []
+
+        @component(scope=Scope.REQUEST)
+        class RequestComponent:
+            @pre_destroy
+            def destroy(self) -> None:
+                destroyed.append("destroyed")
+
+        with request_scope():
+            instance1 = inject(RequestComponent)
+            self.assertIs(instance1, inject(RequestComponent))
+        self.assertEqual(destroyed, ["destroyed"])
+
+        with request_scope():
+            self.assertIsNot(instance1, inject(RequestComponent))
+        self.assertEqual(len(destroyed), 2)
+
+        self.assertThrowsExceptionOfType(
+            lambda: inject(RequestComponent), ValueInjectionError
+        )
+
+    def test_request_scope_per_task(self) -> None:
+        @component(scope=Scope.CONTEXT)
+        class ContextComponent:
+            pass
+
+        async def handle() -> ContextComponent:
+            with request_scope():
+                instance = inject(ContextComponent)
+                await asyncio.sleep(0.01)
+                self.assertIs(instance, inject(ContextComponent))
+                return instance
+
+        async def run() -> list[ContextComponent]:
+            return await asyncio.gather(handle(), handle())
+
+        instances = asyncio.run(run())
+        self.assertIsNot(instances[0], instances[1])
+
+    def test_thread_scope(self) -> None:
+        closed: list[str] = []
+
+        @component(scope=Scope.THREAD)
+        class ThreadComponent(AutoClose):
+            def close(self) -> None:
+                closed.append("closed")
+
+        instances: list[ThreadComponent] = []
+
+        def run() -> None:
+            instances.append(inject(ThreadComponent))
+            instances.append(inject(ThreadComponent))
+
+        thread1 = Thread(target=run)
+        thread1.start()
+        thread1.join()
+        thread2 = Thread(target=run)
+        thread2.start()
+        thread2.join()
+        self.assertIs(instances[0], instances[1])
+        self.assertIsNot(instances[1], instances[2])
+        self.assertEqual(closed, ["closed", "closed"])
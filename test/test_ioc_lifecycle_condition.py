@@ -1,5 +1,9 @@
 from baseTest import BaseTestCase
 from jstreams.ioc import (
+    AutoInit,
+    AutoStart,
+    Scope,
+    _lifecycle_hooks,
     injector,
     component,
     post_construct,
@@ -66,3 +70,37 @@ class TestIocLifecycleCondition(BaseTestCase):
                 return "should not exist"
 
         self.assertIsNone(injector().find(str, "cond_false"))
+
+    def test_lifecycle_hooks_discovered_once_per_class(self) -> None:
+        lifecycle_log = []
+
+        @component(scope=Scope.PROTOTYPE)
+        class PrototypeBean:
+            @property
+            def expensive(self) -> str:
+                lifecycle_log.append("property")
+                return "value"
+
+            @post_construct
+            def init(self) -> None:
+                lifecycle_log.append("init")
+
+        injector().get(PrototypeBean)
+        injector().get(PrototypeBean)
+        # Properties are never evaluated while discovering hooks
+        self.assertEqual(lifecycle_log, ["init", "init"])
+        self.assertEqual(_lifecycle_hooks(PrototypeBean).post_construct, ("init",))
+
+    def test_auto_init_and_start_hooks(self) -> None:
+        lifecycle_log = []
+
+        @component()
+        class AutoBean(AutoInit, AutoStart):
+            def init(self) -> None:
+                lifecycle_log.append("init")
+
+            def start(self) -> None:
+                lifecycle_log.append("start")
+
+        injector().get(AutoBean)
+        self.assertEqual(lifecycle_log, ["init", "start"])
@@ -0,0 +1,69 @@
+import subprocess
+import sys
+
+from baseTest import BaseTestCase
+
+
+def run_isolated(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+class TestLazyImport(BaseTestCase):
+    def test_import_loads_only_used_modules(self) -> None:
+        loaded = run_isolated(
+            "import sys\n"
+            "from jstreams import Stream\n"
+            "print(','.join(sorted(m for m in sys.modules if m.startswith('jstreams.'))))"
+        ).split(",")
+        self.assertIn("jstreams.stream", loaded)
+        self.assertNotIn("jstreams.ioc", loaded)
+        self.assertNotIn("jstreams.rx", loaded)
+        self.assertNotIn("jstreams.serialize", loaded)
+
+    def test_ioc_import_does_not_create_injector(self) -> None:
+        created = run_isolated(
+            "import jstreams.ioc as ioc\nprint(ioc._Injector.instance is not None)"
+        )
+        self.assertEqual(created, "False")
+
+    def test_functions_named_as_submodules(self) -> None:
+        import jstreams
+        import jstreams.match
+        import jstreams.scheduler
+        import jstreams.stream
+
+        self.assertTrue(callable(jstreams.stream))
+        self.assertEqual(jstreams.stream([1, 2]).to_list(), [1, 2])
+        self.assertFalse(isinstance(jstreams.match, type(jstreams)))
+        self.assertFalse(isinstance(jstreams.scheduler, type(jstreams)))
+
+    def test_all_exports_resolve(self) -> None:
+        import jstreams
+
+        for name in jstreams.__all__:
+            self.assertIsNotNone(getattr(jstreams, name), name)
+        self.assertThrowsExceptionOfType(
+            lambda: getattr(jstreams, "no_such_export"), AttributeError
+        )
+
+    def test_lazy_exports_match_all(self) -> None:
+        import jstreams
+
+        exported = [
+            name for names in jstreams._SUBMODULE_EXPORTS.values() for name in names
+        ]
+        self.assertEqual(len(exported), len(set(exported)))
+        self.assertEqual(len(jstreams.__all__), len(set(jstreams.__all__)))
+        self.assertEqual(set(exported), set(jstreams.__all__))
+
+    def test_submodules_are_attributes(self) -> None:
+        reached = run_isolated(
+            "import jstreams\n"
+            "print(jstreams.ioc.__name__, jstreams.serialize.__name__,"
+            " jstreams.environment.__name__)"
+        )
+        self.assertEqual(
+            reached, "jstreams.ioc jstreams.serialize jstreams.environment"
+        )
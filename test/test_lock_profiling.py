@@ -0,0 +1,119 @@
+import threading
+import time
+from typing import Any, Callable
+
+from baseTest import BaseTestCase
+from jstreams.annotations import (
+    dump_lock_stats_every,
+    enable_lock_profiling,
+    format_lock_stats,
+    is_lock_profiling_enabled,
+    lock_stats,
+    read_locked,
+    reset_lock_stats,
+    synchronized,
+    synchronized_static,
+    write_locked,
+)
+
+
+@synchronized_static("profiled_lock")
+def slow_section() -> None:
+    time.sleep(0.02)
+
+
+class Resource:
+    @synchronized()
+    def use(self) -> None:
+        time.sleep(0.01)
+
+    @read_locked()
+    def read(self) -> int:
+        return 1
+
+    @write_locked()
+    def write(self) -> None:
+        pass
+
+
+def run_threads(target: Callable[[], Any], count: int) -> None:
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestLockProfiling(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        reset_lock_stats()
+        enable_lock_profiling()
+
+    def tearDown(self) -> None:
+        enable_lock_profiling(False)
+        reset_lock_stats()
+        super().tearDown()
+
+    def test_disabled_by_default(self) -> None:
+        enable_lock_profiling(False)
+        self.assertFalse(is_lock_profiling_enabled())
+        slow_section()
+        self.assertEqual(lock_stats(), {})
+
+    def test_static_lock_contention(self) -> None:
+        run_threads(slow_section, 4)
+        stats = lock_stats()["profiled_lock"]
+        self.assertEqual(stats.acquisitions, 4)
+        self.assertGreaterEqual(stats.contentions, 1)
+        self.assertGreater(stats.max_wait, 0.01)
+        self.assertGreaterEqual(stats.max_hold, 0.02)
+        self.assertGreater(stats.average_hold(), 0.0)
+
+    def test_instance_locks_are_named_by_class(self) -> None:
+        resources = [Resource(), Resource()]
+        for resource in resources:
+            resource.use()
+            resource.read()
+            resource.write()
+        stats = lock_stats()
+        self.assertEqual(
+            stats["Resource._default_instance_sync_lock"].acquisitions, 2
+        )
+        self.assertEqual(stats["Resource._default_instance_rw_lock:read"].acquisitions, 2)
+        self.assertEqual(
+            stats["Resource._default_instance_rw_lock:write"].acquisitions, 2
+        )
+        self.assertEqual(
+            stats["Resource._default_instance_sync_lock"].contentions, 0
+        )
+
+    def test_lock_released_on_error(self) -> None:
+        @synchronized_static("failing_lock")
+        def fail() -> None:
+            raise ValueError("failed")
+
+        self.assertRaises(ValueError, fail)
+        self.assertRaises(ValueError, fail)
+        self.assertEqual(lock_stats()["failing_lock"].acquisitions, 2)
+
+    def test_snapshot_and_format(self) -> None:
+        slow_section()
+        snapshot = lock_stats()
+        slow_section()
+        self.assertEqual(snapshot["profiled_lock"].acquisitions, 1)
+        formatted = format_lock_stats()
+        self.assertIn("profiled_lock", formatted)
+        self.assertIn("contended", formatted.splitlines()[0])
+
+    def test_periodic_dump(self) -> None:
+        enable_lock_profiling(False)
+        dumps: list[str] = []
+        dumper = dump_lock_stats_every(0.05, dumps.append)
+        try:
+            self.assertTrue(is_lock_profiling_enabled())
+            slow_section()
+            time.sleep(0.2)
+        finally:
+            dumper.cancel()
+        self.assertTrue(any("profiled_lock" in dump for dump in dumps))
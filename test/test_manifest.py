@@ -0,0 +1,168 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+from baseTest import BaseTestCase
+
+SERVICES = """
+from jstreams.ioc import Scope, component, configuration, provide
+
+
+class Greeter:
+    def greet(self) -> str:
+        return "hello"
+
+
+@component(class_name=Greeter, qualifier="formal", scope=Scope.PROTOTYPE)
+class FormalGreeter(Greeter):
+    def greet(self) -> str:
+        return "good day"
+
+
+@configuration(profiles=["dev"])
+class Config:
+    @provide(str, qualifier="name")
+    def name(self) -> str:
+        return "dev"
+"""
+
+JOBS = """
+from jstreams.scheduler import schedule_daily, schedule_periodic
+
+
+@schedule_periodic(60)
+def refresh() -> None:
+    print("refreshed")
+
+
+@schedule_daily(3, 30, on_error=print)
+def cleanup() -> None:
+    pass
+"""
+
+
+class TestManifest(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        for name, source in (("mf_services", SERVICES), ("mf_jobs", JOBS)):
+            with open(
+                os.path.join(self.directory.name, f"{name}.py"), "w", encoding="utf-8"
+            ) as f:
+                f.write(source)
+        self.manifest = os.path.join(self.directory.name, "manifest.json")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        super().tearDown()
+
+    def run_isolated(self, code: str) -> str:
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            [self.directory.name, os.getcwd(), env.get("PYTHONPATH", "")]
+        )
+        return subprocess.run(
+            [sys.executable, "-c", textwrap.dedent(code)],
+            capture_output=True,
+            text=True,
+            check=True,
+            env=env,
+        ).stdout.strip()
+
+    def build(self) -> dict:
+        self.run_isolated(
+            f"""
+            from jstreams.manifest import main
+            main(["-o", {self.manifest!r}, "mf_services", "mf_jobs"])
+            """
+        )
+        with open(self.manifest, encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_build_records_registrations(self) -> None:
+        manifest = self.build()
+        self.assertEqual(manifest["modules"], ["mf_services", "mf_jobs"])
+        components = {c["factory"]: c for c in manifest["components"]}
+        formal = components["mf_services:FormalGreeter"]
+        self.assertEqual(formal["type"], "mf_services:Greeter")
+        self.assertEqual(formal["qualifier"], "formal")
+        self.assertEqual(formal["scope"], "PROTOTYPE")
+        self.assertEqual(formal["module"], "mf_services")
+        name = components["mf_services:Config.name"]
+        self.assertEqual(name["type"], "builtins:str")
+        self.assertEqual(name["profiles"], ["dev"])
+
+        jobs = {j["name"]: j for j in manifest["jobs"]}
+        self.assertEqual(jobs["refresh"]["kind"], "periodic")
+        self.assertEqual(jobs["refresh"]["arguments"], {"period": 60, "one_time": False})
+        self.assertFalse(jobs["refresh"]["eager"])
+        self.assertEqual(jobs["cleanup"]["arguments"], {"hour": 3, "minute": 30})
+        self.assertTrue(jobs["cleanup"]["eager"])
+
+    def test_components_are_imported_on_first_request(self) -> None:
+        self.build()
+        output = self.run_isolated(
+            f"""
+            import sys
+            from jstreams.ioc import injector
+            injector().load_manifest({self.manifest!r})
+            print("mf_services" in sys.modules)
+            # Requests for unrelated types do not import anything
+            print(injector().find(int) is None, "mf_services" in sys.modules)
+
+            from mf_services import Greeter
+            print(injector().get(Greeter, "formal").greet())
+            """
+        )
+        self.assertEqual(output.splitlines(), ["False", "True False", "good day"])
+
+    def test_configured_manifest_replaces_scan(self) -> None:
+        self.build()
+        output = self.run_isolated(
+            f"""
+            import os, sys
+            os.environ["JSTREAMS_MANIFEST"] = {self.manifest!r}
+            os.environ["JSTREAMS_PACKAGES"] = "mf_jobs"
+            from jstreams.ioc import injector
+            print(injector().find(str, "name") is None)
+            print("mf_jobs" in sys.modules, "mf_services" in sys.modules)
+            """
+        )
+        # The profile of the provided bean is not active, but its module is imported
+        self.assertEqual(output.splitlines(), ["True", "False True"])
+
+    def test_all_of_type_imports_subtype_modules(self) -> None:
+        self.build()
+        output = self.run_isolated(
+            f"""
+            from jstreams.ioc import injector
+            injector().load_manifest({self.manifest!r})
+            from mf_services import Greeter
+            print([g.greet() for g in injector().all_of_type(Greeter)])
+            """
+        )
+        self.assertEqual(output, "['good day']")
+
+    def test_jobs_are_scheduled_without_import(self) -> None:
+        self.build()
+        output = self.run_isolated(
+            f"""
+            import sys
+            from jstreams.scheduler import _Scheduler, scheduler
+            jobs = []
+            # Collect the jobs without starting the scheduler thread
+            _Scheduler.add_job = lambda self, job: jobs.append(job)
+            scheduler().load_manifest({self.manifest!r})
+            print(sorted(job.name for job in jobs))
+            # cleanup uses a callback, so its module was imported, without
+            # scheduling refresh a second time
+            print("mf_jobs" in sys.modules)
+            next(job for job in jobs if job.name == "refresh").func()
+            """
+        )
+        self.assertEqual(
+            output.splitlines(), ["['cleanup', 'refresh']", "True", "refreshed"]
+        )
@@ -1,3 +1,4 @@
+from enum import Enum
 from typing import Optional
 from baseTest import BaseTestCase
 from jstreams import (
@@ -7,6 +8,7 @@ from jstreams import (
     default_case,
     match,
     match_opt,
+    matcher,
     is_between_closed,
     is_higher_than_or_eq,
     is_less_than,
@@ -112,3 +114,57 @@ class TestMatch(BaseTestCase):
             ValueError,
             lambda: match(6).of_list_exhaustive([]),
         )
+
+    def test_matcher_indexed_cases(self) -> None:
+        names = matcher(*[case(i, f"name{i}") for i in range(50)], default_case("none"))
+        self.assertEqual(names.of(42), "name42")
+        self.assertEqual(names(0), "name0")
+        self.assertEqual(names.of(50), "none")
+        self.assertEqual(names.opt(7).get(), "name7")
+
+    def test_matcher_keeps_case_order(self) -> None:
+        ordered = matcher(
+            case(1, "first one"),
+            case(is_less_than(5), "less than five"),
+            case(3, "three"),
+            case(1, "second one"),
+            case(is_higher_than_or_eq(10), "ten or more"),
+            case(12, "twelve"),
+        )
+        self.assertEqual(ordered.of(1), "first one")
+        self.assertEqual(ordered.of(3), "less than five")
+        self.assertEqual(ordered.of(12), "ten or more")
+        self.assertIsNone(ordered.of(7))
+        self.assertRaises(ValueError, lambda: ordered.of_exhaustive(7))
+
+        unhashable = matcher(case(1, "one"), case([1, 2], "list"), case(2, "two"))
+        self.assertEqual(unhashable.of([1, 2]), "list")
+        self.assertEqual(unhashable.of(2), "two")
+        self.assertIsNone(unhashable.of({"key": 1}))
+
+    def test_matcher_suppliers(self) -> None:
+        calls: list[str] = []
+        lazy = matcher(case("a", lambda: calls.append("a") or "A"), case("b", "B"))
+        self.assertEqual(calls, [])
+        self.assertEqual(lazy.of("a"), "A")
+        self.assertEqual(calls, ["a"])
+
+    def test_matcher_equality_semantics(self) -> None:
+        class Color(Enum):
+            RED = 1
+            GREEN = 2
+
+        nan = float("nan")
+        numbers = matcher(
+            case(1, "one"), case(nan, "nan"), case(Color.GREEN, "green"), case(2.5, "x")
+        )
+        # Values of non indexed types are compared with == in order
+        self.assertEqual(numbers.of(1.0), "one")
+        self.assertEqual(numbers.of(True), "one")
+        self.assertEqual(numbers.of(2.5), "x")
+        self.assertIsNone(numbers.of(nan))
+        self.assertEqual(numbers.of(Color.GREEN), "green")
+        self.assertIsNone(numbers.of(Color.RED))
+        self.assertEqual(
+            match(nan).of_list([case(nan, "nan"), default_case("none")]), "none"
+        )
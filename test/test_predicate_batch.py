@@ -0,0 +1,156 @@
+import importlib.util
+import unittest
+from typing import Any
+
+from baseTest import BaseTestCase
+from jstreams import Stream
+from jstreams.iterables import FILTER_CHUNK_SIZE, FILTER_FIRST_CHUNK_SIZE
+from jstreams.predicate import (
+    Predicate,
+    always_false,
+    and_,
+    apply_many,
+    batch_function,
+    contains,
+    equals,
+    is_between,
+    is_between_closed,
+    is_between_closed_end,
+    is_between_closed_start,
+    is_higher_than,
+    is_higher_than_or_eq,
+    is_in,
+    is_less_than,
+    is_less_than_or_eq,
+    is_none,
+    is_not_in,
+    not_,
+    not_equals,
+    or_,
+    predicate_of,
+    str_ends_with,
+    str_fullmatch,
+    str_matches,
+    str_not_matches,
+    str_starts_with,
+)
+
+NUMBERS: list[Any] = [None, -5, 0, 1, 2.5, 3, 10, 11]
+STRINGS: list[Any] = [None, "", "abc", "a1", "123", "abc123", "xyz"]
+
+
+class TestPredicateBatch(BaseTestCase):
+    def assert_batch_matches(self, predicate: Any, values: list[Any]) -> None:
+        self.assertIsNotNone(batch_function(predicate))
+        self.assertEqual(
+            [bool(v) for v in apply_many(predicate, values)],
+            [bool(predicate(v)) for v in values],
+        )
+
+    def test_numeric_predicates(self) -> None:
+        for predicate in [
+            is_between(0, 10),
+            is_between_closed(0, 10),
+            is_between_closed_start(0, 10),
+            is_between_closed_end(0, 10),
+            is_higher_than(1),
+            is_higher_than_or_eq(1),
+            is_less_than(3),
+            is_less_than_or_eq(3),
+            is_in([0, 3, 11]),
+            is_not_in([0, 3, 11]),
+            equals(3),
+            equals(None),
+            not_equals(3),
+            is_none,
+        ]:
+            self.assert_batch_matches(predicate, NUMBERS)
+
+    def test_string_predicates(self) -> None:
+        for predicate in [
+            str_matches(r"[a-z]+\d"),
+            str_not_matches(r"[a-z]+\d"),
+            str_fullmatch(r"\d+"),
+            str_starts_with("a"),
+            str_ends_with("3"),
+            is_in(("abc", "xyz")),
+        ]:
+            self.assert_batch_matches(predicate, STRINGS)
+        self.assert_batch_matches(contains("b"), ["abc", None, "xyz"])
+
+    def test_unhashable_is_in(self) -> None:
+        self.assert_batch_matches(is_in([[1], [2]]), [[1], [3]])
+
+    def test_combinations(self) -> None:
+        self.assert_batch_matches(
+            and_(is_higher_than(0), or_(is_less_than(3), equals(10))), NUMBERS
+        )
+        self.assert_batch_matches(not_(always_false()), NUMBERS)
+        self.assertEqual(
+            predicate_of(is_higher_than(0)).test_many(iter(NUMBERS)),
+            [bool(is_higher_than(0)(v)) for v in NUMBERS],
+        )
+
+    def test_combination_short_circuits(self) -> None:
+        tested: list[Any] = []
+
+        def record(values: list[Any]) -> list[bool]:
+            tested.extend(values)
+            return [True for _ in values]
+
+        recorder = lambda _: True  # noqa: E731
+        setattr(recorder, "test_many", record)
+        apply_many(and_(is_higher_than(2), recorder), NUMBERS)
+        self.assertEqual(tested, [2.5, 3, 10, 11])
+        tested.clear()
+        apply_many(or_(is_higher_than(2), recorder), NUMBERS)
+        self.assertEqual(tested, [None, -5, 0, 1])
+
+    def test_without_batch_form(self) -> None:
+        self.assertIsNone(batch_function(lambda v: v))
+        self.assertIsNone(batch_function(and_(is_none, lambda v: v)))
+
+        class Custom(Predicate[int]):
+            def apply(self, value: int) -> bool:
+                return value > 0
+
+        self.assertIsNone(batch_function(Custom()))
+        self.assertEqual(Custom().test_many([1, -1]), [True, False])
+        self.assertEqual(apply_many(lambda v: v, [0, 2]), [False, True])
+
+    def test_stream_filter_chunks(self) -> None:
+        chunks: list[int] = []
+
+        def test_many(values: list[int]) -> list[bool]:
+            chunks.append(len(values))
+            return [v % 2 == 0 for v in values]
+
+        even = lambda v: v % 2 == 0  # noqa: E731
+        setattr(even, "test_many", test_many)
+        data = list(range(3 * FILTER_CHUNK_SIZE))
+        self.assertEqual(
+            Stream(data).filter(even).to_list(), [v for v in data if v % 2 == 0]
+        )
+        # Chunks grow from the first size up to the maximum one
+        self.assertEqual(chunks[0], FILTER_FIRST_CHUNK_SIZE)
+        self.assertEqual(chunks[1], 2 * FILTER_FIRST_CHUNK_SIZE)
+        self.assertEqual(max(chunks), FILTER_CHUNK_SIZE)
+        self.assertEqual(sum(chunks), len(data))
+
+        # Short-circuiting operations only test the first chunk
+        chunks.clear()
+        self.assertEqual(Stream(data).filter(even).first().get(), 0)
+        self.assertEqual(chunks, [FILTER_FIRST_CHUNK_SIZE])
+
+        # Other iterables are filtered one value at a time
+        chunks.clear()
+        self.assertEqual(Stream(iter(data)).filter(even).count(), len(data) // 2)
+        self.assertEqual(chunks, [])
+
+    @unittest.skipIf(importlib.util.find_spec("numpy") is None, "numpy not installed")
+    def test_numpy_masks(self) -> None:
+        import numpy  # pylint: disable=import-outside-toplevel
+
+        values = numpy.array([-1, 0, 5, 12])
+        mask = apply_many(and_(is_higher_than(0), not_(is_between(10, 20))), values)
+        self.assertEqual(list(mask), [False, False, True, False])
@@ -0,0 +1,128 @@
+from typing import Any
+
+from baseTest import BaseTestCase
+from jstreams.predicate import (
+    Predicate,
+    always_false,
+    always_true,
+    and_,
+    compile_predicate,
+    is_higher_than,
+    is_less_than,
+    not_,
+    or_,
+    predicate_of,
+)
+from jstreams.stream_predicates import all_of, any_of, none_of
+from jstreams.utils import is_not_none
+
+
+def terms_of(predicate: Any) -> tuple[Any, ...]:
+    return predicate.terms
+
+
+class TestPredicateCompile(BaseTestCase):
+    def test_method_chains_are_flattened(self) -> None:
+        predicate = (
+            predicate_of(is_higher_than(0))
+            .and_(is_less_than(10))
+            .and_(lambda v: v % 2 == 0)
+        )
+        self.assertEqual(len(terms_of(predicate)), 3)
+        self.assertTrue(predicate(4))
+        self.assertFalse(predicate(5))
+        self.assertFalse(predicate(12))
+
+    def test_module_functions_are_flattened(self) -> None:
+        predicate = all_of([and_(is_higher_than(0), is_less_than(10)), is_not_none])
+        self.assertEqual(len(terms_of(predicate)), 3)
+        self.assertTrue(predicate(3))
+        self.assertFalse(predicate(None))
+        self.assertTrue(or_(is_less_than(0), is_higher_than(10))(11))
+        self.assertTrue(any_of(iter([is_less_than(0), is_higher_than(10)]))(-1))
+        self.assertTrue(none_of([is_less_than(0), is_higher_than(10)])(5))
+
+    def test_results_are_bool(self) -> None:
+        predicate = compile_predicate(or_(lambda v: v, lambda v: v))
+        self.assertIs(predicate("text"), True)
+        self.assertIs(predicate(""), False)
+
+    def test_constant_folding(self) -> None:
+        positive = predicate_of(is_higher_than(0))
+        self.assertIs(positive.and_(always_true()), positive)
+        self.assertIs(positive.and_(always_false()), always_false())
+        self.assertIs(positive.or_(always_true()), always_true())
+        self.assertIs(positive.or_(always_false()), positive)
+        self.assertIs(not_(always_true()), always_false())
+        bounded = positive.and_(is_less_than(10))
+        self.assertIs(not_(not_(bounded)), bounded)
+        self.assertTrue(all_of([])(1))
+        self.assertFalse(any_of([])(1))
+
+    def test_double_negation_returns_bools(self) -> None:
+        truthy = not_(not_(lambda v: v))
+        self.assertIs(truthy("text"), True)
+        self.assertIs(truthy(""), False)
+        self.assertIs(not_(not_(predicate_of(len)))([1]), True)
+
+    def test_compile_nested_tree(self) -> None:
+        tree = and_(
+            is_not_none,
+            or_(is_less_than(0), is_higher_than(10)),
+            not_(lambda v: v == 42),
+        )
+        compiled = compile_predicate(tree)
+        for value in [None, -1, 5, 11, 42]:
+            self.assertEqual(compiled(value), tree(value), value)
+
+    def test_short_circuit(self) -> None:
+        calls: list[str] = []
+
+        def record(name: str, result: bool) -> Any:
+            def check(_: Any) -> bool:
+                calls.append(name)
+                return result
+
+            return check
+
+        compiled = compile_predicate(
+            and_(record("a", True), or_(record("b", True), record("c", True)))
+        )
+        self.assertTrue(compiled(1))
+        self.assertEqual(calls, ["a", "b"])
+
+    def test_reorder_by_selectivity(self) -> None:
+        calls: list[str] = []
+
+        def rarely(value: int) -> bool:
+            calls.append("rarely")
+            return value % 10 == 0
+
+        def mostly(value: int) -> bool:
+            calls.append("mostly")
+            return value % 10 != 0
+
+        tree = and_(mostly, rarely)
+        compiled = compile_predicate(tree, sample=range(100))
+        calls.clear()
+        self.assertFalse(compiled(3))
+        # The rarely matching term rejects the value first
+        self.assertEqual(calls, ["rarely"])
+
+    def test_reorder_keeps_order_when_a_term_fails(self) -> None:
+        tree = and_(is_not_none, lambda v: v > 3)
+        compiled = compile_predicate(tree, sample=[None, 1, 5])
+        self.assertFalse(compiled(None))
+        self.assertTrue(compiled(5))
+
+    def test_compile_method(self) -> None:
+        predicate: Predicate[int] = predicate_of(is_higher_than(0)).or_(is_less_than(-10))
+        compiled = predicate.compile()
+        self.assertTrue(compiled(1))
+        self.assertTrue(compiled(-11))
+        self.assertFalse(compiled(-1))
+
+    def test_wide_tree(self) -> None:
+        tree = all_of([is_higher_than(i) for i in range(300)])
+        self.assertTrue(compile_predicate(tree)(301))
+        self.assertFalse(compile_predicate(tree)(100))
@@ -0,0 +1,179 @@
+import threading
+import time
+from typing import Any
+
+from baseTest import BaseTestCase
+from jstreams.annotations import (
+    DEFAULT_INSTANCE_RW_LOCK_ATTR,
+    ReadWriteLock,
+    SynchronizedValue,
+    locked,
+    read_locked,
+    write_locked,
+)
+from jstreams.utils import TypeValidationError
+
+
+class Registry:
+    def __init__(self) -> None:
+        self.entries: dict[str, int] = {}
+        self.active_readers = 0
+        self.max_readers = 0
+
+    @read_locked()
+    def find(self, key: str, delay: float = 0.0) -> int | None:
+        self.active_readers += 1
+        self.max_readers = max(self.max_readers, self.active_readers)
+        time.sleep(delay)
+        self.active_readers -= 1
+        return self.entries.get(key)
+
+    @write_locked()
+    def register(self, key: str, value: int) -> None:
+        current = self.entries.get(key, 0)
+        time.sleep(0.001)
+        self.entries[key] = current + value
+
+    @write_locked()
+    def register_checked(self, key: str, value: int) -> int | None:
+        # Reentrant: a writer can read
+        self.register(key, value)
+        return self.find(key)
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.value = 0
+
+    def increment(self) -> None:
+        current = self.value
+        time.sleep(0.001)
+        self.value = current + 1
+
+    def slow_read(self) -> int:
+        time.sleep(0.1)
+        return self.value
+
+
+def run_threads(target: Any, count: int) -> None:
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+class TestReadWriteLock(BaseTestCase):
+    def test_readers_share_the_lock(self) -> None:
+        registry = Registry()
+        run_threads(lambda: registry.find("a", 0.05), 5)
+        self.assertGreater(registry.max_readers, 1)
+        self.assertIsInstance(
+            getattr(registry, DEFAULT_INSTANCE_RW_LOCK_ATTR), ReadWriteLock
+        )
+
+    def test_writers_are_exclusive(self) -> None:
+        registry = Registry()
+
+        def write() -> None:
+            for _ in range(10):
+                registry.register("a", 1)
+
+        run_threads(write, 5)
+        self.assertEqual(registry.find("a"), 50)
+        self.assertEqual(registry.register_checked("a", 1), 51)
+
+    def test_writer_waits_for_readers(self) -> None:
+        lock = ReadWriteLock()
+        events: list[str] = []
+        lock.acquire_read()
+
+        def write() -> None:
+            with lock.write_lock:
+                events.append("write")
+
+        thread = threading.Thread(target=write)
+        thread.start()
+        time.sleep(0.05)
+        events.append("read done")
+        lock.release_read()
+        thread.join()
+        self.assertEqual(events, ["read done", "write"])
+
+    def test_waiting_writer_blocks_new_readers(self) -> None:
+        lock = ReadWriteLock()
+        events: list[str] = []
+        lock.acquire_read()
+
+        def write() -> None:
+            with lock.write_lock:
+                events.append("write")
+
+        def read() -> None:
+            with lock.read_lock:
+                events.append("read")
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        time.sleep(0.05)
+        reader = threading.Thread(target=read)
+        reader.start()
+        time.sleep(0.05)
+        # Reentrant reads do not wait for the queued writer
+        with lock.read_lock:
+            self.assertEqual(events, [])
+        lock.release_read()
+        writer.join()
+        reader.join()
+        self.assertEqual(events, ["write", "read"])
+
+    def test_upgrade_and_unbalanced_release_fail(self) -> None:
+        lock = ReadWriteLock()
+        with lock.read_lock:
+            self.assertRaises(RuntimeError, lock.acquire_write)
+        self.assertRaises(RuntimeError, lock.release_read)
+        self.assertRaises(RuntimeError, lock.release_write)
+
+    def test_mismatched_lock_attribute(self) -> None:
+        class Mixed:
+            def __init__(self) -> None:
+                self._default_instance_rw_lock = threading.RLock()
+
+            @read_locked()
+            def read(self) -> None:
+                pass
+
+        self.assertRaises(TypeValidationError, Mixed().read)
+
+    def test_locked_rw_mode(self) -> None:
+        LockedCounter = locked(mode="rw", read_methods=["slow_read"])(Counter)
+        counter = LockedCounter()
+        run_threads(lambda: [counter.increment() for _ in range(10)], 5)
+        self.assertEqual(counter.value, 50)
+
+        start = time.perf_counter()
+        run_threads(counter.slow_read, 5)
+        # The slow reads ran concurrently
+        self.assertLess(time.perf_counter() - start, 0.4)
+
+    def test_locked_unsupported_mode(self) -> None:
+        self.assertRaises(ValueError, lambda: locked(mode="optimistic"))
+
+
+class TestSynchronizedValue(BaseTestCase):
+    def test_get_set(self) -> None:
+        value = SynchronizedValue(1)
+        self.assertEqual(value.get(), 1)
+        value.set(2)
+        self.assertEqual(value(), 2)
+        self.assertEqual(value(3), 3)
+
+    def test_concurrent_updates(self) -> None:
+        value: SynchronizedValue[dict[str, int]] = SynchronizedValue({"count": 0})
+
+        def update() -> None:
+            for _ in range(100):
+                value.update(lambda current: {"count": (current or {})["count"] + 1})
+
+        run_threads(update, 8)
+        self.assertEqual(value.get(), {"count": 800})
@@ -0,0 +1,244 @@
+import asyncio
+import threading
+import time
+from typing import Any
+
+from baseTest import BaseTestCase
+from jstreams import (
+    AsyncTry,
+    Bulkhead,
+    BulkheadFullError,
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+    CircuitState,
+    Try,
+    bulkhead,
+    circuit_breaker,
+    circuit_breakers,
+)
+
+
+def fail() -> None:
+    raise ValueError("down")
+
+
+def succeed() -> str:
+    return "ok"
+
+
+class TestCircuitBreaker(BaseTestCase):
+    def test_opens_on_failure_rate(self) -> None:
+        breaker = CircuitBreaker("test", 0.5, window_size=4, minimum_calls=4)
+        for fn in (succeed, fail, succeed):
+            Try(fn).mute().with_circuit_breaker(breaker).get()
+        self.assertEqual(breaker.state(), CircuitState.CLOSED)
+        Try(fail).mute().with_circuit_breaker(breaker).get()
+        self.assertEqual(breaker.state(), CircuitState.OPEN)
+        self.assertEqual(breaker.failure_rate(), 0.5)
+
+    def test_rolling_window(self) -> None:
+        breaker = CircuitBreaker("test", 0.5, window_size=4, minimum_calls=2)
+        breaker.call(succeed)
+        self.assertRaises(ValueError, lambda: breaker.call(fail))
+        self.assertEqual(breaker.state(), CircuitState.OPEN)
+
+        breaker = CircuitBreaker("test", 0.8, window_size=4, minimum_calls=4)
+        for fn in (fail, fail, succeed, fail, succeed, succeed, fail):
+            Try(fn).mute().with_circuit_breaker(breaker).get()
+        # The window only holds the last 4 calls: fail, succeed, succeed, fail
+        self.assertEqual(breaker.failure_rate(), 0.5)
+        self.assertEqual(breaker.state(), CircuitState.CLOSED)
+
+    def test_open_breaker_fails_fast_without_retries(self) -> None:
+        calls: list[int] = []
+
+        def call() -> None:
+            calls.append(1)
+            raise ValueError("down")
+
+        breaker = CircuitBreaker("test", 1.0, window_size=2, minimum_calls=2)
+        errors: list[Exception] = []
+        result = (
+            Try(call)
+            .mute()
+            .retry(5)
+            .with_circuit_breaker(breaker)
+            .on_failure(errors.append)
+            .get()
+        )
+        self.assertTrue(result.is_empty())
+        self.assertEqual(len(calls), 2)
+        self.assertIsInstance(errors[0], CircuitBreakerOpenError)
+        self.assertEqual(errors[0].name, "test")  # type: ignore[attr-defined]
+        self.assertRaises(CircuitBreakerOpenError, lambda: breaker.call(succeed))
+
+    def test_half_open_probing(self) -> None:
+        breaker = CircuitBreaker(
+            "test",
+            1.0,
+            window_size=1,
+            minimum_calls=1,
+            open_duration=0.05,
+            half_open_calls=2,
+        )
+        self.assertRaises(ValueError, lambda: breaker.call(fail))
+        self.assertFalse(breaker.try_acquire())
+        time.sleep(0.06)
+        self.assertEqual(breaker.state(), CircuitState.HALF_OPEN)
+
+        # A failed probe opens the breaker again
+        self.assertRaises(ValueError, lambda: breaker.call(fail))
+        self.assertEqual(breaker.state(), CircuitState.OPEN)
+        time.sleep(0.06)
+
+        # Only half_open_calls probes are let through
+        self.assertTrue(breaker.try_acquire())
+        self.assertTrue(breaker.try_acquire())
+        self.assertFalse(breaker.try_acquire())
+        breaker.on_success()
+        self.assertEqual(breaker.state(), CircuitState.HALF_OPEN)
+        breaker.on_success()
+        self.assertEqual(breaker.state(), CircuitState.CLOSED)
+        self.assertEqual(breaker.failure_rate(), 0.0)
+
+    def test_late_outcome_is_not_a_probe(self) -> None:
+        breaker = CircuitBreaker(
+            "test", 1.0, window_size=1, minimum_calls=1, open_duration=0.05
+        )
+        # Calls permitted while CLOSED, completing after the breaker opened
+        permit = breaker.acquire()
+        breaker.acquire()
+        self.assertRaises(ValueError, lambda: breaker.call(fail))
+        time.sleep(0.06)
+        self.assertEqual(breaker.state(), CircuitState.HALF_OPEN)
+        breaker.on_success()
+        self.assertEqual(breaker.state(), CircuitState.HALF_OPEN)
+
+        # With a probe in flight, the stale permit is still told apart
+        probe = breaker.acquire()
+        breaker.on_success(permit)
+        breaker.release(permit)
+        self.assertEqual(breaker.state(), CircuitState.HALF_OPEN)
+        self.assertIsNone(breaker.try_acquire())
+        breaker.on_success(probe)
+        self.assertEqual(breaker.state(), CircuitState.CLOSED)
+
+    def test_record_failure(self) -> None:
+        breaker = CircuitBreaker(
+            "test",
+            1.0,
+            window_size=1,
+            minimum_calls=1,
+            record_failure=lambda e: not isinstance(e, KeyError),
+        )
+
+        def missing() -> None:
+            raise KeyError("missing")
+
+        Try(missing).mute().with_circuit_breaker(breaker).get()
+        self.assertEqual(breaker.state(), CircuitState.CLOSED)
+        breaker.reset()
+        self.assertEqual(breaker.failure_rate(), 0.0)
+
+    def test_invalid_configuration(self) -> None:
+        self.assertRaises(ValueError, lambda: CircuitBreaker("a", 0))
+        self.assertRaises(ValueError, lambda: CircuitBreaker("a", window_size=0))
+        self.assertRaises(
+            ValueError, lambda: CircuitBreaker("a", window_size=2, minimum_calls=3)
+        )
+        self.assertRaises(ValueError, lambda: CircuitBreaker("a", half_open_calls=0))
+
+    def test_registry(self) -> None:
+        breaker = circuit_breaker(
+            "test_registry_breaker", window_size=5, minimum_calls=5
+        )
+        self.assertIs(circuit_breaker("test_registry_breaker", window_size=50), breaker)
+        self.assertEqual(breaker.window_size, 5)
+        self.assertIs(circuit_breakers()["test_registry_breaker"], breaker)
+
+    def test_async_try(self) -> None:
+        breaker = CircuitBreaker("test", 1.0, window_size=1, minimum_calls=1)
+
+        async def slow() -> str:
+            await asyncio.sleep(1)
+            return "slow"
+
+        async def run() -> tuple[Any, Any]:
+            first = await AsyncTry(slow).mute().with_timeout(0.01).with_circuit_breaker(
+                breaker
+            ).get()
+            errors: list[Exception] = []
+            await AsyncTry(slow).mute().with_circuit_breaker(breaker).on_failure(
+                errors.append
+            ).get()
+            return first, errors
+
+        first, errors = asyncio.run(run())
+        self.assertTrue(first.is_empty())
+        self.assertIsInstance(errors[0], CircuitBreakerOpenError)
+
+
+class TestBulkhead(BaseTestCase):
+    def test_limits_concurrency(self) -> None:
+        limit = Bulkhead("test", 2)
+        started = threading.Barrier(3)
+        release = threading.Event()
+
+        def hold() -> None:
+            def work() -> None:
+                started.wait()
+                release.wait()
+
+            Try(work).with_bulkhead(limit).get()
+
+        threads = [threading.Thread(target=hold) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        started.wait()
+        self.assertEqual(limit.active(), 2)
+
+        errors: list[Exception] = []
+        Try(succeed).mute().retry(3).with_bulkhead(limit).on_failure(
+            errors.append
+        ).get()
+        self.assertIsInstance(errors[0], BulkheadFullError)
+
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(limit.active(), 0)
+        self.assertEqual(Try(succeed).with_bulkhead(limit).get().get(), "ok")
+
+    def test_waits_for_a_slot(self) -> None:
+        limit = Bulkhead("test", 1, max_wait=1.0)
+        limit.acquire()
+        threading.Timer(0.05, limit.release).start()
+        self.assertEqual(limit.call(succeed), "ok")
+        self.assertEqual(limit.active(), 0)
+
+    def test_slot_released_on_failure(self) -> None:
+        limit = Bulkhead("test", 1)
+        Try(fail).mute().retry(2).with_bulkhead(limit).get()
+        self.assertEqual(limit.active(), 0)
+
+    def test_rejection_releases_breaker_probe(self) -> None:
+        limit = Bulkhead("test", 1)
+        breaker = CircuitBreaker(
+            "test", 1.0, window_size=1, minimum_calls=1, open_duration=0
+        )
+        self.assertRaises(ValueError, lambda: breaker.call(fail))
+        limit.acquire()
+        Try(succeed).mute().with_circuit_breaker(breaker).with_bulkhead(limit).get()
+        limit.release()
+        # The probe given back by the rejected attempt can be used
+        self.assertEqual(
+            Try(succeed).with_circuit_breaker(breaker).with_bulkhead(limit).get().get(),
+            "ok",
+        )
+        self.assertEqual(breaker.state(), CircuitState.CLOSED)
+
+    def test_registry(self) -> None:
+        limit = bulkhead("test_registry_bulkhead", 3)
+        self.assertIs(bulkhead("test_registry_bulkhead", 10), limit)
+        self.assertEqual(limit.max_concurrent, 3)
+        self.assertRaises(ValueError, lambda: Bulkhead("a", 0))
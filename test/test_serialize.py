@@ -1,17 +1,35 @@
 from datetime import date, datetime
+import io
+import json
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Optional, Union
 from uuid import UUID, uuid4
 from baseTest import BaseTestCase
+from jstreams.stream import Stream
 from jstreams.serialize import (
+    binary_deserialize,
+    binary_deserialize_list,
+    binary_serialize,
+    binary_serialize_list,
     json_deserialize,
+    json_deserialize_iter,
+    json_deserialize_stream,
     json_serializable,
     json_serialize,
+    json_serialize_iter,
+    json_serialize_list,
     json_serialize_return,
     json_standard_serializable,
 )
 
 
+@json_serializable()
+class TreeNode:
+    def __init__(self, name: str, parent: Optional["TreeNode"] = None) -> None:
+        self.name = name
+        self.parent = parent
+
+
 class TestSerialize(BaseTestCase):
     def test_serialize_with_constructor(self) -> None:
         @json_serializable()
@@ -658,3 +676,231 @@ class TestSerialize(BaseTestCase):
         self.assertIsInstance(deserialized, SimpleClass)
         self.assertEqual(deserialized.value, 10)
         self.assertEqual(deserialized, SimpleClass(10))
+
+    def test_attributes_added_after_decoration(self) -> None:
+        @json_serializable(translate_snake_to_camel=True)
+        class Dynamic:
+            created_by: str = "system"
+            label: str
+
+            def __init__(self, item_id: int) -> None:
+                self.item_id = item_id
+
+        first = Dynamic(1)
+        self.assertEqual(first.to_dict(), {"itemId": 1, "createdBy": "system"})
+
+        second = Dynamic(2)
+        second.extra_value = 3  # type: ignore[attr-defined]
+        second._hidden = 4  # type: ignore[attr-defined]
+        second.label = "second"
+        self.assertEqual(
+            second.to_dict(),
+            {"itemId": 2, "extraValue": 3, "label": "second", "createdBy": "system"},
+        )
+        # Names compiled for one instance do not leak into others
+        self.assertEqual(first.to_dict(), {"itemId": 1, "createdBy": "system"})
+
+    def test_from_dict_reuses_key_plans(self) -> None:
+        @json_serializable(
+            ignore_unknown_fields=False,
+            custom_deserializers={"unknown": lambda v: "custom"},
+        )
+        class Target:
+            known: int
+
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+        for _ in range(2):
+            instance = Target.from_dict(
+                {"value": "1", "known": "2", "unknown": "3"}  # type: ignore[dict-item]
+            )
+            self.assertEqual(instance.value, 1)
+            self.assertEqual(instance.known, 2)
+            # Custom deserializers only apply to known attributes
+            self.assertEqual(instance.unknown, "3")  # type: ignore[attr-defined]
+
+    def test_union_members_tried_in_order(self) -> None:
+        @json_serializable()
+        class Point:
+            def __init__(self, x: int, y: int) -> None:
+                self.x = x
+                self.y = y
+
+        @json_serializable()
+        class Label:
+            def __init__(self, text: str) -> None:
+                self.text = text
+
+        @json_serializable()
+        class Shape:
+            def __init__(
+                self,
+                anchor: Union[Point, Label, None],
+                count: Union[int, str],
+                name: str | None,
+                points: Optional[list[Point]] = None,
+            ) -> None:
+                self.anchor = anchor
+                self.count = count
+                self.name = name
+                self.points = points
+
+        shape = Shape.from_dict(
+            {
+                "anchor": {"text": "a"},
+                "count": "3",
+                "name": None,
+                "points": [{"x": 1, "y": 2}],
+            }
+        )
+        # Point.from_dict fails on missing arguments, so Label is used
+        self.assertIsInstance(shape.anchor, Label)
+        # The first member coerces the value
+        self.assertEqual(shape.count, 3)
+        self.assertIsNone(shape.name)
+        self.assertEqual([(p.x, p.y) for p in shape.points or []], [(1, 2)])
+
+        shape = Shape.from_dict(
+            {"anchor": {"x": 1, "y": 2}, "count": "many", "name": 5}
+        )
+        self.assertIsInstance(shape.anchor, Point)
+        self.assertEqual(shape.count, "many")
+        self.assertEqual(shape.name, "5")
+        shape = Shape.from_dict({"anchor": None, "count": 1, "name": "n"})
+        self.assertIsNone(shape.anchor)
+
+    def test_deserializer_plans_are_cached(self) -> None:
+        from jstreams.serialize import _deserializer
+
+        self.assertIs(_deserializer(list[int]), _deserializer(list[int]))
+        self.assertEqual(_deserializer(list[int])(["1", 2]), [1, 2])
+        self.assertEqual(
+            _deserializer(tuple[date, ...])(["2024-01-02"]), (date(2024, 1, 2),)
+        )
+        self.assertEqual(
+            _deserializer(dict[str, UUID])({"k": "not a uuid"}), {"k": "not a uuid"}
+        )
+
+    def test_serialize_and_deserialize_iter(self) -> None:
+        @json_serializable()
+        class Row:
+            def __init__(self, row_id: int, name: str) -> None:
+                self.row_id = row_id
+                self.name = name
+
+        rows = (Row(i, f"row, \"{i}\" ]") for i in range(200))
+        for ndjson in (False, True):
+            out = io.StringIO()
+            self.assertEqual(json_serialize_iter(Stream(rows), out, ndjson), 200)
+            text = out.getvalue()
+            if not ndjson:
+                self.assertEqual(len(json.loads(text)), 200)
+            # Small chunks split items and numbers across reads
+            restored = list(
+                json_deserialize_iter(Row, io.StringIO(text), ndjson, chunk_size=7)
+            )
+            self.assertEqual(restored, [Row(i, f"row, \"{i}\" ]") for i in range(200)])
+            rows = (Row(i, f"row, \"{i}\" ]") for i in range(200))
+
+        names = (
+            json_deserialize_stream(
+                Row, io.StringIO(' [ {"row_id": 12345, "name": "a"} ] ')
+            )
+            .map(lambda row: (row.row_id, row.name))
+            .to_list()
+        )
+        self.assertEqual(names, [(12345, "a")])
+
+    def test_iter_empty_and_invalid_input(self) -> None:
+        @json_serializable()
+        class Row:
+            def __init__(self, row_id: int) -> None:
+                self.row_id = row_id
+
+        out = io.StringIO()
+        self.assertEqual(json_serialize_iter([], out), 0)
+        self.assertEqual(out.getvalue(), "[]")
+        restored = json_deserialize_iter(Row, io.StringIO(out.getvalue()))
+        self.assertEqual(list(restored), [])
+        with self.assertRaises(ValueError):
+            list(json_deserialize_iter(Row, io.StringIO('[{"row_id": 1}')))
+        with self.assertRaises(ValueError):
+            list(json_deserialize_iter(Row, io.StringIO('{"row_id": 1}')))
+        with self.assertRaises(TypeError):
+            list(json_deserialize_iter(Row, io.StringIO("[1]")))
+        with self.assertRaises(TypeError):
+            json_serialize_iter([1], io.StringIO())
+
+    def test_binary_round_trip(self) -> None:
+        class Level(Enum):
+            LOW = 1
+
+        @json_serializable()
+        class Child:
+            def __init__(self, label: str, level: Level) -> None:
+                self.label = label
+                self.level = level
+
+        @json_serializable(translate_snake_to_camel=True)
+        class Parent:
+            def __init__(
+                self,
+                parent_id: int,
+                ratio: float,
+                children: list[Child],
+                extra: dict[int, Optional[str]],
+                created: datetime,
+                active: bool = True,
+            ) -> None:
+                self.parent_id = parent_id
+                self.ratio = ratio
+                self.children = children
+                self.extra = extra
+                self.created = created
+                self.active = active
+
+        parent = Parent(
+            -(2**70),
+            -0.25,
+            [Child("é" * 200, Level.LOW), Child("b", Level.LOW)],
+            {1: None, -2: "two"},
+            datetime(2024, 5, 6, 7, 8, 9),
+        )
+        payload = binary_serialize(parent)
+        self.assertEqual(binary_deserialize(Parent, payload), parent)
+        # Reads from a memoryview over a larger buffer
+        buffer = bytearray(b"xx" + payload + b"yy")
+        view = memoryview(buffer)[2:-2]
+        self.assertEqual(binary_deserialize(Parent, view), parent)
+
+        parents = [parent] * 50
+        payload = binary_serialize_list(parents)
+        self.assertEqual(binary_deserialize_list(Parent, payload), parents)
+        # Field names are written once, not once per object
+        self.assertEqual(payload.count(b"parentId"), 1)
+        self.assertLess(
+            len(payload), len(json.dumps(json_serialize_list(parents)).encode()) / 2
+        )
+
+    def test_binary_invalid_payloads(self) -> None:
+        @json_serializable()
+        class Simple:
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+        payload = binary_serialize(Simple(1))
+        with self.assertRaises(ValueError):
+            binary_deserialize(Simple, payload[:-1])
+        with self.assertRaises(ValueError):
+            binary_deserialize(Simple, payload + b"\x00")
+        with self.assertRaises(ValueError):
+            binary_deserialize(Simple, b"\x7f" + payload[1:])
+        with self.assertRaises(TypeError):
+            binary_deserialize_list(Simple, payload)
+
+    def test_forward_reference_in_init(self) -> None:
+        node = TreeNode("leaf", TreeNode("root"))
+        restored = TreeNode.from_dict(node.to_dict())
+        self.assertIsInstance(restored.parent, TreeNode)
+        self.assertEqual(restored, node)
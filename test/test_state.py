@@ -1,5 +1,15 @@
+from threading import Event, Thread
+from time import sleep
 from baseTest import BaseTestCase
-from jstreams.state import default_state, null_state, use_state
+from jstreams.state import (
+    compare_and_set_state,
+    default_state,
+    null_state,
+    update_state,
+    use_computed,
+    use_async_state,
+    use_state,
+)
 from jstreams.utils import Value
 
 
@@ -55,3 +65,132 @@ class TestState(BaseTestCase):
         self.assertIsNone(getValue(), "State value should be None")
         setValue("Test")
         self.assertEqual(getValue(), "Test", "State value should be Test")
+
+    def test_use_async_state_notifies(self) -> None:
+        received = Value(None)
+        called = Event()
+
+        def on_change(value: str, old_value: str) -> None:
+            received.set((value, old_value))
+            called.set()
+
+        (_, setValue) = use_async_state("test_async1", "A", on_change)
+        setValue("B")
+        self.assertTrue(called.wait(5), "Async callback should have been called")
+        self.assertEqual(received.get(), ("B", "A"))
+
+    def test_use_async_state_coalesces(self) -> None:
+        calls: list[tuple[int, int]] = []
+        release = Event()
+        first = Event()
+
+        def on_change(value: int, old_value: int) -> None:
+            calls.append((value, old_value))
+            first.set()
+            release.wait(5)
+
+        (_, setValue) = use_async_state("test_async2", 0, on_change)
+        setValue(1)
+        self.assertTrue(first.wait(5))
+        # While the first notification is in progress, rapid sets are coalesced
+        for i in range(2, 100):
+            setValue(i)
+        release.set()
+        sleep(0.5)
+        self.assertEqual(calls, [(1, 0), (99, 1)])
+
+    def test_compare_and_set_state(self) -> None:
+        (getValue, _) = use_state("test_cas", 1)
+        self.assertTrue(compare_and_set_state("test_cas", 1, 2))
+        self.assertFalse(compare_and_set_state("test_cas", 1, 3))
+        self.assertEqual(getValue(), 2)
+
+    def test_update_state_concurrent(self) -> None:
+        (getValue, _) = use_state("test_update", 0)
+
+        def increment() -> None:
+            for _ in range(1000):
+                update_state("test_update", lambda v: v + 1)
+
+        threads = [Thread(target=increment) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(getValue(), 8000)
+
+    def test_update_state_missing_key(self) -> None:
+        self.assertThrowsExceptionOfType(
+            lambda: update_state("test_missing_state", lambda v: v), ValueError
+        )
+
+    def test_use_computed_lazy(self) -> None:
+        calls = Value(0)
+        (_, set_a) = use_state("computed_a", 1)
+        (_, set_b) = use_state("computed_b", 2)
+
+        def total(a: int, b: int) -> int:
+            calls.set(calls.get() + 1)
+            return a + b
+
+        get_total = use_computed("computed_total", total, ["computed_a", "computed_b"])
+        self.assertEqual(calls.get(), 0, "Computed state should be lazy")
+        self.assertEqual(get_total(), 3)
+        self.assertEqual(get_total(), 3)
+        self.assertEqual(calls.get(), 1, "Computed value should be memoized")
+        set_a(10)
+        set_b(20)
+        self.assertEqual(calls.get(), 1, "Computed value should be recomputed on read")
+        self.assertEqual(get_total(), 30)
+        self.assertEqual(calls.get(), 2)
+
+    def test_use_computed_chain_glitch_free(self) -> None:
+        (_, set_x) = use_state("glitch_x", 1)
+        use_computed("glitch_double", lambda x: x * 2, ["glitch_x"])
+        use_computed("glitch_triple", lambda x: x * 3, ["glitch_x"])
+        observed: list[tuple[int, int]] = []
+        get_sum = use_computed(
+            "glitch_sum",
+            lambda d, t: d + t,
+            ["glitch_double", "glitch_triple"],
+            lambda new, old: observed.append((new, old)),
+        )
+        self.assertEqual(get_sum(), 5)
+        set_x(2)
+        self.assertEqual(observed, [(10, 5)])
+        self.assertEqual(get_sum(), 10)
+
+    def test_use_computed_notifies_first_change(self) -> None:
+        (_, set_count) = use_state("first_change_count", 1)
+        observed: list[tuple[int, int]] = []
+        get_double = use_computed(
+            "first_change_double",
+            lambda count: count * 2,
+            ["first_change_count"],
+            lambda new, old: observed.append((new, old)),
+        )
+        # The value was never read before the upstream state changed
+        set_count(2)
+        self.assertEqual(observed, [(4, 2)])
+        self.assertEqual(get_double(), 4)
+
+    def test_use_computed_skips_unchanged_downstream(self) -> None:
+        calls = Value(0)
+        (_, set_n) = use_state("parity_n", 1)
+        use_computed("parity", lambda n: n % 2, ["parity_n"])
+
+        def label(parity: int) -> str:
+            calls.set(calls.get() + 1)
+            return "odd" if parity else "even"
+
+        get_label = use_computed("parity_label", label, ["parity"])
+        self.assertEqual(get_label(), "odd")
+        set_n(3)
+        self.assertEqual(get_label(), "odd")
+        self.assertEqual(calls.get(), 1, "Unchanged upstream should not recompute")
+
+    def test_use_computed_missing_dependency(self) -> None:
+        self.assertThrowsExceptionOfType(
+            lambda: use_computed("computed_missing", lambda v: v, ["no_such_state"]),
+            ValueError,
+        )
@@ -1,11 +1,41 @@
 from typing import Optional, Any, List
 
-from jstreams.annotations import default_on_error, validate_args
+from jstreams.annotations import (
+    default_on_error,
+    is_args_validation_enabled,
+    set_args_validation,
+    validate_args,
+)
 from baseTest import BaseTestCase
 from jstreams.predicate import is_higher_than
 
 
 # --- Test Functions ---
+
+
+@validate_args(deep="full")
+def deep_full(items: list[int], mapping: dict[str, list[int]] | None = None) -> int:
+    return len(items)
+
+
+@validate_args(deep="sample")
+def deep_sample(items: list[int], pair: tuple[str, int] = ("a", 1)) -> int:
+    return len(items)
+
+
+@validate_args()
+def keyword_only(name: str, *, count: int = 1, label: Any = None) -> str:
+    return name * count
+
+
+@validate_args()
+def invalid_default(value: int = "x") -> int:  # type: ignore[assignment]
+    return value
+
+
+@validate_args()
+def var_args(*values: int, **named: str) -> int:
+    return len(values) + len(named)
 # Define these globally or within the class if preferred, but global is simpler here.
 
 
@@ -34,6 +64,16 @@ def any_type(value: Any) -> str:
     return f"Any value: {value}"
 
 
+@validate_args()
+def optional_any(value: Optional[Any], other: int | Any = 0) -> str:
+    return f"Optional any value: {value}"
+
+
+@validate_args(deep="full")
+def optional_any_deep(value: list[int] | Any) -> str:
+    return f"Optional any value: {value}"
+
+
 @validate_args()
 def no_hint(value) -> str:
     return f"No hint value: {value}"
@@ -131,6 +171,13 @@ class TestValidateArgs(BaseTestCase):
         self.assertEqual(any_type(None), "Any value: None")
         self.assertEqual(any_type([1, 2]), "Any value: [1, 2]")
 
+    def test_optional_any_valid(self):
+        self.assertEqual(optional_any(123), "Optional any value: 123")
+        self.assertEqual(optional_any("string"), "Optional any value: string")
+        self.assertEqual(optional_any(None), "Optional any value: None")
+        self.assertEqual(optional_any([1], "text"), "Optional any value: [1]")
+        self.assertEqual(optional_any_deep(["a"]), "Optional any value: ['a']")
+
     def test_no_hint_valid(self):
         self.assertEqual(no_hint(123), "No hint value: 123")
         self.assertEqual(no_hint("string"), "No hint value: string")
@@ -188,3 +235,53 @@ class TestValidateArgs(BaseTestCase):
         self.assertEqual(t.divide(1.0, 1.0), 1)
         self.assertRaises(TypeError, lambda: t.divide(1.0, 0.0))
         self.assertEqual(t.divide_with_default(1.0, 0.0), -1)
+
+    def test_deep_full_checks_elements(self) -> None:
+        self.assertEqual(deep_full([1, 2, 3], {"a": [1]}), 3)
+        with self.assertRaisesRegex(TypeError, "Argument 'items'.*list\\[int\\]"):
+            deep_full([1, "2"])  # type: ignore
+        with self.assertRaisesRegex(TypeError, "Argument 'mapping'"):
+            deep_full([1], {"a": [1, "b"]})  # type: ignore
+
+    def test_deep_sample_checks_first_elements(self) -> None:
+        with self.assertRaisesRegex(TypeError, "Argument 'items'"):
+            deep_sample(["a"] + [1] * 20)  # type: ignore
+        # Elements after the sample are not checked
+        self.assertEqual(deep_sample([1] * 20 + ["a"]), 21)  # type: ignore
+        with self.assertRaisesRegex(TypeError, "Argument 'pair'"):
+            deep_sample([], pair=("a", "b"))  # type: ignore
+
+    def test_unsupported_deep_mode(self) -> None:
+        self.assertRaises(ValueError, lambda: validate_args(deep="all"))
+
+    def test_keyword_only(self) -> None:
+        self.assertEqual(keyword_only("a", count=2), "aa")
+        self.assertEqual(keyword_only(name="a", label=1), "a")
+        with self.assertRaisesRegex(TypeError, "Argument 'count'"):
+            keyword_only("a", count="2")  # type: ignore
+        with self.assertRaisesRegex(TypeError, "Error binding arguments"):
+            keyword_only("a", 2)  # type: ignore
+        with self.assertRaisesRegex(TypeError, "Error binding arguments"):
+            keyword_only("a", name="b")  # type: ignore
+        with self.assertRaisesRegex(TypeError, "Error binding arguments"):
+            keyword_only("a", other=1)  # type: ignore
+
+    def test_invalid_default_is_checked(self) -> None:
+        self.assertEqual(invalid_default(1), 1)
+        with self.assertRaisesRegex(TypeError, "Argument 'value'"):
+            invalid_default()
+
+    def test_var_args(self) -> None:
+        self.assertEqual(var_args(1, 2, a="b"), 3)
+        with self.assertRaisesRegex(TypeError, "Argument 'values'"):
+            var_args(1, "2")  # type: ignore
+
+    def test_disabled_validation(self) -> None:
+        set_args_validation(False)
+        try:
+            self.assertFalse(is_args_validation_enabled())
+            self.assertEqual(basic_types(1, "a"), "1 is a")  # type: ignore
+        finally:
+            set_args_validation(True)
+        self.assertTrue(is_args_validation_enabled())
+        self.assertRaises(TypeError, lambda: basic_types(1, "a"))